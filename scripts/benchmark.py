@@ -0,0 +1,324 @@
+"""Benchmark the query engine paths behind the dashboard pages.
+
+Generates datasets of increasing size with ``scripts.refresh_data`` (reused across
+runs), loads each in eager and lazy mode and times, in a fresh process per size,
+the engine queries the pages issue: the overview aggregates, top performers, row
+count, details statistics and a table page, for every engine and filter
+combination, with a cold query cache. The results, including peak RSS, go to a
+JSON file named after the current commit. Pass ``--baseline`` with an earlier
+results file to print the slowdown per step.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import combinations
+from multiprocessing import get_context
+from pathlib import Path
+
+import polars as pl
+
+ROOT = Path(__file__).parent.parent
+DEFAULT_DATA_DIR = ROOT / "data" / "benchmark"
+DEFAULT_RESULTS_DIR = ROOT / "benchmarks"
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000, "100m": 100_000_000}
+
+
+def parse_size(value: str) -> int:
+    """Parse a row count such as ``10k``, ``1m`` or ``2500``."""
+    value = value.lower()
+    if value in SIZES:
+        return SIZES[value]
+
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    if value[-1] in multipliers:
+        return int(float(value[:-1]) * multipliers[value[-1]])
+
+    return int(value)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def git_revision() -> str | None:
+    """Short hash of the checked-out commit, with a suffix for local changes."""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return f"{revision}-dirty" if dirty else revision
+
+
+def ensure_dataset(n_rows: int, data_dir: Path, workers: int) -> Path:
+    """Generate a benchmark dataset with the refresh script unless it already exists.
+
+    Args:
+        n_rows: Number of rows.
+        data_dir: Directory holding benchmark datasets.
+        workers: Worker processes used by the generator.
+
+    Returns:
+        Path of the Parquet file.
+    """
+    path = data_dir / f"sales_{n_rows}.parquet"
+
+    if path.exists():
+        return path
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Generating {n_rows:,} rows -> {path}", flush=True)
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "scripts.refresh_data",
+            "--rows",
+            str(n_rows),
+            "--output",
+            str(path),
+            "--workers",
+            str(workers),
+        ],
+        cwd=ROOT,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return path
+
+
+def filter_combinations(dataset) -> dict[str, dict]:
+    """Every combination of the sidebar filters, with mid-range values.
+
+    Args:
+        dataset: Benchmark dataset.
+
+    Returns:
+        Mapping of a combination label to its filter dict.
+    """
+    date_min, date_max = dataset.index.bounds("date")
+    candidates = {
+        "date": {
+            "start_date": date_min + (date_max - date_min) / 4,
+            "end_date": date_max - (date_max - date_min) / 4,
+        },
+        "category": {"category": dataset.index.unique_values("category")[0]},
+        "region": {"region": dataset.index.unique_values("region")[0]},
+    }
+
+    combos = {"none": {}}
+    for n in range(1, len(candidates) + 1):
+        for names in combinations(candidates, n):
+            combos["+".join(names)] = {k: v for name in names for k, v in candidates[name].items()}
+
+    return combos
+
+
+def time_step(
+    func: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None
+) -> dict:
+    """Time a callable after one untimed warm-up run.
+
+    Args:
+        func: Step to run.
+        repeat: Number of timed runs.
+        setup: Untimed callable run before every run, e.g. to empty a cache.
+
+    Returns:
+        Dictionary with min/median seconds and the process peak RSS afterwards.
+    """
+    if setup is not None:
+        setup()
+    func()
+
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def run_size(path: str, repeat: int, engines: list[str]) -> dict:
+    """Benchmark every engine path on one dataset.
+
+    Runs in a fresh process so peak RSS is attributable to this size only.
+
+    Args:
+        path: Parquet file to benchmark.
+        repeat: Number of timed runs per step.
+        engines: Names of the query engines to benchmark.
+
+    Returns:
+        Mapping of step name to its timings.
+    """
+    # Clearing the query cache also empties its disk tier; keep the app's out
+    # of it, and every timed query cold.
+    os.environ["QUERY_DISK_CACHE_DIR"] = ""
+
+    from src.data.cache import get_query_cache
+    from src.data.dataset import _load_dataset
+    from src.data.engine import get_engine
+    from src.data.table import PAGE_SIZES
+    from src.data.views import detail_columns, detail_stats, overview_aggregates, top_performers
+
+    cache = get_query_cache()
+    results = {}
+
+    datasets = {}
+    for mode, lazy in (("eager", False), ("lazy", True)):
+        results[f"load/{mode}"] = time_step(
+            lambda lazy=lazy: _load_dataset(Path(path), lazy), repeat
+        )
+        datasets[mode] = _load_dataset(Path(path), lazy)
+
+    combos = filter_combinations(datasets["eager"])
+    columns = detail_columns(datasets["eager"])
+    steps = {
+        "overview": overview_aggregates,
+        "top_performers": top_performers,
+        "count": lambda engine, dataset, filters: engine.count(dataset, filters),
+        "detail_stats": detail_stats,
+        "page": lambda engine, dataset, filters: engine.page(
+            dataset, filters, columns, 1, PAGE_SIZES[0], "value", True
+        ),
+    }
+
+    for name in engines:
+        engine = get_engine(name)
+        for mode, dataset in datasets.items():
+            for step, query in steps.items():
+                for label, filters in combos.items():
+                    results[f"{name}/{mode}/{step}/{label}"] = time_step(
+                        lambda query=query, dataset=dataset, filters=filters: query(
+                            engine, dataset, filters
+                        ),
+                        repeat,
+                        setup=cache.clear,
+                    )
+
+    # What the pages hand to Streamlit and Plotly.
+    engine = get_engine(engines[0])
+    overview = overview_aggregates(engine, datasets["eager"], {})
+    page = engine.page(datasets["eager"], {}, columns, 1, PAGE_SIZES[-1], "value", True)
+    results["to_pandas/daily"] = time_step(overview["daily"].to_pandas, repeat)
+    results["to_pandas/by_category"] = time_step(overview["by_category"].to_pandas, repeat)
+    results["to_pandas/page"] = time_step(page.to_pandas, repeat)
+
+    return results
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Print the median-time ratio of every step against a baseline run."""
+    for size, steps in results["sizes"].items():
+        base_steps = baseline.get("sizes", {}).get(size, {})
+        for step, timing in steps.items():
+            if step not in base_steps or not base_steps[step]["median_s"]:
+                continue
+            ratio = timing["median_s"] / base_steps[step]["median_s"]
+            flag = "  <-- regression" if ratio > 1.2 else ""
+            print(f"{size:>12} {step:<55} {ratio:6.2f}x{flag}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=parse_size,
+        default=[SIZES["10k"], SIZES["1m"]],
+        help="Row counts to benchmark, e.g. 10k 1m 10m 100m",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per step")
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=["polars", "duckdb"],
+        default=["polars", "duckdb"],
+        help="Query engines to benchmark",
+    )
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Results file (default {DEFAULT_RESULTS_DIR.name}/<commit>.json)",
+    )
+    parser.add_argument("--baseline", type=Path, default=None, help="Results file to compare to")
+    parser.add_argument("--workers", type=int, default=4, help="Data generator processes")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmarks from command-line arguments."""
+    args = parse_args(argv)
+    revision = git_revision()
+
+    results = {
+        "revision": revision,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+
+    for n_rows in args.sizes:
+        path = ensure_dataset(n_rows, args.data_dir, args.workers)
+        print(f"Benchmarking {n_rows:,} rows", flush=True)
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            steps = pool.submit(run_size, str(path), args.repeat, args.engines).result()
+
+        results["sizes"][str(n_rows)] = steps
+        for step, timing in steps.items():
+            print(f"  {step:<55} {timing['median_s'] * 1000:10.2f} ms")
+
+    output = args.output or DEFAULT_RESULTS_DIR / f"{revision or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nResults -> {output}")
+
+    if args.baseline:
+        print(f"\nCompared to {args.baseline}:")
+        compare(results, json.loads(args.baseline.read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,71 +1,485 @@
-"""Generate sample data for the Streamlit app."""
+"""Generate sample data for the Streamlit app.
 
+Run from the repository root as ``python -m scripts.refresh_data``.
+"""
+
+import argparse
+import os
+import shutil
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import date, timedelta
 from pathlib import Path
-import random
 
+import numpy as np
 import polars as pl
+import pyarrow.parquet as pq
+
+from src.config import get_settings
+from src.data.dataset import refresh_dataset, resolve_lazy
+from src.data.dictionary import (
+    dimension_values,
+    extend_dictionary,
+    read_dictionary,
+    write_dictionary,
+)
+from src.data.engine import get_engine
+from src.data.loader import MONTH_PARTITION_COL, PARTITION_COLUMNS, scan_data, scan_files
+from src.data.manifest import Manifest, describe_file, read_manifest, write_manifest
+from src.data.rollup import build_rollup, merge_rollups, read_rollup, write_rollup
+from src.data.warmup import default_views, warm_up
+
+DEFAULT_OUTPUT = Path(__file__).parent.parent / "data" / "processed" / "sample_data.parquet"
+DEFAULT_PARTITIONED_OUTPUT = DEFAULT_OUTPUT.with_name("sales")
+
+COLUMNS = ["id", "date", "category", "name", "region", "value", "quantity"]
+
+BASE_VALUES = {
+    "Electronic": 500,
+    "Clothes": 100,
+    "House": 300,
+    "Sport": 150,
+    "Food": 50,
+    "Beauty": 80,
+}
+
+REGIONS = [
+    "Victoria",
+    "New South Wales",
+    "Tasmania",
+    "Western Australia",
+    "Queensland",
+    "South Australia",
+    "Northern Territory",
+    "Australian Capital Territory",
+]
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """Shape of the generated dataset.
+
+    Attributes:
+        seed: Base random seed; each chunk derives its own stream from it.
+        start_date: First date of the generated period.
+        n_days: Number of days covered.
+        n_categories: Number of distinct categories.
+        n_regions: Number of distinct regions.
+        n_products: Number of products per category.
+    """
+
+    seed: int = 42
+    start_date: date = date(2026, 2, 14)
+    n_days: int = 91
+    n_categories: int = len(BASE_VALUES)
+    n_regions: int = len(REGIONS)
+    n_products: int = 100
+
+    @property
+    def categories(self) -> tuple[str, ...]:
+        """Category labels, extended beyond the defaults when needed."""
+        names = list(BASE_VALUES)
+        return tuple(
+            names[i] if i < len(names) else f"Category {i + 1}" for i in range(self.n_categories)
+        )
+
+    @property
+    def base_values(self) -> np.ndarray:
+        """Base price per category, cycling through the defaults."""
+        values = list(BASE_VALUES.values())
+        return np.array([values[i % len(values)] for i in range(self.n_categories)], dtype=float)
+
+    @property
+    def regions(self) -> tuple[str, ...]:
+        """Region labels, extended beyond the defaults when needed."""
+        return tuple(
+            REGIONS[i] if i < len(REGIONS) else f"Region {i + 1}" for i in range(self.n_regions)
+        )
+
+
+def generate_chunk(
+    config: GeneratorConfig,
+    chunk_index: int,
+    start_row: int,
+    n_rows: int,
+    total_rows: int,
+    id_offset: int = 0,
+) -> pl.DataFrame:
+    """Generate one chunk of sales rows with vectorized NumPy draws.
+
+    The chunk's random stream depends only on ``(config.seed, chunk_index)``,
+    so output is identical whatever the worker count. Each chunk covers its
+    proportional slice of the date span, so concatenated chunks are sorted
+    by date.
+
+    Args:
+        config: Dataset shape.
+        chunk_index: Position of the chunk in the output.
+        start_row: Global index of the chunk's first row.
+        n_rows: Number of rows in the chunk.
+        total_rows: Number of rows in the whole dataset.
+        id_offset: Number added to every generated id, to continue an
+            existing dataset.
+
+    Returns:
+        Polars DataFrame with the chunk, sorted by date.
+    """
+    rng = np.random.default_rng([config.seed, chunk_index])
+
+    day_lo = start_row * config.n_days / total_rows
+    day_hi = (start_row + n_rows) * config.n_days / total_rows
+    days = np.sort(rng.uniform(day_lo, day_hi, n_rows)).astype(np.int64)
+    days = np.minimum(days, config.n_days - 1)
+
+    category_idx = rng.integers(0, config.n_categories, n_rows)
+    region_idx = rng.integers(0, config.n_regions, n_rows)
+    product = rng.integers(1, config.n_products + 1, n_rows)
+    base_value = config.base_values[category_idx]
+    value = np.round(base_value * rng.uniform(0.5, 3.0, n_rows), 2)
+    quantity = rng.integers(1, 11, n_rows)
+
+    return (
+        pl.DataFrame(
+            {
+                "id": np.arange(1, n_rows + 1, dtype=np.int64) + id_offset + start_row,
+                "date": np.datetime64(config.start_date, "D") + days,
+                "category": pl.Series(config.categories).gather(category_idx),
+                "product": product,
+                "region": pl.Series(config.regions).gather(region_idx),
+                "value": value,
+                "quantity": quantity.astype(np.int64),
+            }
+        )
+        .with_columns(pl.format("{} - Product {}", "category", "product").alias("name"))
+        .select(COLUMNS)
+    )
+
+
+def _chunk_bounds(n_records: int, chunk_size: int) -> list[tuple[int, int, int]]:
+    """Split a row count into ``(chunk_index, start_row, n_rows)`` triples."""
+    return [
+        (i, start, min(chunk_size, n_records - start))
+        for i, start in enumerate(range(0, n_records, chunk_size))
+    ]
+
+
+def iter_chunks(
+    n_records: int,
+    config: GeneratorConfig,
+    chunk_size: int = 1_000_000,
+    workers: int = 1,
+    id_offset: int = 0,
+) -> Iterator[pl.DataFrame]:
+    """Yield generated chunks in order.
+
+    With several workers, at most ``2 * workers`` chunks are in flight, so
+    memory stays bounded however fast the consumer is.
+
+    Args:
+        n_records: Total number of rows.
+        config: Dataset shape.
+        chunk_size: Rows per chunk.
+        workers: Number of worker processes; 1 generates in-process.
+        id_offset: Number added to every generated id.
+
+    Yields:
+        Chunks sorted by date, in output order.
+    """
+    bounds = _chunk_bounds(n_records, chunk_size)
+
+    if workers <= 1:
+        for index, start, n_rows in bounds:
+            yield generate_chunk(config, index, start, n_rows, n_records, id_offset)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future] = deque()
+        remaining = iter(bounds)
+
+        for index, start, n_rows in remaining:
+            pending.append(
+                pool.submit(generate_chunk, config, index, start, n_rows, n_records, id_offset)
+            )
+            if len(pending) >= 2 * workers:
+                break
+
+        while pending:
+            chunk = pending.popleft().result()
+            next_bounds = next(remaining, None)
+            if next_bounds is not None:
+                index, start, n_rows = next_bounds
+                pending.append(
+                    pool.submit(generate_chunk, config, index, start, n_rows, n_records, id_offset)
+                )
+            yield chunk
+
+
+def write_sample_data(
+    output_path: str | Path,
+    n_records: int,
+    config: GeneratorConfig | None = None,
+    chunk_size: int = 1_000_000,
+    row_group_size: int = 256 * 1024,
+    workers: int = 1,
+) -> Path:
+    """Stream generated chunks straight into a Parquet file.
+
+    Only the chunks in flight are held in memory, so row counts far beyond
+    RAM can be written. The file is written under a temporary name and
+    renamed into place, so readers never see a partial file.
+
+    Args:
+        output_path: Destination Parquet file.
+        n_records: Total number of rows.
+        config: Dataset shape; defaults to ``GeneratorConfig()``.
+        chunk_size: Rows generated per chunk.
+        row_group_size: Rows per Parquet row group.
+        workers: Number of worker processes.
+
+    Returns:
+        Path of the written file.
+    """
+    config = config or GeneratorConfig()
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    staging = output_path.with_name(f".{output_path.name}.staging")
+
+    writer = None
+    try:
+        for chunk in iter_chunks(n_records, config, chunk_size, workers):
+            table = chunk.to_arrow()
+            if writer is None:
+                writer = pq.ParquetWriter(staging, table.schema, compression="zstd")
+            writer.write_table(table, row_group_size=row_group_size)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    os.replace(staging, output_path)
+    return output_path
+
+
+def partition_path(root: Path, month: str, region: str) -> Path:
+    """Get the hive partition directory for a (month, region) pair."""
+    return root / f"{MONTH_PARTITION_COL}={month}" / f"region={region}"
+
+
+def _swap_directory(staging: Path, output_dir: Path) -> None:
+    """Replace ``output_dir`` with ``staging`` using two renames."""
+    retired = output_dir.with_name(f".{output_dir.name}.old")
+
+    if retired.exists():
+        shutil.rmtree(retired)
+    if output_dir.exists():
+        output_dir.rename(retired)
+
+    staging.rename(output_dir)
+
+    if retired.exists():
+        shutil.rmtree(retired)
+
+
+def _write_partitions(
+    chunks: Iterator[pl.DataFrame],
+    root: Path,
+    file_name: str,
+    row_group_size: int,
+) -> list[Path]:
+    """Write date-sorted chunks as one ``file_name`` per (month, region) partition.
+
+    One writer stays open per partition; since chunks arrive sorted by date,
+    writers for months before the current chunk are closed as soon as the
+    chunk moves past them. Files are written under a hidden temporary name
+    and renamed once complete.
+
+    Returns:
+        Paths of the written files.
+    """
+    staging_name = f".{file_name}.tmp"
+    writers: dict[tuple[str, str], pq.ParquetWriter] = {}
+    directories: list[Path] = []
+
+    try:
+        for chunk in chunks:
+            chunk = chunk.with_columns(
+                pl.col("date").dt.strftime("%Y-%m").alias(MONTH_PARTITION_COL)
+            )
+            first_month = chunk[MONTH_PARTITION_COL][0]
+
+            for key in [k for k in writers if k[0] < first_month]:
+                writers.pop(key).close()
+
+            parts = chunk.partition_by(PARTITION_COLUMNS, as_dict=True, include_key=False)
+            for (month, region), part in parts.items():
+                table = part.to_arrow()
+                writer = writers.get((month, region))
+                if writer is None:
+                    directory = partition_path(root, month, region)
+                    directory.mkdir(parents=True, exist_ok=True)
+                    directories.append(directory)
+                    writer = pq.ParquetWriter(
+                        directory / staging_name, table.schema, compression="zstd"
+                    )
+                    writers[(month, region)] = writer
+                writer.write_table(table, row_group_size=row_group_size)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    files = []
+    for directory in directories:
+        (directory / staging_name).replace(directory / file_name)
+        files.append(directory / file_name)
+
+    return files
+
+
+def write_partitioned_data(
+    output_dir: str | Path,
+    n_records: int,
+    config: GeneratorConfig | None = None,
+    chunk_size: int = 1_000_000,
+    row_group_size: int = 256 * 1024,
+    workers: int = 1,
+) -> Path:
+    """Stream generated chunks into a ``month=YYYY-MM/region=...`` dataset.
+
+    The dataset and its manifest are built in a staging directory and
+    swapped in when complete.
+
+    Args:
+        output_dir: Destination dataset directory.
+        n_records: Total number of rows.
+        config: Dataset shape; defaults to ``GeneratorConfig()``.
+        chunk_size: Rows generated per chunk.
+        row_group_size: Rows per Parquet row group.
+        workers: Number of worker processes.
+
+    Returns:
+        Path of the dataset directory.
+    """
+    config = config or GeneratorConfig()
+    output_dir = Path(output_dir)
+    staging = output_dir.with_name(f".{output_dir.name}.staging")
+
+    if staging.exists():
+        shutil.rmtree(staging)
+
+    chunks = iter_chunks(n_records, config, chunk_size, workers)
+    files = _write_partitions(chunks, staging, "part-00000.parquet", row_group_size)
+    manifest = Manifest(version=0, files=tuple(describe_file(staging, f) for f in sorted(files)))
+    write_manifest(staging, manifest)
+
+    _swap_directory(staging, output_dir)
+    return output_dir
+
+
+def append_partitioned_data(
+    output_dir: str | Path,
+    n_records: int,
+    n_days: int = 1,
+    config: GeneratorConfig | None = None,
+    chunk_size: int = 1_000_000,
+    row_group_size: int = 256 * 1024,
+    workers: int = 1,
+) -> Manifest:
+    """Append new days of data to a partitioned dataset without rewriting it.
+
+    New rows start the day after the manifest's max date and are written as
+    new ``part-<version>.parquet`` files. The rollup is updated by merging
+    the rollup of the new rows, and the manifest is replaced last, so readers
+    switch to the new version in one step.
+
+    Args:
+        output_dir: Existing dataset directory with a manifest.
+        n_records: Number of rows to append.
+        n_days: Number of new days covered by the appended rows.
+        config: Dataset shape; its seed is offset by the new version and its
+            date span replaced.
+        chunk_size: Rows generated per chunk.
+        row_group_size: Rows per Parquet row group.
+        workers: Number of worker processes.
+
+    Returns:
+        The new manifest.
+
+    Raises:
+        FileNotFoundError: If the dataset has no manifest to append to.
+    """
+    output_dir = Path(output_dir)
+    manifest = read_manifest(output_dir)
+
+    if manifest is None or manifest.max_date is None:
+        raise FileNotFoundError(
+            f"No manifest in {output_dir}; run a full --partitioned refresh first"
+        )
+
+    version = manifest.version + 1
+    config = config or GeneratorConfig()
+    config = replace(
+        config,
+        seed=config.seed + version,
+        start_date=manifest.max_date + timedelta(days=1),
+        n_days=n_days,
+    )
+
+    chunks = iter_chunks(n_records, config, chunk_size, workers, id_offset=manifest.total_rows)
+    new_files = _write_partitions(chunks, output_dir, f"part-{version:05d}.parquet", row_group_size)
+    entries = tuple(describe_file(output_dir, f) for f in sorted(new_files))
+    updated = Manifest(version=version, files=manifest.files + entries)
+
+    files = [output_dir / e.path for e in updated.files]
+    rollup = read_rollup(output_dir, expected_rows=manifest.total_rows)
+    if rollup is not None:
+        rollup = merge_rollups(rollup, build_rollup(scan_files(new_files)))
+    else:
+        rollup = build_rollup(scan_files(files))
+    # The manifest still lists the previous version until it is written below.
+    write_rollup(rollup, output_dir, files=files)
+    update_dictionary(scan_files(new_files), output_dir)
+
+    write_manifest(output_dir, updated)
+    return updated
+
+
+def update_dictionary(lf: pl.LazyFrame, output: Path) -> Path:
+    """Add the dimension labels of new rows to the dataset's dictionary.
+
+    Known labels keep their codes, so frames encoded by running apps stay
+    compatible with the next version.
+
+    Args:
+        lf: LazyFrame over the new rows.
+        output: Data file or dataset directory.
+
+    Returns:
+        Path of the dictionary file.
+    """
+    return write_dictionary(
+        extend_dictionary(read_dictionary(output), dimension_values(lf)), output
+    )
 
 
 def generate_sample_data(
     n_records: int = 5000,
     output_path: str | Path | None = None,
+    config: GeneratorConfig | None = None,
 ) -> pl.DataFrame:
-    """Generate realistic sample sales data.
+    """Generate realistic sample sales data in memory.
 
     Args:
         n_records: Number of records to generate.
-        output_path: Optional path to save the Parquet file.
+        output_path: Optional path to save the Parquet file. The rollup cube
+            is written next to it.
+        config: Dataset shape; defaults to ``GeneratorConfig()``.
 
     Returns:
         Polars DataFrame with sample data.
     """
-    random.seed(42)
-
-    categories = ["Electronic", "Clothes", "House", "Sport", "Food", "Beauty"]
-    regions = [
-        "Victoria",
-        "New South Wales",
-        "Tasmania",
-        "Western Australia",
-        "Queensland",
-        "South Australia",
-        "Northern Territory",
-        "Australian Capital Territory",
-    ]
-
-    base_date = date(2026, 2, 14)
-
-    records = []
-    for i in range(n_records):
-        category = random.choice(categories)
-        region = random.choice(regions)
-
-        base_value = {
-            "Electronic": 500,
-            "Clothes": 100,
-            "House": 300,
-            "Sport": 150,
-            "Food": 50,
-            "Beauty": 80,
-        }[category]
-
-        value = base_value * random.uniform(0.5, 3.0)
-        days_offset = random.randint(0, 90)
-        record_date = base_date + timedelta(days=days_offset)
-
-        records.append({
-            "id": i + 1,
-            "date": record_date,
-            "category": category,
-            "name": f"{category} - Product {random.randint(1, 100)}",
-            "region": region,
-            "value": round(value, 2),
-            "quantity": random.randint(1, 10),
-        })
-
-    df = pl.DataFrame(records)
-    df = df.sort("date")
+    config = config or GeneratorConfig()
+    df = pl.concat(iter_chunks(n_records, config))
 
     if output_path:
         output_path = Path(output_path)
@@ -73,17 +487,148 @@ def generate_sample_data(
         df.write_parquet(output_path)
         print(f"Generated {n_records} records -> {output_path}")
 
+        rollup_file = write_rollup(build_rollup(df), output_path)
+        print(f"Built rollup cube -> {rollup_file}")
+
     return df
 
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    defaults = GeneratorConfig()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Defaults to {DEFAULT_OUTPUT.name}, or {DEFAULT_PARTITIONED_OUTPUT.name}/ "
+        "with --partitioned",
+    )
+    parser.add_argument(
+        "--partitioned",
+        action="store_true",
+        help="Write a hive-partitioned month=YYYY-MM/region=... dataset directory",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Append new days to an existing partitioned dataset instead of regenerating it",
+    )
+    parser.add_argument("--rows", type=int, default=5000, help="Number of rows")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--start-date", type=date.fromisoformat, default=defaults.start_date, help="YYYY-MM-DD"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=None,
+        help=f"Date span in days (default {defaults.n_days}, or 1 with --incremental)",
+    )
+    parser.add_argument("--categories", type=int, default=defaults.n_categories)
+    parser.add_argument("--regions", type=int, default=defaults.n_regions)
+    parser.add_argument("--products", type=int, default=defaults.n_products)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000, help="Rows per chunk")
+    parser.add_argument("--row-group-size", type=int, default=256 * 1024)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="Precompute the default and most used views into the query disk cache",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Generate the dataset and its rollup from command-line arguments."""
+    args = parse_args(argv)
+    config = GeneratorConfig(
+        seed=args.seed,
+        start_date=args.start_date,
+        n_days=args.days or GeneratorConfig.n_days,
+        n_categories=args.categories,
+        n_regions=args.regions,
+        n_products=args.products,
+    )
+
+    if args.incremental:
+        output = args.output or DEFAULT_PARTITIONED_OUTPUT
+        manifest = append_partitioned_data(
+            output,
+            args.rows,
+            n_days=args.days or 1,
+            config=config,
+            chunk_size=args.chunk_size,
+            row_group_size=args.row_group_size,
+            workers=args.workers,
+        )
+        print(f"Appended {args.rows} records as version {manifest.version} -> {output}")
+        lf = scan_data(output)
+    else:
+        if args.partitioned:
+            writer = write_partitioned_data
+            output = args.output or DEFAULT_PARTITIONED_OUTPUT
+        else:
+            writer = write_sample_data
+            output = args.output or DEFAULT_OUTPUT
+
+        output = writer(
+            output,
+            args.rows,
+            config,
+            chunk_size=args.chunk_size,
+            row_group_size=args.row_group_size,
+            workers=args.workers,
+        )
+        print(f"Generated {args.rows} records -> {output}")
+
+        lf = scan_data(output)
+        rollup_file = write_rollup(build_rollup(lf), output)
+        print(f"Built rollup cube -> {rollup_file}")
+        print(f"Updated label dictionary -> {update_dictionary(lf, output)}")
+
+    stats = lf.select(
+        pl.len().alias("records"),
+        pl.col("date").min().alias("date_min"),
+        pl.col("date").max().alias("date_max"),
+        pl.col("value").sum().alias("total"),
+    ).collect()
+
+    print("\nSample data summary:")
+    print(f"  Records: {stats['records'].item()}")
+    print(f"  Columns: {lf.collect_schema().names()}")
+    print(f"  Date range: {stats['date_min'].item()} to {stats['date_max'].item()}")
+    print(f"  Total value: {stats['total'].item():,.0f} €")
+    print(f"  Categories: {list(config.categories)}")
+    print(f"  Regions: {list(config.regions)}")
+
+    if args.warm_up:
+        warm_up_cache(output)
+
+
+def warm_up_cache(output: Path) -> None:
+    """Precompute the views to warm for a dataset into the query cache.
+
+    Only the disk tier outlives this process; the app's workers then load
+    these results from disk instead of querying the data.
+
+    Args:
+        output: Data file or dataset directory.
+    """
+    settings = get_settings()
+    if not settings.query_disk_cache_dir:
+        print("\nQUERY_DISK_CACHE_DIR is disabled; skipping the warm-up")
+        return
+
+    lazy = resolve_lazy(output, settings.lazy_loading, settings.eager_max_mb)
+    dataset = refresh_dataset(output, lazy=lazy)
+    views = default_views()
+    report = warm_up(get_engine(), dataset, views)
+    print(
+        f"\nWarmed up {report.views}/{len(views)} views -> {report.entries} cache entries"
+        f" in {report.seconds:.2f}s ({settings.query_disk_cache_dir})"
+    )
+
+
 if __name__ == "__main__":
-    output = Path(__file__).parent.parent / "data" / "processed" / "sample_data.parquet"
-    df = generate_sample_data(output_path=output)
-
-    print(f"\nSample data summary:")
-    print(f"  Records: {len(df)}")
-    print(f"  Columns: {df.columns}")
-    print(f"  Date range: {df['date'].min()} to {df['date'].max()}")
-    print(f"  Total value: {df['value'].sum():,.0f} €")
-    print(f"  Categories: {df['category'].unique().to_list()}")
-    print(f"  Regions: {df['region'].unique().to_list()}")
+    main()
@@ -3,7 +3,8 @@
 import streamlit as st
 
 from src.config import get_settings
-from src.data.loader import load_data
+from src.data.dataset import get_dataset, resolve_lazy, watch_dataset
+from src.data.warmup import start_warmup
 from src.styles.custom import inject_custom_css
 
 settings = get_settings()
@@ -18,8 +19,17 @@ st.set_page_config(
 inject_custom_css()
 
 try:
-    df = load_data(settings.data_file)
-    st.session_state["df"] = df
+    lazy = resolve_lazy(settings.data_file, settings.lazy_loading, settings.eager_max_mb)
+
+    if settings.data_poll_interval > 0:
+        watch_dataset(settings.data_file, lazy, settings.data_poll_interval)
+
+    # Only a reference to the process-wide handle is kept per session; the
+    # rerun finishes on this version even if a newer one is swapped in.
+    st.session_state["dataset"] = get_dataset(settings.data_file, lazy=lazy)
+
+    if settings.warmup_on_start:
+        start_warmup(settings.data_file, lazy, settings.data_poll_interval)
 except FileNotFoundError:
     st.error("Fichier de données non trouvé. Exécutez `make refresh-data`.")
     st.stop()
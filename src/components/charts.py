@@ -0,0 +1,159 @@
+"""Chart and table rendering straight from Polars data, without pandas."""
+
+import logging
+from dataclasses import dataclass, field
+
+import numpy as np
+import plotly.graph_objects as go
+import polars as pl
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+_LAYOUT = dict(template="plotly_white", margin=dict(l=0, r=0, t=0, b=0))
+
+
+@dataclass
+class RenderStats:
+    """Bytes copied out of Polars buffers per rendered element in one run."""
+
+    bytes_copied: dict[str, int] = field(default_factory=dict)
+
+    def record(self, element: str, nbytes: int) -> None:
+        """Add copied bytes for an element."""
+        self.bytes_copied[element] = self.bytes_copied.get(element, 0) + nbytes
+        logger.debug(f"Render of {element} copied {nbytes} bytes")
+
+    @property
+    def total(self) -> int:
+        """Bytes copied by all elements."""
+        return sum(self.bytes_copied.values())
+
+
+def start_render_stats() -> RenderStats:
+    """Reset the render stats of the session at the start of a page run.
+
+    Returns:
+        Empty stats that the render functions of this run add to.
+    """
+    stats = RenderStats()
+    st.session_state["render_stats"] = stats
+    return stats
+
+
+def column_array(
+    df: pl.DataFrame, column: str, stats: RenderStats | None = None, element: str = ""
+) -> np.ndarray:
+    """Get a column as a NumPy array, zero-copy whenever the buffer allows it.
+
+    Args:
+        df: Source DataFrame.
+        column: Column name.
+        stats: Optional stats to record a copy in.
+        element: Element name the copy is recorded under.
+
+    Returns:
+        NumPy array with the column values.
+    """
+    series = df.get_column(column)
+
+    try:
+        return series.to_numpy(allow_copy=False)
+    except RuntimeError:
+        array = series.to_numpy()
+        if stats is not None:
+            stats.record(element or column, array.nbytes)
+        return array
+
+
+def line_figure(
+    df: pl.DataFrame,
+    x: str,
+    y: str,
+    color: str = "#2563EB",
+    stats: RenderStats | None = None,
+) -> go.Figure:
+    """Build a line chart with markers from two columns.
+
+    Args:
+        df: Data to plot.
+        x: Column for the x axis.
+        y: Column for the y axis.
+        color: Line color.
+        stats: Optional stats to record copies in.
+
+    Returns:
+        Plotly figure.
+    """
+    fig = go.Figure(
+        go.Scatter(
+            x=column_array(df, x, stats, "line"),
+            y=column_array(df, y, stats, "line"),
+            mode="lines+markers",
+            line=dict(color=color, width=2),
+        )
+    )
+    fig.update_layout(**_LAYOUT, showlegend=False)
+    return fig
+
+
+def pie_figure(
+    df: pl.DataFrame,
+    values: str,
+    names: str,
+    colors: list[str] | None = None,
+    stats: RenderStats | None = None,
+) -> go.Figure:
+    """Build a pie chart from a value and a label column.
+
+    Args:
+        df: Data to plot.
+        values: Column with slice sizes.
+        names: Column with slice labels.
+        colors: Optional slice colors.
+        stats: Optional stats to record copies in.
+
+    Returns:
+        Plotly figure.
+    """
+    fig = go.Figure(
+        go.Pie(
+            values=column_array(df, values, stats, "pie"),
+            labels=column_array(df, names, stats, "pie"),
+            marker=dict(colors=colors),
+        )
+    )
+    fig.update_layout(**_LAYOUT)
+    return fig
+
+
+def render_chart(fig: go.Figure) -> None:
+    """Render a Plotly figure at full width."""
+    st.plotly_chart(fig, width="stretch")
+
+
+def render_dataframe(
+    df: pl.DataFrame,
+    stats: RenderStats | None = None,
+    element: str = "table",
+    **kwargs,
+) -> None:
+    """Render a Polars DataFrame with ``st.dataframe``, without pandas.
+
+    The frame is handed over as a pyarrow Table, which Streamlit serializes
+    directly instead of converting it to pandas first; the serialized bytes
+    are recorded in ``stats``.
+
+    Args:
+        df: DataFrame to show.
+        stats: Optional stats to record the serialized bytes in.
+        element: Element name the bytes are recorded under.
+        **kwargs: Passed on to ``st.dataframe``.
+    """
+    if stats is not None:
+        stats.record(element, df.estimated_size())
+
+    kwargs.setdefault("width", "stretch")
+    kwargs.setdefault("hide_index", True)
+    # The oldest compat level avoids string views, which the browser can't decode.
+    st.dataframe(df.to_arrow(compat_level=pl.CompatLevel.oldest()), **kwargs)
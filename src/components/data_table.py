@@ -0,0 +1,103 @@
+"""Paginated data table component."""
+
+import math
+from typing import TYPE_CHECKING, Any
+
+import streamlit as st
+
+from src.components.charts import RenderStats, render_dataframe
+from src.data.table import PAGE_SIZES
+
+if TYPE_CHECKING:
+    from src.data.dataset import Dataset
+    from src.data.engine import QueryEngine
+
+
+def _reset_page(key: str) -> None:
+    """Go back to the first page when the search or sort order changes."""
+    st.session_state[f"{key}_page"] = 1
+
+
+def render_data_table(
+    engine: "QueryEngine",
+    dataset: "Dataset",
+    filters: dict[str, Any],
+    columns: list[str],
+    total_rows: int | None = None,
+    column_labels: dict[str, str] | None = None,
+    column_config: dict | None = None,
+    key: str = "data_table",
+    stats: RenderStats | None = None,
+) -> None:
+    """Render a server-side paginated table.
+
+    Only the visible page is computed, by the engine and through the query
+    cache, and sent to the browser, so the cost does not grow with the
+    number of matching rows.
+
+    Args:
+        engine: Query engine.
+        dataset: Dataset to show.
+        filters: Filter dict as returned by ``render_filter_sidebar``.
+        columns: Columns to show.
+        total_rows: Number of matching rows if already known.
+        column_labels: Optional display names per column.
+        column_config: Optional ``st.dataframe`` column config, keyed by
+            display name.
+        key: Widget key prefix, unique per table on the page.
+        stats: Optional stats to record the bytes sent for the page in.
+    """
+    column_labels = column_labels or {}
+
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+
+    with col1:
+        search = st.text_input(
+            "Search",
+            key=f"{key}_search",
+            placeholder="Search text columns",
+            on_change=_reset_page,
+            args=(key,),
+        )
+    with col2:
+        sort_col = st.selectbox(
+            "Sort by",
+            options=[None, *columns],
+            format_func=lambda c: "—" if c is None else column_labels.get(c, c),
+            key=f"{key}_sort",
+            on_change=_reset_page,
+            args=(key,),
+        )
+    with col3:
+        descending = st.toggle(
+            "Descending", key=f"{key}_descending", on_change=_reset_page, args=(key,)
+        )
+    with col4:
+        page_size = st.selectbox(
+            "Rows", options=PAGE_SIZES, key=f"{key}_page_size", on_change=_reset_page, args=(key,)
+        )
+
+    if search or total_rows is None:
+        n_rows = engine.count_rows(dataset, filters, columns, search)
+    else:
+        n_rows = total_rows
+
+    n_pages = max(math.ceil(n_rows / page_size), 1)
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+
+    page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+
+    page_df = engine.page(dataset, filters, columns, page, page_size, sort_col, descending, search)
+
+    render_dataframe(
+        page_df.rename({c: column_labels[c] for c in page_df.columns if c in column_labels}),
+        stats=stats,
+        element=key,
+        column_config=column_config,
+    )
+
+    first = (page - 1) * page_size + 1 if n_rows else 0
+    last = min(page * page_size, n_rows)
+    st.caption(f"Rows {first:,}–{last:,} of {n_rows:,} · page {page} of {n_pages}")
@@ -5,31 +5,58 @@ from typing import Any
 import polars as pl
 import streamlit as st
 
+from src.data.index import DimensionIndex
+from src.data.loader import (
+    MONTH_PARTITION_COL,
+    get_column_bounds,
+    get_column_unique_values,
+    get_columns,
+)
+
+
+def _unique_values(
+    df: pl.DataFrame | pl.LazyFrame, column: str, index: DimensionIndex | None
+) -> list:
+    """Distinct values of a column, from the index when it holds them."""
+    if index is not None and index.unique_values(column):
+        return index.unique_values(column)
+    return get_column_unique_values(df, column)
+
+
+def _bounds(df: pl.DataFrame | pl.LazyFrame, column: str, index: DimensionIndex | None) -> tuple:
+    """Bounds of a column, from the index when it holds them."""
+    if index is not None and column in index.columns:
+        return index.bounds(column)
+    return get_column_bounds(df, column)
+
 
 def render_filter_sidebar(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     date_col: str = "date",
     category_col: str | None = "category",
     region_col: str | None = None,
+    index: DimensionIndex | None = None,
 ) -> dict[str, Any]:
     """Render standard filters in the sidebar.
 
     Args:
-        df: DataFrame to filter.
+        df: DataFrame or LazyFrame to filter.
         date_col: Name of date column.
         category_col: Optional category column for filtering.
         region_col: Optional region column for filtering.
+        index: Optional column index of ``df``; options and bounds are read
+            from it instead of scanning ``df``.
 
     Returns:
         Dictionary of filter values.
     """
     filters = {}
+    columns = get_columns(df)
 
     st.sidebar.markdown("### 🔍 Filters")
 
-    if date_col in df.columns:
-        date_min = df[date_col].min()
-        date_max = df[date_col].max()
+    if date_col in columns:
+        date_min, date_max = _bounds(df, date_col, index)
 
         if date_min and date_max:
             col1, col2 = st.sidebar.columns(2)
@@ -52,8 +79,8 @@ def render_filter_sidebar(
             filters["start_date"] = start_date
             filters["end_date"] = end_date
 
-    if category_col and category_col in df.columns:
-        categories = ["All"] + sorted(df[category_col].unique().to_list())
+    if category_col and category_col in columns:
+        categories = ["All"] + _unique_values(df, category_col, index)
         selected_category = st.sidebar.selectbox(
             "Category",
             options=categories,
@@ -62,8 +89,8 @@ def render_filter_sidebar(
         if selected_category != "All":
             filters["category"] = selected_category
 
-    if region_col and region_col in df.columns:
-        regions = ["All"] + sorted(df[region_col].unique().to_list())
+    if region_col and region_col in columns:
+        regions = ["All"] + _unique_values(df, region_col, index)
         selected_region = st.sidebar.selectbox(
             "Region",
             options=regions,
@@ -75,57 +102,112 @@ def render_filter_sidebar(
     return filters
 
 
+def _sorted_date_slice(
+    df: pl.DataFrame, date_col: str, filters: dict[str, Any]
+) -> pl.DataFrame | None:
+    """Resolve the date range with a binary search if the column is flagged sorted.
+
+    Returns:
+        Zero-copy slice of the rows in range, or None if the frame is not
+        known to be sorted on ``date_col``.
+    """
+    column = df.get_column(date_col)
+
+    if column.dtype != pl.Date or not column.flags["SORTED_ASC"] or column.null_count():
+        return None
+
+    start = (
+        column.search_sorted(filters["start_date"], side="left") if "start_date" in filters else 0
+    )
+    end = (
+        column.search_sorted(filters["end_date"], side="right")
+        if "end_date" in filters
+        else len(df)
+    )
+
+    return df.slice(start, max(end - start, 0))
+
+
 def apply_filters(
-    df: pl.DataFrame, filters: dict[str, Any], date_col: str = "date"
-) -> pl.DataFrame:
+    df: pl.DataFrame | pl.LazyFrame, filters: dict[str, Any], date_col: str = "date"
+) -> pl.DataFrame | pl.LazyFrame:
     """Apply filters to a DataFrame.
 
+    All active filters are combined into a single predicate. On a DataFrame
+    whose date column is flagged sorted (see ``mark_sorted``) the date range
+    is resolved by binary search to a zero-copy slice instead.
+
+    A LazyFrame input is returned as an uncollected plan, so the predicates
+    are pushed down into the Parquet scan when it is finally collected. On a
+    hive-partitioned dataset the date range is also expressed on the month
+    partition key, so non-matching partition directories are never opened.
+
     Args:
-        df: DataFrame to filter.
+        df: DataFrame or LazyFrame to filter.
         filters: Dictionary of filter values.
         date_col: Name of date column.
 
     Returns:
-        Filtered DataFrame.
+        Filtered DataFrame, or LazyFrame for a LazyFrame input.
     """
-    filtered_df = df
+    columns = get_columns(df)
+    predicates = []
+    has_date_range = date_col in columns and ("start_date" in filters or "end_date" in filters)
+
+    if has_date_range and isinstance(df, pl.DataFrame):
+        sliced = _sorted_date_slice(df, date_col, filters)
+        if sliced is not None:
+            df, has_date_range = sliced, False
+
+    if has_date_range and "start_date" in filters:
+        predicates.append(pl.col(date_col) >= filters["start_date"])
+
+        if MONTH_PARTITION_COL in columns:
+            start_month = filters["start_date"].strftime("%Y-%m")
+            predicates.append(pl.col(MONTH_PARTITION_COL) >= start_month)
+
+    if has_date_range and "end_date" in filters:
+        predicates.append(pl.col(date_col) <= filters["end_date"])
 
-    if "start_date" in filters and date_col in df.columns:
-        filtered_df = filtered_df.filter(pl.col(date_col) >= filters["start_date"])
+        if MONTH_PARTITION_COL in columns:
+            end_month = filters["end_date"].strftime("%Y-%m")
+            predicates.append(pl.col(MONTH_PARTITION_COL) <= end_month)
 
-    if "end_date" in filters and date_col in df.columns:
-        filtered_df = filtered_df.filter(pl.col(date_col) <= filters["end_date"])
+    if "category" in filters and "category" in columns:
+        predicates.append(pl.col("category") == filters["category"])
 
-    if "category" in filters and "category" in df.columns:
-        filtered_df = filtered_df.filter(pl.col("category") == filters["category"])
+    if "region" in filters and "region" in columns:
+        predicates.append(pl.col("region") == filters["region"])
 
-    if "region" in filters and "region" in df.columns:
-        filtered_df = filtered_df.filter(pl.col("region") == filters["region"])
+    if not predicates:
+        return df
 
-    return filtered_df
+    return df.filter(pl.all_horizontal(predicates))
 
 
 def render_multiselect_filter(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     column: str,
     label: str,
     default: list | None = None,
+    index: DimensionIndex | None = None,
 ) -> list:
     """Render a multiselect filter.
 
     Args:
-        df: DataFrame.
+        df: DataFrame or LazyFrame.
         column: Column name.
         label: Display label.
         default: Default selected values.
+        index: Optional column index of ``df`` to read the options from.
 
     Returns:
         List of selected values.
     """
-    if column not in df.columns:
+    if column not in get_columns(df):
         return []
 
-    options = sorted(df[column].unique().to_list())
+    options = _unique_values(df, column, index)
 
     if default is None:
         default = options
@@ -139,25 +221,28 @@ def render_multiselect_filter(
 
 
 def render_slider_filter(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     column: str,
     label: str,
+    index: DimensionIndex | None = None,
 ) -> tuple:
     """Render a range slider filter for numeric values.
 
     Args:
-        df: DataFrame.
+        df: DataFrame or LazyFrame.
         column: Column name.
         label: Display label.
+        index: Optional column index of ``df`` to read the bounds from.
 
     Returns:
         Tuple of (min, max) values.
     """
-    if column not in df.columns:
+    if column not in get_columns(df):
         return (None, None)
 
-    min_val = float(df[column].min())
-    max_val = float(df[column].max())
+    col_min, col_max = _bounds(df, column, index)
+    min_val = float(col_min)
+    max_val = float(col_max)
 
     return st.sidebar.slider(
         label,
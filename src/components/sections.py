@@ -0,0 +1,104 @@
+"""Page sections loaded in parallel and rendered as fragments."""
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass
+from typing import Any
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    SCRIPT_RUN_CONTEXT_ATTR_NAME,
+)
+
+from src.data.dataset import Dataset
+from src.data.engine import QueryEngine
+from src.data.executor import QueryTimeoutError, get_query_executor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Section:
+    """Data needed by one section of a page.
+
+    Attributes:
+        name: Unique name within the page.
+        load: Callable ``(engine, dataset, filters)`` returning the section's
+            data; runs on the query executor.
+    """
+
+    name: str
+    load: Callable[[QueryEngine, Dataset, dict[str, Any]], Any]
+
+
+def _run_in_context(ctx, func: Callable, *args) -> Any:
+    """Run a callable on a pool thread attached to the calling script run."""
+    thread = threading.current_thread()
+    if ctx is not None:
+        add_script_run_ctx(thread, ctx)
+    try:
+        return func(*args)
+    finally:
+        # Pool threads are reused; don't leave them tied to a finished run.
+        if hasattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME):
+            delattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME)
+
+
+def load_sections(
+    sections: tuple[Section, ...],
+    engine: QueryEngine,
+    dataset: Dataset,
+    filters: dict[str, Any],
+) -> dict[str, Future]:
+    """Start loading the data of every section in parallel.
+
+    The page renders while the sections load and waits on each future only
+    where its section is drawn. Queued loads of the session's previous run
+    are cancelled first, since this run supersedes it.
+
+    Args:
+        sections: Sections of the page.
+        engine: Query engine.
+        dataset: Dataset to query.
+        filters: Filter dict as returned by ``render_filter_sidebar``.
+
+    Returns:
+        Future of each section's data by name.
+    """
+    executor = get_query_executor()
+    ctx = get_script_run_ctx(suppress_warning=True)
+    owner = ctx.session_id if ctx is not None else None
+
+    if owner is not None:
+        executor.supersede(owner)
+
+    return {
+        section.name: executor.submit(
+            owner, _run_in_context, ctx, section.load, engine, dataset, filters
+        )
+        for section in sections
+    }
+
+
+def section_data(futures: dict[str, Future], name: str) -> Any | None:
+    """Wait for the data of a section.
+
+    Args:
+        futures: Futures returned by ``load_sections``.
+        name: Section name.
+
+    Returns:
+        The section's data, or None with a warning shown if it timed out.
+    """
+    try:
+        return get_query_executor().result(futures[name])
+    except QueryTimeoutError:
+        logger.warning(f"Section {name} timed out")
+        st.warning(f"The {name.replace('_', ' ')} section took too long to load.")
+        return None
+    except CancelledError:
+        # A newer run of this session took over; it renders the page.
+        st.stop()
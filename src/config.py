@@ -1,6 +1,7 @@
 """Configuration module using pydantic-settings."""
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,7 +14,42 @@ class Settings(BaseSettings):
     app_title: str = "My Analytics Dashboard"
     app_icon: str = "📊"
 
+    # A single Parquet file, or a month=/region= hive-partitioned directory.
     data_file: str = "data/processed/sample_data.parquet"
+    # Eager mode holds the data in memory, enabling the faster in-memory
+    # paths (sorted date slices, top-k index); lazy mode scans the files on
+    # each query. Unset, the data is loaded eagerly unless its Parquet files
+    # exceed eager_max_mb on disk, measured once per process.
+    lazy_loading: bool | None = None
+    eager_max_mb: float = 512
+    # Seconds between data file checks; 0 checks on every rerun instead.
+    data_poll_interval: float = 5.0
+    query_cache_size: int = 256
+    # Results also persist here as Arrow IPC files, shared by the worker
+    # processes of this host and kept across restarts; empty disables it.
+    query_disk_cache_dir: str | None = ".cache/query_results"
+    query_disk_cache_mb: int = 512
+    # Backend answering filters and aggregations; duckdb queries the Parquet
+    # files out-of-core instead of the in-memory frame.
+    query_engine: Literal["polars", "duckdb"] = "polars"
+    duckdb_memory_limit: str | None = None
+    # Points above this are downsampled (LTTB) before plotting a trend.
+    chart_max_points: int = 1000
+    # Queries of page sections run concurrently on this many shared threads;
+    # a section waits at most query_timeout seconds (0 waits forever).
+    query_workers: int = 4
+    query_timeout: float = 30.0
+    # Streamlit holds a download in memory until it is sent, so exports
+    # stop after this many rows; 0 exports every matching row.
+    export_max_rows: int = 1_000_000
+    # Views opened by users are logged here (empty disables it); a warm-up
+    # precomputes the default view and the warmup_top_n views listed in
+    # warmup_filters (e.g. [{"category": "Food", "preset": "last_30_days"}])
+    # or opened most often, at startup and for every new data version.
+    usage_log: str | None = ".cache/usage.jsonl"
+    warmup_on_start: bool = True
+    warmup_top_n: int = 10
+    warmup_filters: list[dict[str, str]] = []
 
     primary_color: str = "#2563EB"
     secondary_color: str = "#10B981"
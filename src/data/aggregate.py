@@ -0,0 +1,183 @@
+"""Declarative multi-statistic aggregation evaluated in one pass."""
+
+from dataclasses import dataclass
+
+import polars as pl
+
+from src.data.dictionary import label_sort_keys
+
+# Aggregation name -> statistic; "len" counts rows, "count" non-null values.
+AGGREGATIONS = ("sum", "mean", "count", "len", "min", "max")
+
+
+@dataclass(frozen=True)
+class Metric:
+    """One statistic to compute, named ``alias`` in the result."""
+
+    alias: str
+    agg: str
+    column: str | None = None
+
+    def __post_init__(self):
+        if self.agg not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation: {self.agg!r} (expected one of {AGGREGATIONS})")
+        if self.column is None and self.agg != "len":
+            raise ValueError(f"Aggregation {self.agg!r} needs a column")
+
+    def expr(self) -> pl.Expr:
+        """Polars expression computing the metric over raw rows."""
+        if self.agg == "len":
+            return pl.len().alias(self.alias)
+
+        col = pl.col(self.column)
+        exprs = {
+            "sum": col.sum(),
+            "mean": col.mean(),
+            "count": col.count(),
+            "min": col.min(),
+            "max": col.max(),
+        }
+        return exprs[self.agg].alias(self.alias)
+
+    def rollup_columns(self) -> tuple[str, ...]:
+        """Rollup columns the metric is computed from."""
+        if self.agg == "len":
+            return ("count",)
+        if self.agg == "mean":
+            return (f"{self.column}_sum", f"{self.column}_count")
+        return (f"{self.column}_{self.agg}",)
+
+    def rollup_expr(self) -> pl.Expr:
+        """Polars expression computing the metric from rollup cells."""
+        if self.agg == "len":
+            return pl.col("count").sum().cast(pl.UInt32).alias(self.alias)
+
+        if self.agg == "mean":
+            total = pl.col(f"{self.column}_sum").sum()
+            count = pl.col(f"{self.column}_count").sum()
+            return pl.when(count > 0).then(total / count).alias(self.alias)
+
+        col = pl.col(f"{self.column}_{self.agg}")
+        exprs = {
+            "sum": col.sum(),
+            "count": col.sum().cast(pl.UInt32),
+            "min": col.min(),
+            "max": col.max(),
+        }
+        return exprs[self.agg].alias(self.alias)
+
+
+@dataclass(frozen=True)
+class Grouping:
+    """A set of metrics computed per group, or overall with no ``by`` columns."""
+
+    name: str
+    metrics: tuple[Metric, ...]
+    by: tuple[str, ...] = ()
+    sort: str | None = None
+    descending: bool = False
+
+    def plan(self, lf: pl.LazyFrame, rollup: bool = False) -> pl.LazyFrame:
+        """Build the query for this grouping.
+
+        Args:
+            lf: Rows to aggregate, or rollup cells with ``rollup``.
+            rollup: Compute the metrics from rollup cells.
+
+        Returns:
+            LazyFrame with the ``by`` columns followed by the metrics.
+        """
+        exprs = [m.rollup_expr() if rollup else m.expr() for m in self.metrics]
+        plan = lf.group_by(self.by).agg(exprs) if self.by else lf.select(exprs)
+        return self._sorted(plan)
+
+    def finish(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Put a computed result in the shape ``plan`` returns."""
+        return self._sorted(df.select(*self.by, *(m.alias for m in self.metrics)))
+
+    def _sorted(self, frame: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
+        """Sort a result by ``sort``, dimensions by label."""
+        if not self.sort:
+            return frame
+        keys = label_sort_keys(frame.collect_schema(), [self.sort])
+        return frame.sort(keys, descending=self.descending)
+
+
+def summary_metrics(value_col: str = "value") -> tuple[Metric, ...]:
+    """Metrics behind ``to_summary``: total, mean, count, min and max.
+
+    Args:
+        value_col: Column to summarize.
+
+    Returns:
+        Tuple of metrics.
+    """
+    return (
+        Metric("total", "sum", value_col),
+        Metric("mean", "mean", value_col),
+        Metric("count", "len"),
+        Metric("min", "min", value_col),
+        Metric("max", "max", value_col),
+    )
+
+
+def group_stats_metrics(value_col: str = "value") -> tuple[Metric, ...]:
+    """Metrics of ``compute_group_stats``: total, average and count.
+
+    Args:
+        value_col: Column to aggregate.
+
+    Returns:
+        Tuple of metrics.
+    """
+    return (
+        Metric("total", "sum", value_col),
+        Metric("average", "mean", value_col),
+        Metric("count", "len"),
+    )
+
+
+def to_summary(df: pl.DataFrame) -> dict:
+    """Turn an ungrouped ``summary_metrics`` result into a summary dict.
+
+    Args:
+        df: One-row result of a grouping using ``summary_metrics``.
+
+    Returns:
+        Dictionary like ``compute_summary`` returns, empty if no rows matched.
+    """
+    stats = df.row(0, named=True)
+
+    if not stats["count"]:
+        return {}
+
+    return {
+        "total": float(stats["total"]),
+        "mean": float(stats["mean"]),
+        "count": stats["count"],
+        "min": float(stats["min"]),
+        "max": float(stats["max"]),
+    }
+
+
+def evaluate(
+    lf: pl.DataFrame | pl.LazyFrame,
+    groupings: tuple[Grouping, ...],
+    rollup: bool = False,
+) -> dict[str, pl.DataFrame]:
+    """Compute several groupings in one pass over the data.
+
+    All plans share the same input and are collected together with
+    ``pl.collect_all``, which evaluates the common scan and filters once.
+
+    Args:
+        lf: Rows to aggregate, or rollup cells with ``rollup``.
+        groupings: Groupings to compute; names must be unique.
+        rollup: Compute the metrics from rollup cells.
+
+    Returns:
+        Result of each grouping by name.
+    """
+    lf = lf.lazy()
+    results = pl.collect_all([g.plan(lf, rollup) for g in groupings])
+    return {g.name: df for g, df in zip(groupings, results, strict=True)}
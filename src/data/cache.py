@@ -0,0 +1,262 @@
+"""Query result cache keyed on dataset version, filters and query spec."""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, TypeVar
+
+import streamlit as st
+
+from src.config import get_settings
+from src.data.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    coalesced: int = 0
+    disk_hits: int = 0
+    size: int = 0
+    max_entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class QueryCache:
+    """Thread-safe, size-bounded LRU cache for query results.
+
+    Keys are small tuples built with ``make_cache_key``, so a lookup never
+    hashes the data itself. Concurrent misses on the same key are coalesced:
+    one caller computes while the others wait for its result. With a
+    ``disk`` tier, misses are looked up on disk before computing and new
+    results are written there, so they survive restarts.
+    """
+
+    def __init__(self, max_entries: int = 256, disk: DiskCache | None = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept before the least
+                recently used entry is evicted.
+            disk: Optional persistent tier shared with other processes.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.disk = disk
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._coalesced = 0
+        self._disk_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Look up a cached result and mark it as recently used.
+
+        Args:
+            key: Cache key.
+            default: Value returned on a miss.
+
+        Returns:
+            Cached value, or ``default`` if the key is absent.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+
+            self._misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key.
+            value: Result to store.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached result for ``key``, computing it on a miss.
+
+        If another thread is already computing ``key``, wait for its result
+        instead of computing it again.
+
+        Args:
+            key: Cache key.
+            compute: Zero-argument callable producing the result.
+
+        Returns:
+            Cached or freshly computed result.
+
+        Raises:
+            Exception: Whatever ``compute`` raised, also in the callers that
+                waited on it.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+
+        if value is not sentinel:
+            return value
+
+        with self._lock:
+            # The result may have landed between the lookup and the lock.
+            if key in self._entries:
+                return self._entries[key]
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            logger.debug(f"Waiting for in-flight computation of {key}")
+            return flight.result()
+
+        try:
+            value = self._load_or_compute(key, compute)
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            self.put(key, value)
+            flight.set_result(value)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+        return value
+
+    def _load_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Read a missed result from the disk tier, or compute and persist it."""
+        if self.disk is None:
+            return compute()
+
+        sentinel = object()
+        value = self.disk.get(key, sentinel)
+
+        if value is not sentinel:
+            with self._lock:
+                self._disk_hits += 1
+            return value
+
+        value = compute()
+        self.disk.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries, including the disk tier, and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._coalesced = 0
+            self._disk_hits = 0
+
+        if self.disk is not None:
+            self.disk.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit/miss/eviction counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                coalesced=self._coalesced,
+                disk_hits=self._disk_hits,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+
+def _normalize_value(value: Any) -> Hashable:
+    """Convert a filter value to a stable, hashable representation."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(sorted(_normalize_value(v) for v in value))
+    return value
+
+
+def normalize_filters(filters: dict[str, Any] | None) -> tuple:
+    """Normalize a filter dict into an order-independent, hashable tuple.
+
+    Args:
+        filters: Filter dict as returned by ``render_filter_sidebar``.
+
+    Returns:
+        Tuple of ``(name, value)`` pairs sorted by name.
+    """
+    if not filters:
+        return ()
+
+    return tuple(sorted((k, _normalize_value(v)) for k, v in filters.items()))
+
+
+def make_cache_key(fingerprint: str, filters: dict[str, Any] | None = None) -> tuple:
+    """Build the cache key prefix identifying a filtered view of a dataset.
+
+    Query functions append their own aggregation spec to this prefix.
+
+    Args:
+        fingerprint: Dataset fingerprint (see ``dataset_fingerprint``).
+        filters: Active filter dict.
+
+    Returns:
+        Hashable cache key.
+    """
+    return (fingerprint, normalize_filters(filters))
+
+
+@st.cache_resource
+def get_query_cache() -> QueryCache:
+    """Get the process-wide query result cache shared by all sessions."""
+    settings = get_settings()
+    disk = None
+    if settings.query_disk_cache_dir:
+        disk = DiskCache(settings.query_disk_cache_dir, settings.query_disk_cache_mb * 1024**2)
+
+    logger.info(
+        f"Creating query cache with {settings.query_cache_size} entries"
+        f" and disk tier {settings.query_disk_cache_dir or 'disabled'}"
+    )
+    return QueryCache(max_entries=settings.query_cache_size, disk=disk)
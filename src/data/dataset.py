@@ -0,0 +1,424 @@
+"""Process-wide, read-only dataset handles shared across sessions."""
+
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
+import streamlit as st
+
+from src.data.dictionary import (
+    ENCODED_COLUMNS,
+    Dictionary,
+    encode_dimensions,
+    extend_dictionary,
+    frame_dictionary,
+    read_dictionary,
+)
+from src.data.index import DimensionIndex, build_index, merge_indexes
+from src.data.kpi import Baseline, build_baseline
+from src.data.loader import (
+    build_top_k_index,
+    files_fingerprint,
+    get_columns,
+    list_data_files,
+    mark_sorted,
+    scan_files,
+)
+from src.data.manifest import Manifest, read_manifest
+from src.data.rollup import (
+    ROLLUP_DIMENSIONS,
+    build_rollup,
+    merge_rollups,
+    read_rollup,
+    rollup_path,
+)
+
+logger = logging.getLogger(__name__)
+
+_RESIDENT: "weakref.WeakValueDictionary[tuple[str, str], Dataset]" = weakref.WeakValueDictionary()
+_STORE_LOCK = threading.Lock()
+
+# Datasets kept fresh by a DatasetWatcher, keyed by (path, lazy).
+_WATCHED: set[tuple[str, bool]] = set()
+
+# Mode picked from the data size per path, kept for the life of the process.
+_AUTO_MODES: dict[str, bool] = {}
+
+
+@dataclass(frozen=True, eq=False)
+class Dataset:
+    """A loaded version of a data file, shared read-only by every session.
+
+    In eager mode ``frame`` holds the Arrow-backed data once per process, with
+    low-cardinality dimensions Enum-encoded, and ``scan()`` hands out
+    zero-copy lazy views of it. In lazy mode ``frame`` is None and ``scan()``
+    reads ``files`` on each query. The rollup cube, when available, is always
+    held in memory, as are the column ``index`` used by the filter widgets and
+    the KPI ``baseline``. In eager mode the rollup is built from the frame if
+    none was persisted, and the per-cell ``top_index`` serves top-k queries.
+    """
+
+    path: Path
+    fingerprint: str
+    files: tuple[Path, ...] = ()
+    frame: pl.DataFrame | None = None
+    rollup: pl.DataFrame | None = None
+    manifest: Manifest | None = None
+    index: DimensionIndex | None = None
+    top_index: pl.DataFrame | None = None
+    baseline: Baseline | None = None
+    loaded_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def is_lazy(self) -> bool:
+        """Whether queries are served from the file rather than memory."""
+        return self.frame is None
+
+    @property
+    def nbytes(self) -> int:
+        """Resident size of the in-memory frame, rollup and top-k index in bytes."""
+        frames = (self.frame, self.rollup, self.top_index)
+        return sum(f.estimated_size() for f in frames if f is not None)
+
+    def scan(self) -> pl.LazyFrame:
+        """Start a lazy query over the dataset.
+
+        Returns:
+            LazyFrame over the shared frame, or over the Parquet file in lazy mode.
+        """
+        if self.frame is None:
+            return scan_files(list(self.files), hive_partitioning=self.path.is_dir())
+
+        return self.frame.lazy()
+
+    def scan_rollup(self) -> pl.LazyFrame | None:
+        """Start a lazy query over the rollup cube.
+
+        Returns:
+            LazyFrame over the rollup, or None if the dataset has no rollup.
+        """
+        if self.rollup is None:
+            return None
+
+        return self.rollup.lazy()
+
+
+@st.cache_resource
+def _current_datasets() -> dict[tuple[str, bool], Dataset]:
+    """Process-wide registry of the current dataset version per (path, mode)."""
+    return {}
+
+
+def _encode(
+    frame: pl.DataFrame,
+    dictionary: Dictionary,
+    index: DimensionIndex,
+    columns: tuple[str, ...] = ENCODED_COLUMNS,
+) -> pl.DataFrame:
+    """Enum-encode the indexed dimension columns, extending the dictionary as needed."""
+    values = {c: index.unique_values(c) for c in columns if index.unique_values(c)}
+    dictionary = extend_dictionary(dictionary, values)
+    return encode_dimensions(frame, {c: dictionary[c] for c in values})
+
+
+def _version(path: Path, files: list[Path]) -> str:
+    """Fingerprint of a dataset's files and, once written, of its rollup.
+
+    A rollup written after its data changes the version, so it is picked
+    up by the next refresh instead of waiting for the next data change.
+    """
+    rollup = rollup_path(path)
+    return files_fingerprint([*files, rollup] if rollup.exists() else files)
+
+
+def _build_top_index(df: pl.DataFrame) -> pl.DataFrame | None:
+    """Per-cell top rows by value, or None if it would not shrink the frame."""
+    if "value" not in get_columns(df):
+        return None
+
+    top_index = build_top_k_index(df, ROLLUP_DIMENSIONS)
+    if len(top_index) > len(df) // 2:
+        logger.info(f"Skipping top-k index: {len(top_index)} of {len(df)} rows")
+        return None
+
+    return top_index
+
+
+def _build_baseline(
+    rows: pl.DataFrame | pl.LazyFrame, rollup: pl.DataFrame | None, index: DimensionIndex
+) -> Baseline | None:
+    """KPI baseline from the rollup cells if available, else from the rows."""
+    if "value" not in get_columns(rows):
+        return None
+    if rollup is not None:
+        return build_baseline(rollup, index.bounds("date"), rollup=True)
+    return build_baseline(rows, index.bounds("date"))
+
+
+def _load_dataset(path: Path, lazy: bool) -> Dataset:
+    """Fully load the current version of a dataset."""
+    files = list_data_files(path)
+    scan = scan_files(files, hive_partitioning=path.is_dir())
+
+    logger.info(f"Loading dataset {path} ({len(files)} files)")
+    frame = None if lazy else mark_sorted(scan.collect().rechunk())
+    index = build_index(scan if frame is None else frame, files)
+    rollup = read_rollup(path, expected_rows=index.n_rows, files=files)
+
+    if frame is not None:
+        has_dims = any(d in frame.columns for d in ROLLUP_DIMENSIONS)
+        if rollup is None and has_dims and "value" in frame.columns:
+            rollup = build_rollup(frame)
+        frame = _encode(frame, read_dictionary(path), index)
+
+    return Dataset(
+        path=path,
+        fingerprint=_version(path, files),
+        files=tuple(files),
+        frame=frame,
+        rollup=rollup,
+        manifest=read_manifest(path) if path.is_dir() else None,
+        index=index,
+        top_index=None if frame is None else _build_top_index(frame),
+        baseline=_build_baseline(scan if frame is None else frame, rollup, index),
+    )
+
+
+def _apply_delta(current: Dataset) -> Dataset | None:
+    """Fold files appended since ``current`` into a new dataset version.
+
+    The previous frame's buffers are reused as-is and only the new files are
+    read; the rollup is updated by merging in the rollup of the new rows.
+
+    Returns:
+        New dataset version, or None if the change is not a pure append.
+    """
+    if current.manifest is None:
+        return None
+
+    manifest = read_manifest(current.path)
+    added = manifest.appended_since(current.manifest) if manifest is not None else None
+
+    if not added:
+        return None
+
+    new_files = [current.path / entry.path for entry in added]
+    files = [current.path / entry.path for entry in manifest.files]
+    delta = scan_files(new_files).collect()
+    delta_index = build_index(delta)
+
+    rollup = current.rollup
+    if rollup is not None:
+        rollup = merge_rollups(rollup, build_rollup(delta))
+
+    index = current.index
+    if index is not None:
+        index = merge_indexes(index, delta_index)
+
+    frame = current.frame
+    if frame is not None:
+        encoded = frame_dictionary(frame)
+        delta = _encode(delta, encoded, delta_index, columns=tuple(encoded))
+        # New labels extend the dictionary; existing codes keep their values.
+        frame = encode_dimensions(frame, frame_dictionary(delta))
+        frame = mark_sorted(pl.concat([frame, delta.select(frame.columns)], rechunk=False))
+
+    top_index = current.top_index
+    if top_index is not None:
+        top_index = encode_dimensions(top_index, frame_dictionary(delta))
+        top_index = build_top_k_index(
+            pl.concat([top_index, delta.select(top_index.columns)]), ROLLUP_DIMENSIONS
+        )
+
+    baseline = current.baseline
+    if baseline is not None:
+        rows = frame if frame is not None else scan_files(files, hive_partitioning=True)
+        baseline = _build_baseline(rows, rollup, index)
+
+    logger.info(f"Appended {len(delta)} rows from {len(new_files)} files to {current.path}")
+    return Dataset(
+        path=current.path,
+        fingerprint=_version(current.path, files),
+        files=tuple(files),
+        frame=frame,
+        rollup=rollup,
+        manifest=manifest,
+        index=index,
+        top_index=top_index,
+        baseline=baseline,
+    )
+
+
+def resolve_lazy(path: str | Path, lazy: bool | None, eager_max_mb: float) -> bool:
+    """Pick the dataset mode, eager unless the data is too large to hold.
+
+    An explicit ``lazy`` is returned as is. Otherwise the first call for a
+    path compares the size of its Parquet files with ``eager_max_mb``, and
+    later calls return the same choice: the mode, and the cache entries keyed
+    on it, stay put as the data grows until the process restarts.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+        lazy: Configured mode, or None to choose from the data size.
+        eager_max_mb: Largest on-disk size in MB loaded into memory.
+
+    Returns:
+        True if the dataset should be scanned rather than held in memory.
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist or holds no Parquet files.
+    """
+    if lazy is not None:
+        return lazy
+
+    key = str(path)
+    if key not in _AUTO_MODES:
+        size = sum(f.stat().st_size for f in list_data_files(path))
+        _AUTO_MODES[key] = size > eager_max_mb * 1024 * 1024
+        mode = "lazy" if _AUTO_MODES[key] else "eager"
+        logger.info(f"Dataset {path} is {size:,} bytes on disk; loading it {mode}")
+
+    return _AUTO_MODES[key]
+
+
+def refresh_dataset(path: str | Path, lazy: bool = False) -> Dataset:
+    """Bring the shared handle up to date with the files on disk.
+
+    The new version is built while readers keep using the current one, then
+    swapped in with a single assignment. Reruns already holding the previous
+    handle finish on it unchanged. When a manifest shows that files were only
+    appended, the new files are folded into the previous version instead of
+    reloading everything.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+        lazy: If True, do not hold the data in memory and scan the files instead.
+
+    Returns:
+        Shared Dataset handle for the current version.
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist or holds no Parquet files.
+    """
+    path = Path(path)
+    key = (str(path), lazy)
+    datasets = _current_datasets()
+
+    current = datasets.get(key)
+    if current is not None and current.fingerprint == _version(path, list_data_files(path)):
+        return current
+
+    with _STORE_LOCK:
+        # Another thread may have swapped in the new version while we waited.
+        current = datasets.get(key)
+        if current is not None and current.fingerprint == _version(path, list_data_files(path)):
+            return current
+
+        dataset = _apply_delta(current) if current is not None else None
+        if dataset is None:
+            dataset = _load_dataset(path, lazy)
+
+        datasets[key] = dataset
+
+    _RESIDENT[(str(path), dataset.fingerprint)] = dataset
+    logger.info(f"Dataset {path}@{dataset.fingerprint} resident: {dataset.nbytes:,} bytes")
+    return dataset
+
+
+def get_dataset(path: str | Path, lazy: bool = False) -> Dataset:
+    """Get the shared handle for the current version of a dataset.
+
+    The handle is created once per process and dataset version; every
+    session receives the same object, so memory grows with the data, not
+    with the number of sessions. While a ``DatasetWatcher`` polls the path,
+    the current handle is returned without touching the filesystem;
+    otherwise the fingerprint is checked on every call.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+        lazy: If True, do not hold the data in memory and scan the files instead.
+
+    Returns:
+        Shared Dataset handle.
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist or holds no Parquet files.
+    """
+    key = (str(path), lazy)
+    current = _current_datasets().get(key)
+
+    if current is not None and key in _WATCHED:
+        return current
+
+    return refresh_dataset(path, lazy)
+
+
+class DatasetWatcher(threading.Thread):
+    """Background thread polling a dataset's fingerprint and reloading on change."""
+
+    def __init__(self, path: str | Path, lazy: bool = False, interval: float = 5.0):
+        """Initialize the watcher.
+
+        Args:
+            path: Path to the Parquet file or dataset directory.
+            lazy: Dataset mode to keep up to date.
+            interval: Seconds between two polls.
+        """
+        super().__init__(name=f"dataset-watcher:{path}", daemon=True)
+        self.path = Path(path)
+        self.lazy = lazy
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        key = (str(self.path), self.lazy)
+        _WATCHED.add(key)
+
+        try:
+            while not self._stop_event.wait(self.interval):
+                try:
+                    refresh_dataset(self.path, self.lazy)
+                except FileNotFoundError:
+                    logger.warning(f"Dataset {self.path} is missing; keeping current version")
+                except Exception:
+                    logger.exception(f"Failed to refresh dataset {self.path}")
+        finally:
+            _WATCHED.discard(key)
+
+    def stop(self) -> None:
+        """Stop polling; the thread exits after its current poll."""
+        self._stop_event.set()
+
+
+@st.cache_resource
+def watch_dataset(path: str, lazy: bool = False, interval: float = 5.0) -> DatasetWatcher:
+    """Start the process-wide watcher for a dataset, once per process.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+        lazy: Dataset mode to keep up to date.
+        interval: Seconds between two polls.
+
+    Returns:
+        The running watcher.
+    """
+    refresh_dataset(path, lazy)
+
+    watcher = DatasetWatcher(path, lazy, interval)
+    _WATCHED.add((str(path), lazy))
+    watcher.start()
+    logger.info(f"Watching {path} for changes every {interval}s")
+    return watcher
+
+
+def dataset_memory_usage() -> dict[str, int]:
+    """Report resident bytes for every dataset version still alive in this process.
+
+    Returns:
+        Mapping of ``"path@fingerprint"`` to resident bytes.
+    """
+    return {f"{path}@{fp}": ds.nbytes for (path, fp), ds in list(_RESIDENT.items())}
@@ -0,0 +1,172 @@
+"""Persisted label dictionaries for Enum-encoded dimension columns."""
+
+import json
+import logging
+import os
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+# Dimension columns encoded as pl.Enum when they are low-cardinality.
+ENCODED_COLUMNS = ("category", "region", "name")
+MAX_LABELS = 10_000
+
+Dictionary = dict[str, tuple[str, ...]]
+
+
+def dictionary_path(data_path: str | Path) -> Path:
+    """Get the dictionary file stored next to a data file or dataset directory.
+
+    Args:
+        data_path: Path to the raw Parquet file or dataset directory.
+
+    Returns:
+        Path of the companion dictionary file.
+    """
+    data_path = Path(data_path)
+    return data_path.with_name(f"{data_path.stem}.dictionary.json")
+
+
+def read_dictionary(data_path: str | Path) -> Dictionary:
+    """Read the label dictionary of a dataset.
+
+    Args:
+        data_path: Path to the raw Parquet file or dataset directory.
+
+    Returns:
+        Mapping of column name to its labels in code order, empty if missing.
+    """
+    path = dictionary_path(data_path)
+
+    if not path.exists():
+        return {}
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return {column: tuple(labels) for column, labels in payload.items()}
+
+
+def write_dictionary(dictionary: Dictionary, data_path: str | Path) -> Path:
+    """Atomically write the label dictionary of a dataset.
+
+    Args:
+        dictionary: Mapping of column name to labels in code order.
+        data_path: Path to the raw Parquet file or dataset directory.
+
+    Returns:
+        Path of the dictionary file.
+    """
+    path = dictionary_path(data_path)
+    staging = path.with_name(f".{path.name}.tmp")
+    payload = {column: list(labels) for column, labels in dictionary.items()}
+
+    staging.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(staging, path)
+    logger.info(f"Wrote dictionary for {list(dictionary)} -> {path}")
+    return path
+
+
+def extend_dictionary(dictionary: Dictionary, values: Mapping[str, Iterable]) -> Dictionary:
+    """Append unseen labels to a dictionary.
+
+    Existing labels keep their position, so codes stay stable across
+    refreshes; new labels are appended in sorted order.
+
+    Args:
+        dictionary: Current dictionary.
+        values: Mapping of column name to the labels it now holds.
+
+    Returns:
+        Extended dictionary (``dictionary`` itself if nothing is new).
+    """
+    extended = dict(dictionary)
+
+    for column, labels in values.items():
+        known = extended.get(column, ())
+        seen = set(known)
+        new = sorted({label for label in labels if label is not None and label not in seen})
+
+        if new:
+            extended[column] = (*known, *new)
+
+    return extended if extended != dictionary else dictionary
+
+
+def dimension_values(
+    df: pl.DataFrame | pl.LazyFrame, max_labels: int = MAX_LABELS
+) -> dict[str, list]:
+    """Distinct labels of the encodable columns of a frame.
+
+    Args:
+        df: DataFrame or LazyFrame.
+        max_labels: Columns with more distinct labels are left out.
+
+    Returns:
+        Mapping of column name to its distinct labels.
+    """
+    lf = df.lazy()
+    columns = [c for c in ENCODED_COLUMNS if c in lf.collect_schema().names()]
+    frames = pl.collect_all([lf.select(pl.col(c).cast(pl.String).unique()) for c in columns])
+    return {
+        c: frame[c].to_list()
+        for c, frame in zip(columns, frames, strict=True)
+        if len(frame) <= max_labels
+    }
+
+
+def frame_dictionary(df: pl.DataFrame) -> Dictionary:
+    """Labels of the Enum columns of a frame.
+
+    Args:
+        df: DataFrame.
+
+    Returns:
+        Mapping of each Enum column to its labels in code order.
+    """
+    return {
+        column: tuple(dtype.categories.to_list())
+        for column, dtype in df.schema.items()
+        if isinstance(dtype, pl.Enum)
+    }
+
+
+def encode_dimensions(df: pl.DataFrame, dictionary: Dictionary) -> pl.DataFrame:
+    """Cast dictionary columns to ``pl.Enum`` so filters and group-bys use codes.
+
+    Args:
+        df: DataFrame with string dimension columns.
+        dictionary: Dictionary covering every label in ``df``.
+
+    Returns:
+        DataFrame with the dictionary columns Enum-encoded.
+    """
+    casts = [
+        pl.col(column).cast(pl.Enum(labels))
+        for column, labels in dictionary.items()
+        if column in df.columns and df.schema[column] != pl.Enum(labels)
+    ]
+
+    return df.with_columns(casts) if casts else df
+
+
+def label_sort_keys(schema: pl.Schema, columns: Iterable[str]) -> list[pl.Expr]:
+    """Sort keys ordering encoded dimensions by label rather than by code.
+
+    Enum columns sort by code, and the dictionary appends new labels after
+    the known ones, so a label added by a later refresh would sort last.
+
+    Args:
+        schema: Schema of the rows to sort.
+        columns: Columns to sort by.
+
+    Returns:
+        One sort key per column; Enum and Categorical columns are cast to String.
+    """
+    return [
+        pl.col(c).cast(pl.String)
+        if isinstance(schema.get(c), (pl.Enum, pl.Categorical))
+        else pl.col(c)
+        for c in columns
+    ]
@@ -0,0 +1,238 @@
+"""On-disk query result cache in Arrow IPC files, shared by worker processes."""
+
+import dataclasses
+import hashlib
+import io
+import logging
+import os
+import threading
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".arrow"
+
+# Salted into every file name; bump it whenever query code changes results
+# or their shape, so files written by older code are never served.
+CACHE_SCHEMA_VERSION = 1
+
+
+def stable_key(key: Hashable) -> str | None:
+    """Render a cache key as text that is identical in every process.
+
+    Only strings, numbers, booleans, None, tuples and frozen dataclasses of
+    those are accepted; anything else (e.g. a function, whose text holds a
+    memory address) could alias another key after a restart.
+
+    Args:
+        key: Cache key.
+
+    Returns:
+        Stable text of the key, or None if it has no stable form.
+    """
+    if key is None or isinstance(key, (str, int, float, bool)):
+        return repr(key)
+
+    if isinstance(key, tuple):
+        parts = [stable_key(part) for part in key]
+        return None if None in parts else "(" + ",".join(parts) + ")"
+
+    if dataclasses.is_dataclass(key) and key.__dataclass_params__.frozen:
+        fields = [stable_key(getattr(key, f.name)) for f in dataclasses.fields(key)]
+        if None in fields:
+            return None
+        return f"{type(key).__qualname__}(" + ",".join(fields) + ")"
+
+    return None
+
+
+def _ipc_bytes(df: pl.DataFrame) -> bytes:
+    """Serialize a DataFrame to Arrow IPC bytes."""
+    buffer = io.BytesIO()
+    df.write_ipc(buffer)
+    return buffer.getvalue()
+
+
+def _encode(value: Any) -> pl.DataFrame | None:
+    """Wrap a query result in an envelope frame, or None if unsupported.
+
+    Each envelope row holds one Arrow IPC payload; ``kind`` tells how the
+    payloads reassemble into the result.
+    """
+    if isinstance(value, pl.DataFrame):
+        kind, names, frames = "frame", [None], [value]
+    elif (
+        isinstance(value, dict)
+        and value
+        and all(isinstance(v, pl.DataFrame) for v in value.values())
+    ):
+        kind, names, frames = "frames", list(value), list(value.values())
+    elif isinstance(value, dict):
+        kind, names, frames = "record", [None], [pl.DataFrame([value]) if value else pl.DataFrame()]
+    elif isinstance(value, (int, float)):
+        kind, names, frames = "scalar", [None], [pl.DataFrame({"value": [value]})]
+    else:
+        return None
+
+    return pl.DataFrame(
+        {
+            "kind": [kind] * len(frames),
+            "name": names,
+            "payload": [_ipc_bytes(df) for df in frames],
+        },
+        schema={"kind": pl.String, "name": pl.String, "payload": pl.Binary},
+    )
+
+
+def _decode(envelope: pl.DataFrame) -> Any:
+    """Rebuild a query result from its envelope frame."""
+    kind = envelope["kind"][0]
+    frames = [pl.read_ipc(io.BytesIO(payload)) for payload in envelope["payload"]]
+
+    if kind == "frame":
+        return frames[0]
+    if kind == "frames":
+        return dict(zip(envelope["name"], frames, strict=True))
+    if kind == "record":
+        return frames[0].row(0, named=True) if frames[0].width else {}
+    if kind == "scalar":
+        return frames[0].item()
+
+    raise ValueError(f"Unknown cache entry kind: {kind!r}")
+
+
+class DiskCache:
+    """Size-capped LRU cache of query results in a directory.
+
+    Each result is one Arrow IPC file named after a hash of its key, written
+    to a staging file and renamed into place, so readers in any process only
+    ever see complete files. Recency is the file modification time, bumped on
+    every hit; when the directory outgrows ``max_bytes`` the least recently
+    used files are deleted. Processes evicting concurrently only race on
+    deleting the same file, which is harmless.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 512 * 1024**2):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the result files; created if missing.
+            max_bytes: Total size of result files kept before eviction.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def path(self, key: Hashable) -> Path | None:
+        """File holding the result for a key, or None if the key is not stable."""
+        text = stable_key(key)
+        if text is None:
+            return None
+
+        salted = f"v{CACHE_SCHEMA_VERSION}:{text}"
+        digest = hashlib.sha256(salted.encode()).hexdigest()[:32]
+        return self.directory / f"{digest}{_SUFFIX}"
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Read a cached result and mark it as recently used.
+
+        Args:
+            key: Cache key.
+            default: Value returned on a miss.
+
+        Returns:
+            Cached value, or ``default`` if absent or unreadable.
+        """
+        path = self.path(key)
+        if path is None:
+            return default
+
+        try:
+            value = _decode(pl.read_ipc(path, memory_map=False))
+            os.utime(path)
+        except FileNotFoundError:
+            return default
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable cache file {path}: {exc}")
+            return default
+
+        return value
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """Store a result unless its key or type can't be persisted.
+
+        Args:
+            key: Cache key.
+            value: Result to store.
+
+        Returns:
+            True if the result was written.
+        """
+        path = self.path(key)
+        envelope = _encode(value) if path is not None else None
+        if envelope is None:
+            return False
+
+        staging = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            envelope.write_ipc(staging)
+            os.replace(staging, path)
+        except OSError as exc:
+            logger.warning(f"Could not write cache file {path}: {exc}")
+            staging.unlink(missing_ok=True)
+            return False
+
+        self.evict()
+        return True
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every result file."""
+        entries = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """Delete least recently used files until the cache fits ``max_bytes``.
+
+        Returns:
+            Number of files deleted.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.debug(f"Evicted {removed} files from {self.directory}")
+        return removed
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the result files."""
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def clear(self) -> None:
+        """Delete every result file."""
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
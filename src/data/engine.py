@@ -0,0 +1,888 @@
+"""Pluggable query engines answering dashboard queries over a dataset."""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import polars as pl
+import pyarrow as pa
+import streamlit as st
+
+from src.components.filters import apply_filters
+from src.config import get_settings
+from src.data.aggregate import Grouping, evaluate
+from src.data.cache import get_query_cache, make_cache_key
+from src.data.dataset import Dataset
+from src.data.export import export_to_file, validate_format
+from src.data.loader import (
+    MONTH_PARTITION_COL,
+    TOP_K_INDEX_SIZE,
+    aggregate_by_column,
+    compute_group_stats,
+    compute_summary,
+    top_k,
+)
+from src.data.rollup import (
+    ROLLUP_DIMENSIONS,
+    aggregate_from_rollup,
+    can_use_rollup,
+    group_stats_from_rollup,
+    summary_from_rollup,
+)
+from src.data.table import count_matches, fetch_page, text_columns
+
+logger = logging.getLogger(__name__)
+
+# Rows per Arrow batch when DuckDB streams an export it can't COPY.
+EXPORT_BATCH_ROWS = 100_000
+
+
+class QueryEngine(ABC):
+    """Base class for query engines.
+
+    Public methods serve results from the query cache and answer from the
+    rollup cube when the filters allow it; subclasses only implement the
+    raw-row queries. Every engine must return identical results.
+    """
+
+    name: str = ""
+
+    def _rollup(self, dataset: Dataset, filters: dict[str, Any]) -> pl.LazyFrame | None:
+        """Filtered rollup cells, or None if the rollup cannot answer."""
+        cube = dataset.scan_rollup()
+
+        if cube is None or not can_use_rollup(filters):
+            return None
+
+        return apply_filters(cube, filters)
+
+    def _cached(self, dataset: Dataset, filters: dict[str, Any], spec: tuple, compute):
+        """Serve a result from the query cache, computing it on a miss.
+
+        Engines and dataset modes return equal values with different dtypes
+        (Enum-encoded dimensions in eager mode), so each gets its own entries.
+        """
+        key = (*make_cache_key(dataset.fingerprint, filters), self.name, dataset.is_lazy, *spec)
+        return get_query_cache().get_or_compute(key, compute)
+
+    def summary(self, dataset: Dataset, filters: dict[str, Any], value_col: str = "value") -> dict:
+        """Compute total, mean, count, min and max of a value.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict as returned by ``render_filter_sidebar``.
+            value_col: Column to summarize.
+
+        Returns:
+            Dictionary with summary statistics, empty if no rows match.
+        """
+        cube = self._rollup(dataset, filters)
+
+        def compute() -> dict:
+            if cube is not None:
+                return summary_from_rollup(cube, value_col)
+            return self._summary(dataset, filters, value_col)
+
+        return dict(self._cached(dataset, filters, ("summary", value_col), compute))
+
+    def count(self, dataset: Dataset, filters: dict[str, Any]) -> int:
+        """Count matching rows.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+
+        Returns:
+            Number of matching rows.
+        """
+        cube = self._rollup(dataset, filters)
+
+        def compute() -> int:
+            if cube is not None:
+                return cube.select(pl.col("count").sum()).collect().item() or 0
+            return self._count(dataset, filters)
+
+        return self._cached(dataset, filters, ("count",), compute)
+
+    def aggregate(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        group_col: str,
+        value_col: str = "value",
+        agg: str = "sum",
+    ) -> pl.DataFrame:
+        """Aggregate a value per group, sorted by the aggregate descending.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+            group_col: Column to group by.
+            value_col: Column to aggregate.
+            agg: Aggregation function ("sum", "mean" or "count").
+
+        Returns:
+            Aggregated DataFrame, empty if no rows match.
+        """
+        cube = self._rollup(dataset, filters) if group_col in ROLLUP_DIMENSIONS else None
+
+        def compute() -> pl.DataFrame:
+            if cube is not None:
+                return aggregate_from_rollup(cube, group_col, value_col, agg)
+            return self._aggregate(dataset, filters, group_col, value_col, agg)
+
+        return self._cached(dataset, filters, ("aggregate", group_col, value_col, agg), compute)
+
+    def group_stats(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        group_col: str,
+        value_col: str = "value",
+    ) -> pl.DataFrame:
+        """Compute total, average and count of a value per group.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+            group_col: Column to group by.
+            value_col: Column to aggregate.
+
+        Returns:
+            DataFrame with ``group_col``, ``total``, ``average`` and ``count``,
+            sorted by total descending.
+        """
+        cube = self._rollup(dataset, filters) if group_col in ROLLUP_DIMENSIONS else None
+
+        def compute() -> pl.DataFrame:
+            if cube is not None:
+                return group_stats_from_rollup(cube, group_col, value_col)
+            return self._group_stats(dataset, filters, group_col, value_col)
+
+        return self._cached(dataset, filters, ("group_stats", group_col, value_col), compute)
+
+    def evaluate(
+        self, dataset: Dataset, filters: dict[str, Any], groupings: tuple[Grouping, ...]
+    ) -> dict[str, pl.DataFrame]:
+        """Compute several groupings of metrics in one pass over the data.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+            groupings: Groupings to compute; names must be unique.
+
+        Returns:
+            Result of each grouping by name.
+        """
+        cube = self._rollup(dataset, filters)
+        if cube is not None:
+            cube_columns = set(cube.collect_schema().names())
+            needed = {c for g in groupings for c in g.by} | {
+                c for g in groupings for m in g.metrics for c in m.rollup_columns()
+            }
+            if not needed <= cube_columns:
+                cube = None
+
+        def compute() -> dict[str, pl.DataFrame]:
+            if cube is not None:
+                return evaluate(cube, groupings, rollup=True)
+            return self._evaluate(dataset, filters, groupings)
+
+        return dict(self._cached(dataset, filters, ("evaluate", groupings), compute))
+
+    def top_k(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        k: int,
+        by: str = "value",
+        group_col: str | None = None,
+        columns: list[str] | None = None,
+    ) -> pl.DataFrame:
+        """Get the matching rows with the largest values, overall or per group.
+
+        Answered from the dataset's per-cell top-k index when the filters
+        select whole cells and ``k`` fits in it, so no fact-table row is read.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+            k: Number of rows to keep (per group with ``group_col``).
+            by: Column to rank rows by, largest first.
+            group_col: Optional column to select the top rows within.
+            columns: Optional columns to return; all columns by default.
+
+        Returns:
+            DataFrame sorted by ``by`` descending (within ``group_col``
+            ascending when grouped).
+        """
+        use_index = (
+            dataset.top_index is not None
+            and by == "value"
+            and k <= TOP_K_INDEX_SIZE
+            and can_use_rollup(filters)
+            and (group_col is None or group_col in ROLLUP_DIMENSIONS)
+        )
+
+        def compute() -> pl.DataFrame:
+            if use_index:
+                result = top_k(apply_filters(dataset.top_index.lazy(), filters), k, by, group_col)
+            else:
+                result = self._top_k(dataset, filters, k, by, group_col)
+            return result.select(columns) if columns else result
+
+        spec = ("top_k", k, by, group_col, tuple(columns or ()))
+        return self._cached(dataset, filters, spec, compute)
+
+    def count_rows(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        columns: list[str],
+        search: str | None = None,
+    ) -> int:
+        """Count the matching rows of a table, with an optional text search.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+            columns: Columns of the table; the search looks into its text ones.
+            search: Optional case-insensitive text to look for.
+
+        Returns:
+            Number of matching rows.
+        """
+        if not search:
+            return self.count(dataset, filters)
+
+        def compute() -> int:
+            return self._count_rows(dataset, filters, columns, search)
+
+        return self._cached(dataset, filters, ("count_rows", tuple(columns), search), compute)
+
+    def page(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        columns: list[str],
+        page: int,
+        page_size: int,
+        sort_col: str | None = None,
+        descending: bool = False,
+        search: str | None = None,
+    ) -> pl.DataFrame:
+        """Get one page of matching rows for a paginated table.
+
+        Only the rows of the page leave the backend; ties in ``sort_col``
+        keep the dataset's row order, so consecutive pages never overlap.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+            columns: Columns of the table.
+            page: 1-based page number.
+            page_size: Rows per page.
+            sort_col: Optional column to sort by, nulls last.
+            descending: Sort in descending order.
+            search: Optional case-insensitive text to look for in the text
+                columns.
+
+        Returns:
+            DataFrame with at most ``page_size`` rows.
+        """
+        search = search or None
+
+        def compute() -> pl.DataFrame:
+            return self._page(
+                dataset, filters, columns, page, page_size, sort_col, descending, search
+            )
+
+        spec = ("page", tuple(columns), page, page_size, sort_col, descending, search)
+        return self._cached(dataset, filters, spec, compute)
+
+    @abstractmethod
+    def filter(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        columns: list[str] | None = None,
+    ) -> pl.LazyFrame:
+        """Select matching rows.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+            columns: Optional columns to keep; all columns by default.
+
+        Returns:
+            LazyFrame over the matching rows.
+        """
+
+    @abstractmethod
+    def export(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        path: str | Path,
+        fmt: str = "csv",
+        limit: int | None = None,
+    ) -> Path:
+        """Stream the matching rows to a file, with bounded memory.
+
+        Args:
+            dataset: Dataset to query.
+            filters: Filter dict.
+            path: Destination file.
+            fmt: One of ``EXPORT_FORMATS``.
+            limit: Optional maximum number of rows to write.
+
+        Returns:
+            Path of the written file.
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+
+    @abstractmethod
+    def _summary(self, dataset: Dataset, filters: dict[str, Any], value_col: str) -> dict:
+        """Summary statistics over raw rows."""
+
+    @abstractmethod
+    def _count(self, dataset: Dataset, filters: dict[str, Any]) -> int:
+        """Row count over raw rows."""
+
+    @abstractmethod
+    def _aggregate(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        group_col: str,
+        value_col: str,
+        agg: str,
+    ) -> pl.DataFrame:
+        """Grouped aggregate over raw rows."""
+
+    @abstractmethod
+    def _group_stats(
+        self, dataset: Dataset, filters: dict[str, Any], group_col: str, value_col: str
+    ) -> pl.DataFrame:
+        """Grouped total/average/count over raw rows."""
+
+    @abstractmethod
+    def _evaluate(
+        self, dataset: Dataset, filters: dict[str, Any], groupings: tuple[Grouping, ...]
+    ) -> dict[str, pl.DataFrame]:
+        """Groupings of metrics over raw rows."""
+
+    @abstractmethod
+    def _top_k(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        k: int,
+        by: str,
+        group_col: str | None,
+    ) -> pl.DataFrame:
+        """Top rows over raw rows."""
+
+    @abstractmethod
+    def _count_rows(
+        self, dataset: Dataset, filters: dict[str, Any], columns: list[str], search: str
+    ) -> int:
+        """Row count of a table search over raw rows."""
+
+    @abstractmethod
+    def _page(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        columns: list[str],
+        page: int,
+        page_size: int,
+        sort_col: str | None,
+        descending: bool,
+        search: str | None,
+    ) -> pl.DataFrame:
+        """One page of a table over raw rows."""
+
+
+class PolarsEngine(QueryEngine):
+    """Engine building lazy Polars plans over the dataset's frame or files."""
+
+    name = "polars"
+
+    def filter(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        columns: list[str] | None = None,
+    ) -> pl.LazyFrame:
+        # Filtering the eager frame itself lets a date range on the sorted
+        # date column resolve to a binary-searched slice instead of a scan.
+        source = dataset.scan() if dataset.is_lazy else dataset.frame
+        filtered = apply_filters(source, filters).lazy()
+        return filtered.select(columns) if columns else filtered
+
+    def export(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        path: str | Path,
+        fmt: str = "csv",
+        limit: int | None = None,
+    ) -> Path:
+        lf = self.filter(dataset, filters)
+        return export_to_file(lf if limit is None else lf.head(limit), path, fmt)
+
+    def _summary(self, dataset: Dataset, filters: dict[str, Any], value_col: str) -> dict:
+        return compute_summary(self.filter(dataset, filters), value_col)
+
+    def _count(self, dataset: Dataset, filters: dict[str, Any]) -> int:
+        return self.filter(dataset, filters).select(pl.len()).collect().item()
+
+    def _aggregate(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        group_col: str,
+        value_col: str,
+        agg: str,
+    ) -> pl.DataFrame:
+        return aggregate_by_column(self.filter(dataset, filters), group_col, value_col, agg)
+
+    def _group_stats(
+        self, dataset: Dataset, filters: dict[str, Any], group_col: str, value_col: str
+    ) -> pl.DataFrame:
+        return compute_group_stats(self.filter(dataset, filters), group_col, value_col)
+
+    def _evaluate(
+        self, dataset: Dataset, filters: dict[str, Any], groupings: tuple[Grouping, ...]
+    ) -> dict[str, pl.DataFrame]:
+        return evaluate(self.filter(dataset, filters), groupings)
+
+    def _top_k(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        k: int,
+        by: str,
+        group_col: str | None,
+    ) -> pl.DataFrame:
+        return top_k(self.filter(dataset, filters), k, by, group_col)
+
+    def _count_rows(
+        self, dataset: Dataset, filters: dict[str, Any], columns: list[str], search: str
+    ) -> int:
+        return count_matches(self.filter(dataset, filters, columns), search)
+
+    def _page(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        columns: list[str],
+        page: int,
+        page_size: int,
+        sort_col: str | None,
+        descending: bool,
+        search: str | None,
+    ) -> pl.DataFrame:
+        lf = self.filter(dataset, filters, columns)
+        return fetch_page(lf, page, page_size, sort_col, descending, search)
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column name for SQL."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class DuckDBEngine(QueryEngine):
+    """Engine running SQL over the dataset's Parquet files with DuckDB.
+
+    Queries never touch the in-memory frame, so DuckDB's out-of-core
+    execution can serve datasets larger than the worker's RAM.
+    """
+
+    name = "duckdb"
+
+    def __init__(self, memory_limit: str | None = None, threads: int | None = None):
+        """Initialize the engine with one shared in-process database.
+
+        Args:
+            memory_limit: Optional DuckDB memory limit (e.g. "4GB"); beyond it
+                operators spill to disk.
+            threads: Optional number of DuckDB worker threads.
+        """
+        config = {}
+        if memory_limit:
+            config["memory_limit"] = memory_limit
+        if threads:
+            config["threads"] = threads
+
+        self._connection = duckdb.connect(config=config)
+        self._lock = threading.Lock()
+
+    def _execute(self, sql: str, params: list) -> pl.DataFrame:
+        """Run a query on a cursor of its own so threads can query concurrently."""
+        with self._lock:
+            cursor = self._connection.cursor()
+
+        try:
+            return cursor.execute(sql, params).pl()
+        finally:
+            cursor.close()
+
+    def _source(self, dataset: Dataset, row_ids: bool = False) -> tuple[str, list]:
+        """SQL table expression reading the dataset's Parquet files.
+
+        With ``row_ids``, the ``filename`` and ``file_row_number`` columns
+        locate each row, to order ties the way the files store them.
+        """
+        files = [str(f) for f in dataset.files]
+        options = ""
+
+        if dataset.path.is_dir():
+            options += ", hive_partitioning = true, hive_types_autocast = false"
+        if row_ids:
+            options += ", filename = true, file_row_number = true"
+
+        return f"read_parquet(?{options})", [files]
+
+    def _where(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        conditions: tuple[tuple[str, list], ...] = (),
+        date_col: str = "date",
+    ) -> tuple[str, list]:
+        """Translate a filter dict to a WHERE clause, mirroring ``apply_filters``.
+
+        ``conditions`` are extra ``(clause, params)`` pairs ANDed with the filters.
+        """
+        columns = set(dataset.scan().collect_schema().names())
+        clauses, params = [], []
+        date = _quote_identifier(date_col)
+        month = _quote_identifier(MONTH_PARTITION_COL)
+
+        if "start_date" in filters and date_col in columns:
+            clauses.append(f"{date} >= ?")
+            params.append(filters["start_date"])
+
+            if MONTH_PARTITION_COL in columns:
+                clauses.append(f"{month} >= ?")
+                params.append(filters["start_date"].strftime("%Y-%m"))
+
+        if "end_date" in filters and date_col in columns:
+            clauses.append(f"{date} <= ?")
+            params.append(filters["end_date"])
+
+            if MONTH_PARTITION_COL in columns:
+                clauses.append(f"{month} <= ?")
+                params.append(filters["end_date"].strftime("%Y-%m"))
+
+        for key in ("category", "region"):
+            if key in filters and key in columns:
+                clauses.append(f"{_quote_identifier(key)} = ?")
+                params.append(filters[key])
+
+        for clause, clause_params in conditions:
+            clauses.append(clause)
+            params.extend(clause_params)
+
+        if not clauses:
+            return "", params
+
+        return " WHERE " + " AND ".join(clauses), params
+
+    def _query(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        select: str,
+        suffix: str = "",
+        conditions: tuple[tuple[str, list], ...] = (),
+        row_ids: bool = False,
+        suffix_params: list | None = None,
+    ) -> pl.DataFrame:
+        """Run ``SELECT {select} FROM <dataset> WHERE <filters> {suffix}``.
+
+        ``suffix_params`` bind the placeholders of ``suffix``.
+        """
+        source, source_params = self._source(dataset, row_ids)
+        where, where_params = self._where(dataset, filters, conditions)
+        sql = f"SELECT {select} FROM {source}{where} {suffix}"
+        return self._execute(sql, source_params + where_params + (suffix_params or []))
+
+    def filter(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        columns: list[str] | None = None,
+    ) -> pl.LazyFrame:
+        select = ", ".join(_quote_identifier(c) for c in columns) if columns else "*"
+        return self._query(dataset, filters, select).lazy()
+
+    def export(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        path: str | Path,
+        fmt: str = "csv",
+        limit: int | None = None,
+    ) -> Path:
+        validate_format(fmt)
+        path = Path(path)
+        source, source_params = self._source(dataset)
+        where, where_params = self._where(dataset, filters)
+        sql = f"SELECT * FROM {source}{where}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        params = source_params + where_params
+
+        with self._lock:
+            cursor = self._connection.cursor()
+
+        try:
+            if fmt == "arrow":
+                # DuckDB has no Arrow IPC writer; fetch the result batch by batch.
+                reader = cursor.execute(sql, params).fetch_record_batch(EXPORT_BATCH_ROWS)
+                with (
+                    pa.OSFile(str(path), "wb") as sink,
+                    pa.ipc.new_file(sink, reader.schema) as out,
+                ):
+                    for batch in reader:
+                        out.write_batch(batch)
+            else:
+                options = "FORMAT csv, HEADER" if fmt == "csv" else "FORMAT parquet"
+                target = "'" + str(path).replace("'", "''") + "'"
+                cursor.execute(f"COPY ({sql}) TO {target} ({options})", params)
+        finally:
+            cursor.close()
+
+        logger.info(f"Exported {fmt} -> {path} ({path.stat().st_size} bytes)")
+        return path
+
+    def _summary(self, dataset: Dataset, filters: dict[str, Any], value_col: str) -> dict:
+        value = _quote_identifier(value_col)
+        stats = self._query(
+            dataset,
+            filters,
+            f"sum({value}) AS total, avg({value}) AS mean, count(*) AS count, "
+            f"min({value}) AS min, max({value}) AS max",
+        ).row(0, named=True)
+
+        if not stats["count"]:
+            return {}
+
+        return {
+            "total": float(stats["total"]),
+            "mean": float(stats["mean"]),
+            "count": stats["count"],
+            "min": float(stats["min"]),
+            "max": float(stats["max"]),
+        }
+
+    def _count(self, dataset: Dataset, filters: dict[str, Any]) -> int:
+        return self._query(dataset, filters, "count(*)").item()
+
+    def _aggregate(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        group_col: str,
+        value_col: str,
+        agg: str,
+    ) -> pl.DataFrame:
+        group = _quote_identifier(group_col)
+        value = _quote_identifier(value_col)
+        agg_funcs = {
+            "sum": f"sum({value})",
+            "mean": f"avg({value})",
+            "count": "count(*)",
+        }
+        agg_func = agg_funcs.get(agg, agg_funcs["sum"])
+
+        result = self._query(
+            dataset,
+            filters,
+            f"{group}, {agg_func} AS {value}",
+            f"GROUP BY {group} ORDER BY {value} DESC",
+        )
+
+        if result.is_empty():
+            return pl.DataFrame()
+
+        if agg == "count":
+            result = result.with_columns(pl.col(value_col).cast(pl.UInt32))
+
+        return result
+
+    def _group_stats(
+        self, dataset: Dataset, filters: dict[str, Any], group_col: str, value_col: str
+    ) -> pl.DataFrame:
+        group = _quote_identifier(group_col)
+        value = _quote_identifier(value_col)
+
+        return self._query(
+            dataset,
+            filters,
+            f"{group}, sum({value}) AS total, avg({value}) AS average, count(*) AS count",
+            f"GROUP BY {group} ORDER BY total DESC",
+        ).with_columns(pl.col("count").cast(pl.UInt32))
+
+    def _evaluate(
+        self, dataset: Dataset, filters: dict[str, Any], groupings: tuple[Grouping, ...]
+    ) -> dict[str, pl.DataFrame]:
+        # One GROUPING SETS query computes every grouping in a single scan.
+        keys = list(dict.fromkeys(c for g in groupings for c in g.by))
+        metrics = list(dict.fromkeys(m for g in groupings for m in g.metrics))
+        aggs = {
+            "sum": "coalesce(sum({}), 0)",
+            "mean": "avg({})",
+            "count": "count({})",
+            "min": "min({})",
+            "max": "max({})",
+        }
+
+        select = [_quote_identifier(c) for c in keys]
+        for i, m in enumerate(metrics):
+            sql = "count(*)" if m.agg == "len" else aggs[m.agg].format(_quote_identifier(m.column))
+            select.append(f"{sql} AS m{i}")
+
+        quoted = ", ".join(_quote_identifier(c) for c in keys)
+        if keys:
+            select.append(f"GROUPING({quoted}) AS grouping_id")
+        sets = ", ".join(
+            "(" + ", ".join(_quote_identifier(c) for c in by) + ")"
+            for by in dict.fromkeys(g.by for g in groupings)
+        )
+        suffix = f"GROUP BY GROUPING SETS ({sets})" if keys else ""
+
+        result = self._query(dataset, filters, ", ".join(select), suffix)
+
+        results = {}
+        for g in groupings:
+            rows = result
+            if keys:
+                mask = sum(1 << (len(keys) - 1 - i) for i, c in enumerate(keys) if c not in g.by)
+                rows = rows.filter(pl.col("grouping_id") == mask)
+
+            rows = rows.rename({f"m{metrics.index(m)}": m.alias for m in g.metrics})
+            counts = [m.alias for m in g.metrics if m.agg in ("count", "len")]
+            results[g.name] = g.finish(rows.with_columns(pl.col(counts).cast(pl.UInt32)))
+
+        return results
+
+    def _top_k(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        k: int,
+        by: str,
+        group_col: str | None,
+    ) -> pl.DataFrame:
+        order = _quote_identifier(by)
+        # Like ``top_k``, rows without a value are never selected.
+        ranked = ((f"{order} IS NOT NULL", []),)
+
+        if group_col is None:
+            return self._query(
+                dataset, filters, "*", f"ORDER BY {order} DESC LIMIT {int(k)}", ranked
+            )
+
+        group = _quote_identifier(group_col)
+        return self._query(
+            dataset,
+            filters,
+            "*",
+            f"QUALIFY row_number() OVER (PARTITION BY {group} ORDER BY {order} DESC) <= {int(k)} "
+            f"ORDER BY {group}, {order} DESC",
+            ranked,
+        )
+
+    def _search(
+        self, dataset: Dataset, columns: list[str], search: str | None
+    ) -> tuple[tuple[str, list], ...]:
+        """Condition mirroring ``search_rows``: a text column contains ``search``."""
+        text = text_columns(dataset.scan().collect_schema(), columns) if search else []
+
+        if not text:
+            return ()
+
+        clause = " OR ".join(
+            f"contains(lower(CAST({_quote_identifier(c)} AS VARCHAR)), ?)" for c in text
+        )
+        return ((f"({clause})", [search.lower()] * len(text)),)
+
+    def _count_rows(
+        self, dataset: Dataset, filters: dict[str, Any], columns: list[str], search: str
+    ) -> int:
+        return self._query(
+            dataset, filters, "count(*)", conditions=self._search(dataset, columns, search)
+        ).item()
+
+    def _page(
+        self,
+        dataset: Dataset,
+        filters: dict[str, Any],
+        columns: list[str],
+        page: int,
+        page_size: int,
+        sort_col: str | None,
+        descending: bool,
+        search: str | None,
+    ) -> pl.DataFrame:
+        order, order_params = "", []
+        if sort_col:
+            # Ties keep the dataset's row order: the files in manifest order,
+            # as the Polars scan reads them, then rows within each file.
+            direction = "DESC" if descending else "ASC"
+            order = (
+                f"ORDER BY {_quote_identifier(sort_col)} {direction} NULLS LAST, "
+                "list_position(?, filename), file_row_number "
+            )
+            order_params = [[str(f) for f in dataset.files]]
+
+        offset = (max(page, 1) - 1) * page_size
+        return self._query(
+            dataset,
+            filters,
+            ", ".join(_quote_identifier(c) for c in columns),
+            f"{order}LIMIT {int(page_size)} OFFSET {int(offset)}",
+            self._search(dataset, columns, search),
+            row_ids=bool(sort_col),
+            suffix_params=order_params,
+        )
+
+
+ENGINES: dict[str, type[QueryEngine]] = {
+    PolarsEngine.name: PolarsEngine,
+    DuckDBEngine.name: DuckDBEngine,
+}
+
+
+@st.cache_resource
+def _create_engine(name: str) -> QueryEngine:
+    """Create the process-wide instance of an engine."""
+    if name not in ENGINES:
+        raise ValueError(f"Unknown query engine: {name!r} (expected one of {list(ENGINES)})")
+
+    if name == DuckDBEngine.name:
+        settings = get_settings()
+        return DuckDBEngine(memory_limit=settings.duckdb_memory_limit)
+
+    return ENGINES[name]()
+
+
+def get_engine(name: str | None = None) -> QueryEngine:
+    """Get the query engine selected in settings.
+
+    Args:
+        name: Engine name overriding ``Settings.query_engine``.
+
+    Returns:
+        Shared engine instance.
+    """
+    return _create_engine(name or get_settings().query_engine)
@@ -0,0 +1,136 @@
+"""Bounded thread pool running independent queries concurrently."""
+
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+import streamlit as st
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryTimeoutError(TimeoutError):
+    """A query did not finish within its timeout."""
+
+
+class QueryExecutor:
+    """Shared, bounded pool for the queries of concurrent page runs.
+
+    Polars and DuckDB release the GIL while they compute, so queries
+    submitted together overlap and a page waits roughly as long as its
+    slowest query. Queries are grouped by owner (a session); a new run of
+    the same owner supersedes the previous one and cancels its queries that
+    have not started yet.
+    """
+
+    def __init__(self, max_workers: int = 4, timeout: float | None = None):
+        """Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of queries running at once.
+            timeout: Default seconds to wait for a result; None waits forever.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="query")
+        self._pending: dict[Hashable, set[Future]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, owner: Hashable, func: Callable, *args, **kwargs) -> Future:
+        """Queue a query.
+
+        Args:
+            owner: Key of the run the query belongs to, e.g. a session id.
+            func: Callable running the query.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            Future of the query result.
+        """
+        future = self._pool.submit(func, *args, **kwargs)
+
+        with self._lock:
+            self._pending.setdefault(owner, set()).add(future)
+
+        future.add_done_callback(lambda f: self._forget(owner, f))
+        return future
+
+    def _forget(self, owner: Hashable, future: Future) -> None:
+        """Stop tracking a finished query."""
+        with self._lock:
+            futures = self._pending.get(owner)
+            if futures is not None:
+                futures.discard(future)
+                if not futures:
+                    del self._pending[owner]
+
+    def supersede(self, owner: Hashable) -> int:
+        """Cancel the queued queries of an owner's previous run.
+
+        Queries already running finish in the background; their results
+        still reach the query cache.
+
+        Args:
+            owner: Key of the run being replaced.
+
+        Returns:
+            Number of queries cancelled.
+        """
+        with self._lock:
+            futures = list(self._pending.get(owner, ()))
+
+        cancelled = sum(f.cancel() for f in futures)
+        if cancelled:
+            logger.debug(f"Cancelled {cancelled} superseded queries of {owner}")
+        return cancelled
+
+    def result(self, future: Future, timeout: float | None = None) -> Any:
+        """Wait for a query result.
+
+        Args:
+            future: Future returned by ``submit``.
+            timeout: Seconds to wait; the executor's default if None.
+
+        Returns:
+            Query result.
+
+        Raises:
+            QueryTimeoutError: If the query did not finish in time; it is
+                cancelled if it had not started yet.
+            CancelledError: If the query was superseded.
+        """
+        timeout = self.timeout if timeout is None else timeout
+
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise QueryTimeoutError(f"Query did not finish within {timeout}s") from None
+
+    @property
+    def pending(self) -> int:
+        """Number of queued or running queries."""
+        with self._lock:
+            return sum(not f.done() for futures in self._pending.values() for f in futures)
+
+    def shutdown(self) -> None:
+        """Cancel queued queries and stop the workers."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+@st.cache_resource
+def get_query_executor() -> QueryExecutor:
+    """Get the process-wide query executor shared by all sessions."""
+    settings = get_settings()
+    timeout = settings.query_timeout or None
+    logger.info(f"Creating query executor with {settings.query_workers} workers")
+    return QueryExecutor(max_workers=settings.query_workers, timeout=timeout)
@@ -0,0 +1,103 @@
+"""Streaming export of query results to CSV, Parquet and Arrow IPC."""
+
+import logging
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    """A file format offered for download."""
+
+    label: str
+    extension: str
+    mime: str
+
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("CSV", ".csv", "text/csv"),
+    "parquet": ExportFormat("Parquet", ".parquet", "application/vnd.apache.parquet"),
+    "arrow": ExportFormat("Arrow IPC", ".arrow", "application/vnd.apache.arrow.file"),
+}
+
+
+def validate_format(fmt: str) -> None:
+    """Check an export format is supported.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt!r} (expected one of {list(EXPORT_FORMATS)})")
+
+
+def export_to_file(lf: pl.LazyFrame, path: str | Path, fmt: str = "csv") -> Path:
+    """Stream a query result to a file.
+
+    The plan runs on the streaming engine and rows are written batch by
+    batch, so memory stays bounded whatever the result size.
+
+    Args:
+        lf: LazyFrame with the rows to export.
+        path: Destination file.
+        fmt: One of ``EXPORT_FORMATS``.
+
+    Returns:
+        Path of the written file.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    validate_format(fmt)
+    path = Path(path)
+    lf = lf.lazy()
+
+    if fmt == "csv":
+        lf.sink_csv(path)
+    elif fmt == "parquet":
+        lf.sink_parquet(path)
+    else:
+        lf.sink_ipc(path)
+
+    logger.info(f"Exported {fmt} -> {path} ({path.stat().st_size} bytes)")
+    return path
+
+
+def export_bytes(lf: pl.LazyFrame, fmt: str = "csv") -> bytes:
+    """Export a query result through a temporary file and return its contents.
+
+    Args:
+        lf: LazyFrame with the rows to export.
+        fmt: One of ``EXPORT_FORMATS``.
+
+    Returns:
+        File contents.
+    """
+    return read_export(lambda path: export_to_file(lf, path, fmt), fmt)
+
+
+def read_export(write: Callable[[Path], Path], fmt: str = "csv") -> bytes:
+    """Run an export into a temporary file and return its contents.
+
+    The file is written with bounded memory, but the contents are returned
+    whole: Streamlit keeps download data in memory until it is sent, so the
+    caller caps the number of rows exported.
+
+    Args:
+        write: Function streaming the export to the path it is given, e.g.
+            ``QueryEngine.export`` with its other arguments bound.
+        fmt: One of ``EXPORT_FORMATS``.
+
+    Returns:
+        File contents.
+    """
+    validate_format(fmt)
+    with tempfile.TemporaryDirectory(prefix="export-") as tmp:
+        path = write(Path(tmp) / f"export{EXPORT_FORMATS[fmt].extension}")
+        return Path(path).read_bytes()
@@ -0,0 +1,215 @@
+"""Per-version index of column statistics for filter widgets."""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Columns with more distinct values than this keep bounds but no value list.
+MAX_INDEXED_VALUES = 10_000
+
+_DIMENSION_TYPES = (pl.String, pl.Categorical, pl.Enum, pl.Boolean)
+
+
+@dataclass(frozen=True)
+class ColumnStats:
+    """Statistics for one column.
+
+    ``values`` and ``counts`` hold the sorted distinct non-null values and
+    their row counts, or are None for measures and high-cardinality columns.
+    """
+
+    min: Any = None
+    max: Any = None
+    null_count: int = 0
+    values: tuple | None = None
+    counts: tuple[int, ...] | None = None
+
+
+@dataclass(frozen=True)
+class DimensionIndex:
+    """Column statistics of one dataset version.
+
+    Built once when the version is loaded, so filter widgets read their
+    options and bounds without scanning the data.
+    """
+
+    n_rows: int
+    columns: dict[str, ColumnStats] = field(default_factory=dict)
+
+    def unique_values(self, column: str) -> list:
+        """Sorted distinct non-null values of a column.
+
+        Args:
+            column: Column name.
+
+        Returns:
+            List of values, empty if the column has no value list.
+        """
+        stats = self.columns.get(column)
+        return list(stats.values) if stats is not None and stats.values is not None else []
+
+    def value_counts(self, column: str) -> dict:
+        """Row count per distinct value of a column.
+
+        Args:
+            column: Column name.
+
+        Returns:
+            Mapping of value to row count, empty if the column has no value list.
+        """
+        stats = self.columns.get(column)
+        if stats is None or stats.values is None:
+            return {}
+        return dict(zip(stats.values, stats.counts, strict=True))
+
+    def bounds(self, column: str) -> tuple:
+        """Minimum and maximum of a column.
+
+        Args:
+            column: Column name.
+
+        Returns:
+            Tuple of (min, max), (None, None) for an unknown column.
+        """
+        stats = self.columns.get(column)
+        return (stats.min, stats.max) if stats is not None else (None, None)
+
+
+def _parquet_bounds(files: list[Path]) -> dict[str, tuple]:
+    """Column bounds from Parquet row-group statistics.
+
+    Only columns with min/max statistics in every row group of every file
+    are returned.
+
+    Args:
+        files: Parquet files of the dataset.
+
+    Returns:
+        Mapping of column name to (min, max).
+    """
+    bounds: dict[str, tuple] = {}
+    incomplete: set[str] = set()
+
+    for file in files:
+        metadata = pq.ParquetFile(file).metadata
+
+        for rg in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg)
+
+            for i in range(row_group.num_columns):
+                column = row_group.column(i)
+                name = column.path_in_schema
+                statistics = column.statistics
+
+                if statistics is None or not statistics.has_min_max:
+                    incomplete.add(name)
+                    continue
+
+                if name in bounds:
+                    low, high = bounds[name]
+                    bounds[name] = (min(low, statistics.min), max(high, statistics.max))
+                else:
+                    bounds[name] = (statistics.min, statistics.max)
+
+    return {name: b for name, b in bounds.items() if name not in incomplete}
+
+
+def build_index(
+    lf: pl.LazyFrame,
+    files: list[Path] | None = None,
+    max_values: int = MAX_INDEXED_VALUES,
+) -> DimensionIndex:
+    """Build the column index of a dataset in one pass over the data.
+
+    Bounds of numeric and temporal file columns come from Parquet statistics
+    when ``files`` is given; everything else is computed from ``lf``.
+
+    Args:
+        lf: LazyFrame over the dataset (or DataFrame).
+        files: Parquet files backing ``lf``, to read bounds from their footers.
+        max_values: Cardinality above which a column keeps no value list.
+
+    Returns:
+        DimensionIndex of the dataset.
+    """
+    lf = lf.lazy()
+    schema = lf.collect_schema()
+    dimensions = [name for name, dtype in schema.items() if isinstance(dtype, _DIMENSION_TYPES)]
+    # String statistics may be truncated by the writer, so only measures use them.
+    footer_bounds = {
+        name: bounds
+        for name, bounds in (_parquet_bounds(files) if files else {}).items()
+        if name in schema and name not in dimensions
+    }
+
+    computed = [name for name in schema.names() if name not in footer_bounds]
+    overview = lf.select(
+        pl.len().alias("__rows"),
+        *(pl.col(c).null_count().alias(f"{c}__nulls") for c in schema.names()),
+        *(pl.col(c).min().alias(f"{c}__min") for c in computed),
+        *(pl.col(c).max().alias(f"{c}__max") for c in computed),
+        *(pl.col(c).n_unique().alias(f"{c}__distinct") for c in dimensions),
+    )
+    row = overview.collect().row(0, named=True)
+
+    indexed = [c for c in dimensions if row[f"{c}__distinct"] <= max_values]
+    value_counts = pl.collect_all(
+        [lf.group_by(c).agg(pl.len().alias("count")).drop_nulls(c).sort(c) for c in indexed]
+    )
+    counts = dict(zip(indexed, value_counts, strict=True))
+
+    columns = {}
+    for name in schema.names():
+        low, high = footer_bounds.get(name, (row.get(f"{name}__min"), row.get(f"{name}__max")))
+        column_counts = counts.get(name)
+        columns[name] = ColumnStats(
+            min=low,
+            max=high,
+            null_count=row[f"{name}__nulls"],
+            values=tuple(column_counts[name].to_list()) if column_counts is not None else None,
+            counts=tuple(column_counts["count"].to_list()) if column_counts is not None else None,
+        )
+
+    logger.info(f"Indexed {len(columns)} columns ({len(indexed)} with values)")
+    return DimensionIndex(n_rows=row["__rows"], columns=columns)
+
+
+def merge_indexes(base: DimensionIndex, delta: DimensionIndex) -> DimensionIndex:
+    """Combine the index of a dataset with the index of appended rows.
+
+    Args:
+        base: Index of the existing rows.
+        delta: Index of the appended rows, with the same columns.
+
+    Returns:
+        Index of all rows.
+    """
+    columns = {}
+
+    for name, old in base.columns.items():
+        new = delta.columns.get(name, ColumnStats(null_count=delta.n_rows))
+        bounds = [b for b in (old.min, old.max, new.min, new.max) if b is not None]
+
+        values = counts = None
+        if old.values is not None and new.values is not None:
+            merged = dict(zip(old.values, old.counts, strict=True))
+            for value, count in zip(new.values, new.counts, strict=True):
+                merged[value] = merged.get(value, 0) + count
+            values = tuple(sorted(merged))
+            counts = tuple(merged[v] for v in values)
+
+        columns[name] = ColumnStats(
+            min=min(bounds) if bounds else None,
+            max=max(bounds) if bounds else None,
+            null_count=old.null_count + new.null_count,
+            values=values,
+            counts=counts,
+        )
+
+    return DimensionIndex(n_rows=base.n_rows + delta.n_rows, columns=columns)
@@ -0,0 +1,179 @@
+"""Baseline and comparison-period KPIs for the growth deltas."""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+from src.data.loader import compute_summary
+from src.data.rollup import summary_from_rollup
+
+if TYPE_CHECKING:
+    from src.data.dataset import Dataset
+    from src.data.engine import QueryEngine
+
+# Comparison name -> label shown next to the deltas.
+COMPARISONS = {
+    "dataset": "Full dataset",
+    "previous_period": "Previous period",
+    "last_year": "Same period last year",
+}
+
+
+@dataclass(frozen=True)
+class Baseline:
+    """Filter-independent aggregates of one dataset version.
+
+    Attributes:
+        summary: Summary statistics of the full dataset.
+        start: First date of the dataset.
+        end: Last date of the dataset.
+    """
+
+    summary: dict
+    start: date | None = None
+    end: date | None = None
+
+
+def build_baseline(
+    df: pl.DataFrame | pl.LazyFrame,
+    bounds: tuple = (None, None),
+    rollup: bool = False,
+    value_col: str = "value",
+) -> Baseline:
+    """Compute the baseline of a dataset version.
+
+    Args:
+        df: All rows of the dataset, or its rollup cells with ``rollup``.
+        bounds: (min, max) of the date column, e.g. from the column index.
+        rollup: ``df`` holds rollup cells instead of rows.
+        value_col: Column to summarize.
+
+    Returns:
+        Baseline of the dataset.
+    """
+    summary = summary_from_rollup(df, value_col) if rollup else compute_summary(df, value_col)
+    start, end = bounds
+    return Baseline(summary=summary, start=start, end=end)
+
+
+def get_baseline(engine: "QueryEngine", dataset: "Dataset") -> Baseline:
+    """Get the baseline stored with a dataset version.
+
+    Datasets loaded without one fall back to a cached engine query.
+
+    Args:
+        engine: Query engine.
+        dataset: Dataset to query.
+
+    Returns:
+        Baseline of the dataset.
+    """
+    if dataset.baseline is not None:
+        return dataset.baseline
+
+    bounds = dataset.index.bounds("date") if dataset.index is not None else (None, None)
+    return Baseline(engine.summary(dataset, {}), *bounds)
+
+
+def _minus_one_year(day: date) -> date:
+    """Same day one year earlier, Feb 29 mapping to Feb 28."""
+    try:
+        return day.replace(year=day.year - 1)
+    except ValueError:
+        return day.replace(year=day.year - 1, day=28)
+
+
+def comparison_filters(
+    filters: dict[str, Any], comparison: str, baseline: Baseline
+) -> dict[str, Any] | None:
+    """Shift the date window of a filter set to a comparison period.
+
+    Non-date filters are kept, so the comparison covers the same slice of
+    the data. Open ends of the window default to the dataset's date range.
+
+    Args:
+        filters: Filter dict as returned by ``render_filter_sidebar``.
+        comparison: "previous_period" or "last_year".
+        baseline: Baseline of the dataset.
+
+    Returns:
+        Filter dict of the comparison period, or None if there is no date
+        window to shift.
+
+    Raises:
+        ValueError: If the comparison is unknown.
+    """
+    if comparison not in ("previous_period", "last_year"):
+        raise ValueError(
+            f"Unknown comparison: {comparison!r} (expected one of {list(COMPARISONS)})"
+        )
+
+    start = filters.get("start_date", baseline.start)
+    end = filters.get("end_date", baseline.end)
+
+    if start is None or end is None:
+        return None
+
+    if comparison == "previous_period":
+        length = end - start + timedelta(days=1)
+        start, end = start - length, start - timedelta(days=1)
+    else:
+        start, end = _minus_one_year(start), _minus_one_year(end)
+
+    return {**filters, "start_date": start, "end_date": end}
+
+
+def comparison_summary(
+    engine: "QueryEngine", dataset: "Dataset", filters: dict[str, Any], comparison: str
+) -> dict:
+    """Summary statistics to compare the filtered KPIs against.
+
+    The full-dataset baseline is precomputed with the dataset version; the
+    comparison periods are answered by the engine from the rollup cells and
+    cached per dataset version and period, so only the filtered side of the
+    KPIs is computed when filters change.
+
+    Args:
+        engine: Query engine.
+        dataset: Dataset to query.
+        filters: Filter dict of the current selection.
+        comparison: Name from ``COMPARISONS``.
+
+    Returns:
+        Summary dictionary, empty if the comparison period has no rows.
+
+    Raises:
+        ValueError: If the comparison is unknown.
+    """
+    baseline = get_baseline(engine, dataset)
+
+    if comparison == "dataset":
+        return baseline.summary
+
+    shifted = comparison_filters(filters, comparison, baseline)
+    if shifted is None:
+        return {}
+
+    return engine.summary(dataset, shifted)
+
+
+def growth(current: dict, reference: dict, key: str = "total") -> float | None:
+    """Relative change of a statistic against a reference summary.
+
+    Args:
+        current: Summary of the current selection.
+        reference: Summary to compare against.
+        key: Statistic to compare.
+
+    Returns:
+        Change as a fraction, or None if either side is missing or the
+        reference is not positive.
+    """
+    curr, prev = current.get(key), reference.get(key)
+
+    if not curr or not prev or prev <= 0:
+        return None
+
+    return (curr - prev) / prev
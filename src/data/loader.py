@@ -1,73 +1,356 @@
 """Data loading module with Streamlit caching."""
 
+import hashlib
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 
 import polars as pl
 import streamlit as st
 
+from src.data.dictionary import (
+    dimension_values,
+    encode_dimensions,
+    extend_dictionary,
+    label_sort_keys,
+    read_dictionary,
+)
+from src.data.manifest import read_manifest
+
 logger = logging.getLogger(__name__)
 
+# Hive partition keys written by ``refresh_data.py --partitioned``.
+MONTH_PARTITION_COL = "month"
+PARTITION_COLUMNS = (MONTH_PARTITION_COL, "region")
+
+# Rows kept per dimension cell by ``build_top_k_index``.
+TOP_K_INDEX_SIZE = 25
 
-@st.cache_data(ttl=3600)
-def load_data(path: str | Path) -> pl.DataFrame:
-    """Load data from Parquet file with Streamlit caching.
+
+def get_columns(df: pl.DataFrame | pl.LazyFrame) -> list[str]:
+    """Get column names without materializing a LazyFrame.
 
     Args:
-        path: Path to the Parquet file.
+        df: Input DataFrame or LazyFrame.
 
     Returns:
-        Polars DataFrame with the data.
+        List of column names.
+    """
+    if isinstance(df, pl.LazyFrame):
+        return df.collect_schema().names()
+
+    return df.columns
+
+
+def list_data_files(path: str | Path) -> list[Path]:
+    """List the Parquet files backing a dataset.
+
+    A dataset directory with a manifest is limited to the files it lists, so
+    files from an in-progress refresh are not picked up early.
+
+    Args:
+        path: Path to a Parquet file or a hive-partitioned dataset directory.
+
+    Returns:
+        Sorted list of Parquet files.
 
     Raises:
-        FileNotFoundError: If the file doesn't exist.
+        FileNotFoundError: If the path doesn't exist or holds no Parquet files.
     """
     path = Path(path)
 
     if not path.exists():
         raise FileNotFoundError(f"Data file not found: {path}")
 
+    if not path.is_dir():
+        return [path]
+
+    manifest = read_manifest(path)
+
+    if manifest is not None:
+        files = [path / entry.path for entry in manifest.files]
+    else:
+        files = sorted(path.rglob("*.parquet"))
+
+    if not files:
+        raise FileNotFoundError(f"No Parquet files found in: {path}")
+
+    return files
+
+
+def scan_data(path: str | Path) -> pl.LazyFrame:
+    """Build a lazy scan over a Parquet file or hive-partitioned dataset.
+
+    Filters and column selections applied to the returned LazyFrame are
+    pushed down into the Parquet reader, so row groups whose statistics
+    cannot match are skipped and unused columns are never decoded. For a
+    ``month=YYYY-MM/region=...`` directory, predicates on the partition
+    columns prune whole directories before any file is opened.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+
+    Returns:
+        Polars LazyFrame over the data.
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist or holds no Parquet files.
+    """
+    path = Path(path)
+
+    logger.debug(f"Scanning data from {path}")
+
+    return scan_files(list_data_files(path), hive_partitioning=path.is_dir())
+
+
+def scan_files(files: list[Path], hive_partitioning: bool = True) -> pl.LazyFrame:
+    """Build a lazy scan over an explicit list of Parquet files.
+
+    Args:
+        files: Parquet files to scan.
+        hive_partitioning: Whether to derive columns from ``key=value`` directories.
+
+    Returns:
+        Polars LazyFrame over the files.
+    """
+    if not hive_partitioning:
+        return pl.scan_parquet(files)
+
+    return pl.scan_parquet(files, hive_partitioning=True, try_parse_hive_dates=False)
+
+
+@lru_cache(maxsize=4096)
+def _footer_digest(path: str, size: int, mtime_ns: int, ctime_ns: int) -> str:
+    """Hash the Parquet footer of a file.
+
+    The stat fields are only part of the cache key, so the footer is re-read
+    whenever the file is touched, including copies that preserve mtime.
+    """
+    with open(path, "rb") as f:
+        f.seek(-min(size, 8), os.SEEK_END)
+        tail = f.read(8)
+        footer_len = int.from_bytes(tail[:4], "little") if tail.endswith(b"PAR1") else 0
+        footer_len = min(footer_len, size - len(tail))
+        f.seek(-(len(tail) + footer_len), os.SEEK_END)
+        footer = f.read(footer_len)
+
+    return hashlib.sha1(footer + tail).hexdigest()
+
+
+def files_fingerprint(files: list[Path]) -> str:
+    """Compute a fingerprint over a list of Parquet files.
+
+    Each file contributes its resolved path, size, modification time and a
+    hash of its Parquet footer (schema, row groups and statistics), so a
+    rewrite is detected even when size and mtime happen to match.
+
+    Args:
+        files: Files to fingerprint.
+
+    Returns:
+        Hex digest identifying this version of the files.
+    """
+    digest = hashlib.sha1()
+
+    for file in files:
+        resolved = str(file.resolve())
+        stat = os.stat(resolved)
+        footer = _footer_digest(resolved, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+        digest.update(f"{resolved}:{stat.st_size}:{stat.st_mtime_ns}:{footer}\n".encode())
+
+    return digest.hexdigest()[:16]
+
+
+def content_fingerprint(files: list[Path]) -> str:
+    """Compute a fingerprint over the contents of a list of Parquet files.
+
+    Only the Parquet footers (schema, row groups and statistics) count, not
+    where the files live, when they were written or in which order they are
+    listed, so files derived from the data, like the rollup, can record the
+    version they were built from.
+
+    Args:
+        files: Files to fingerprint.
+
+    Returns:
+        Hex digest identifying the files' contents.
+    """
+    digests = []
+
+    for file in files:
+        resolved = str(Path(file).resolve())
+        stat = os.stat(resolved)
+        digests.append(_footer_digest(resolved, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns))
+
+    return hashlib.sha1("\n".join(sorted(digests)).encode()).hexdigest()[:16]
+
+
+def dataset_fingerprint(path: str | Path) -> str:
+    """Compute a cheap fingerprint identifying the current version of a dataset.
+
+    Only file metadata is read, and footers only when a file's stat
+    changes, so this is safe to call on every rerun.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+
+    Returns:
+        Hex digest identifying this version of the dataset.
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist or holds no Parquet files.
+    """
+    return files_fingerprint(list_data_files(path))
+
+
+def mark_sorted(df: pl.DataFrame, column: str = "date") -> pl.DataFrame:
+    """Flag a column as sorted when its values are in ascending order.
+
+    The flag is metadata only; it lets ``apply_filters`` resolve ranges on
+    the column with a binary search instead of a full scan.
+
+    Args:
+        df: DataFrame to check.
+        column: Column to flag.
+
+    Returns:
+        The DataFrame, with the column flagged if it is sorted.
+    """
+    if column not in df.columns or df[column].null_count() or not df[column].is_sorted():
+        return df
+
+    return df.with_columns(pl.col(column).set_sorted())
+
+
+def read_data(path: str | Path) -> pl.DataFrame:
+    """Read a Parquet file or dataset directory into memory without caching.
+
+    Low-cardinality dimension columns are Enum-encoded with the dataset's
+    persisted dictionary, extended in memory with any label it lacks.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+
+    Returns:
+        Polars DataFrame with the data.
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist or holds no Parquet files.
+    """
     logger.info(f"Loading data from {path}")
-    df = pl.read_parquet(path)
+    df = mark_sorted(scan_data(path).collect())
+    values = dimension_values(df)
+    dictionary = extend_dictionary(read_dictionary(path), values)
+    df = encode_dimensions(df, {c: dictionary[c] for c in values if c in dictionary})
 
     logger.info(f"Loaded {len(df)} rows with columns: {df.columns}")
     return df
 
 
-@st.cache_data(ttl=3600)
-def compute_summary(df: pl.DataFrame, value_col: str = "value") -> dict:
-    """Compute summary statistics with caching.
+@st.cache_data(max_entries=4)
+def _load_data_version(path: str, fingerprint: str, lazy: bool) -> pl.DataFrame | pl.LazyFrame:
+    """Load one version of a dataset; the fingerprint only serves as cache key."""
+    if lazy:
+        return scan_data(path)
+
+    return read_data(path)
+
+
+def load_data(path: str | Path, lazy: bool = False) -> pl.DataFrame | pl.LazyFrame:
+    """Load data from Parquet file with Streamlit caching.
+
+    The cache is keyed on the dataset fingerprint, so a refreshed file is
+    picked up on the next call and an unchanged file is never re-read. Each
+    caller receives its own copy of the cached frame; use
+    ``src.data.dataset.get_dataset`` to share one frame across sessions.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+        lazy: If True, return a LazyFrame built on ``pl.scan_parquet`` instead
+            of reading the whole file into memory.
+
+    Returns:
+        Polars DataFrame with the data, or a LazyFrame when ``lazy`` is set.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+    """
+    return _load_data_version(str(path), dataset_fingerprint(path), lazy)
+
+
+load_data.clear = _load_data_version.clear
+
+
+def count_rows(df: pl.DataFrame | pl.LazyFrame) -> int:
+    """Count rows, collecting only the row count for a LazyFrame.
+
+    Args:
+        df: Input DataFrame or LazyFrame.
+
+    Returns:
+        Number of rows.
+    """
+    if isinstance(df, pl.LazyFrame):
+        return df.select(pl.len()).collect().item()
+
+    return len(df)
+
+
+def compute_summary(
+    df: pl.DataFrame | pl.LazyFrame,
+    value_col: str = "value",
+) -> dict:
+    """Compute summary statistics.
+
+    All statistics are evaluated in a single query, so a LazyFrame input is
+    scanned once with only ``value_col`` projected.
 
     Args:
-        df: Input DataFrame.
+        df: Input DataFrame or LazyFrame.
         value_col: Name of the value column.
 
     Returns:
         Dictionary with summary statistics.
     """
-    if df.is_empty() or value_col not in df.columns:
+    if value_col not in get_columns(df):
+        return {}
+
+    stats = (
+        df.lazy()
+        .select(
+            pl.col(value_col).sum().alias("total"),
+            pl.col(value_col).mean().alias("mean"),
+            pl.len().alias("count"),
+            pl.col(value_col).min().alias("min"),
+            pl.col(value_col).max().alias("max"),
+        )
+        .collect()
+        .row(0, named=True)
+    )
+
+    if stats["count"] == 0:
         return {}
 
     return {
-        "total": float(df[value_col].sum()),
-        "mean": float(df[value_col].mean()),
-        "count": len(df),
-        "min": float(df[value_col].min()),
-        "max": float(df[value_col].max()),
+        "total": float(stats["total"]),
+        "mean": float(stats["mean"]),
+        "count": stats["count"],
+        "min": float(stats["min"]),
+        "max": float(stats["max"]),
     }
 
 
-@st.cache_data(ttl=3600)
 def aggregate_by_column(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     group_col: str,
     value_col: str = "value",
     agg: str = "sum",
 ) -> pl.DataFrame:
-    """Aggregate data by a column with caching.
+    """Aggregate data by a column.
 
     Args:
-        df: Input DataFrame.
+        df: Input DataFrame or LazyFrame.
         group_col: Column to group by.
         value_col: Column to aggregate.
         agg: Aggregation function.
@@ -75,9 +358,6 @@ def aggregate_by_column(
     Returns:
         Aggregated DataFrame.
     """
-    if df.is_empty():
-        return pl.DataFrame()
-
     agg_funcs = {
         "sum": pl.col(value_col).sum(),
         "mean": pl.col(value_col).mean(),
@@ -86,20 +366,163 @@ def aggregate_by_column(
 
     agg_func = agg_funcs.get(agg, agg_funcs["sum"])
 
-    return df.group_by(group_col).agg(agg_func.alias(value_col)).sort(value_col, descending=True)
+    result = (
+        df.lazy()
+        .group_by(group_col)
+        .agg(agg_func.alias(value_col))
+        .sort(value_col, descending=True)
+        .collect()
+    )
+
+    if result.is_empty():
+        return pl.DataFrame()
 
+    return result
 
-def get_column_unique_values(df: pl.DataFrame, column: str) -> list:
+
+def compute_group_stats(
+    df: pl.DataFrame | pl.LazyFrame,
+    group_col: str,
+    value_col: str = "value",
+) -> pl.DataFrame:
+    """Compute total, average and count of a value per group.
+
+    Args:
+        df: Input DataFrame or LazyFrame.
+        group_col: Column to group by.
+        value_col: Column to aggregate.
+
+    Returns:
+        DataFrame with ``group_col``, ``total``, ``average`` and ``count``,
+        sorted by total descending.
+    """
+    return (
+        df.lazy()
+        .group_by(group_col)
+        .agg(
+            pl.col(value_col).sum().alias("total"),
+            pl.col(value_col).mean().alias("average"),
+            pl.len().alias("count"),
+        )
+        .sort("total", descending=True)
+        .collect()
+    )
+
+
+def top_k(
+    df: pl.DataFrame | pl.LazyFrame,
+    k: int,
+    by: str = "value",
+    group_col: str | None = None,
+) -> pl.DataFrame:
+    """Get the rows with the largest values, overall or per group.
+
+    Uses partial selection (``top_k``/``top_k_by``), so only the ``k``
+    selected rows are ever sorted. Rows with a null ``by`` value are never
+    selected, so fewer than ``k`` rows come back if fewer have a value.
+
+    Args:
+        df: Input DataFrame or LazyFrame.
+        k: Number of rows to keep (per group with ``group_col``).
+        by: Column to rank rows by, largest first.
+        group_col: Optional column to select the top rows within.
+
+    Returns:
+        DataFrame with the same columns as ``df``, sorted by ``by``
+        descending (within ``group_col`` ascending when grouped).
+    """
+    lf = df.lazy()
+    ranked = lf.filter(pl.col(by).is_not_null())
+
+    if group_col is None:
+        return ranked.top_k(k, by=by).sort(by, descending=True).collect()
+
+    schema = lf.collect_schema()
+    columns = schema.names()
+    others = [c for c in columns if c != group_col]
+
+    return (
+        ranked.group_by(group_col)
+        .agg(pl.col(others).top_k_by(by, k))
+        .explode(others)
+        .sort(label_sort_keys(schema, [group_col, by]), descending=[False, True])
+        .select(columns)
+        .collect()
+    )
+
+
+def build_top_k_index(
+    df: pl.DataFrame | pl.LazyFrame,
+    dimensions: tuple[str, ...],
+    k: int = TOP_K_INDEX_SIZE,
+    by: str = "value",
+) -> pl.DataFrame:
+    """Keep the top ``k`` rows of every dimension cell.
+
+    The global top rows of any set of cells are among the per-cell top rows,
+    so ``top_k`` queries up to ``k`` rows whose filters select whole cells
+    can run on this small index instead of the fact table.
+
+    Args:
+        df: Input DataFrame or LazyFrame, or an existing index to re-reduce.
+        dimensions: Columns defining the cells.
+        k: Rows kept per cell.
+        by: Column to rank rows by.
+
+    Returns:
+        DataFrame with the same columns as ``df``.
+    """
+    lf = df.lazy()
+    columns = lf.collect_schema().names()
+    dimensions = [d for d in dimensions if d in columns]
+    others = [c for c in columns if c not in dimensions]
+
+    if not dimensions:
+        return lf.top_k(k, by=by).collect()
+
+    return (
+        lf.group_by(dimensions)
+        .agg(pl.col(others).top_k_by(by, k))
+        .explode(others)
+        .select(columns)
+        .collect()
+    )
+
+
+def get_column_unique_values(df: pl.DataFrame | pl.LazyFrame, column: str) -> list:
     """Get unique values from a column.
 
     Args:
-        df: Input DataFrame.
+        df: Input DataFrame or LazyFrame.
         column: Column name.
 
     Returns:
         List of unique values.
     """
-    if column not in df.columns:
+    if column not in get_columns(df):
         return []
 
-    return df[column].unique().sort().to_list()
+    lf = df.lazy()
+    values = lf.select(pl.col(column).unique())
+    return values.sort(label_sort_keys(lf.collect_schema(), [column])).collect()[column].to_list()
+
+
+def get_column_bounds(df: pl.DataFrame | pl.LazyFrame, column: str) -> tuple:
+    """Get the minimum and maximum of a column in a single query.
+
+    Args:
+        df: Input DataFrame or LazyFrame.
+        column: Column name.
+
+    Returns:
+        Tuple of (min, max), or (None, None) if the column is missing.
+    """
+    if column not in get_columns(df):
+        return (None, None)
+
+    bounds = (
+        df.lazy()
+        .select(pl.col(column).min().alias("min"), pl.col(column).max().alias("max"))
+        .collect()
+    )
+    return (bounds["min"].item(), bounds["max"].item())
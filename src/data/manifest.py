@@ -0,0 +1,169 @@
+"""Append-only manifest describing the files of a partitioned dataset."""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "_manifest.json"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One committed data file.
+
+    Attributes:
+        path: File path relative to the dataset root.
+        rows: Number of rows in the file.
+        max_date: Latest date in the file, ISO formatted.
+        sha256: Hex digest of the file contents.
+    """
+
+    path: str
+    rows: int
+    max_date: str | None
+    sha256: str
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """Versioned list of the files making up a dataset.
+
+    Readers only see files listed here, so files written by an in-progress
+    refresh stay invisible until the manifest is replaced.
+    """
+
+    version: int = 0
+    files: tuple[ManifestEntry, ...] = ()
+
+    @property
+    def total_rows(self) -> int:
+        """Total rows across all files."""
+        return sum(entry.rows for entry in self.files)
+
+    @property
+    def max_date(self) -> date | None:
+        """Latest date across all files."""
+        dates = [entry.max_date for entry in self.files if entry.max_date]
+        return date.fromisoformat(max(dates)) if dates else None
+
+    @property
+    def content_hash(self) -> str:
+        """Hash over every file's path and content digest."""
+        digest = hashlib.sha256()
+        for entry in self.files:
+            digest.update(f"{entry.path}:{entry.sha256}\n".encode())
+        return digest.hexdigest()
+
+    def appended_since(self, previous: "Manifest") -> list[ManifestEntry] | None:
+        """Get the files added since an earlier manifest.
+
+        Args:
+            previous: Manifest the caller already holds.
+
+        Returns:
+            New entries, or None if ``previous`` is not a prefix of this
+            manifest (files removed or rewritten), meaning a full reload.
+        """
+        current = {entry.path: entry for entry in self.files}
+
+        for entry in previous.files:
+            if current.get(entry.path) != entry:
+                return None
+
+        known = {entry.path for entry in previous.files}
+        return [entry for entry in self.files if entry.path not in known]
+
+
+def manifest_path(root: str | Path) -> Path:
+    """Get the manifest file of a dataset directory."""
+    return Path(root) / MANIFEST_NAME
+
+
+def read_manifest(root: str | Path) -> Manifest | None:
+    """Read a dataset manifest.
+
+    Args:
+        root: Dataset directory.
+
+    Returns:
+        Manifest, or None if the directory has none.
+    """
+    path = manifest_path(root)
+
+    if not path.exists():
+        return None
+
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return Manifest(
+        version=raw["version"],
+        files=tuple(ManifestEntry(**entry) for entry in raw["files"]),
+    )
+
+
+def write_manifest(root: str | Path, manifest: Manifest) -> Path:
+    """Atomically replace a dataset manifest.
+
+    Args:
+        root: Dataset directory.
+        manifest: Manifest to write.
+
+    Returns:
+        Path of the manifest file.
+    """
+    path = manifest_path(root)
+    staging = path.with_name(f".{path.name}.tmp")
+    payload = {
+        "version": manifest.version,
+        "total_rows": manifest.total_rows,
+        "max_date": manifest.max_date.isoformat() if manifest.max_date else None,
+        "content_hash": manifest.content_hash,
+        "files": [asdict(entry) for entry in manifest.files],
+    }
+
+    staging.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(staging, path)
+    logger.info(f"Wrote manifest v{manifest.version} with {len(manifest.files)} files -> {path}")
+    return path
+
+
+def describe_file(root: str | Path, file: str | Path, date_col: str = "date") -> ManifestEntry:
+    """Build the manifest entry for a data file.
+
+    Args:
+        root: Dataset directory.
+        file: Parquet file inside ``root``.
+        date_col: Name of the date column.
+
+    Returns:
+        Manifest entry with row count, max date and content hash.
+    """
+    root = Path(root)
+    file = Path(file)
+
+    stats = (
+        pl.scan_parquet(file, hive_partitioning=False)
+        .select(pl.len().alias("rows"), pl.col(date_col).max().alias("max_date"))
+        .collect()
+        .row(0, named=True)
+    )
+
+    digest = hashlib.sha256()
+    with file.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    max_date = stats["max_date"]
+    return ManifestEntry(
+        path=file.relative_to(root).as_posix(),
+        rows=stats["rows"],
+        max_date=max_date.isoformat() if max_date else None,
+        sha256=digest.hexdigest(),
+    )
@@ -0,0 +1,275 @@
+"""Pre-aggregated rollup cube at (date x category x region) grain."""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from src.data.loader import content_fingerprint, get_columns, list_data_files
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_DIMENSIONS = ("date", "category", "region")
+
+# Filter keys that translate to predicates on rollup dimensions.
+ROLLUP_FILTER_KEYS = frozenset({"start_date", "end_date", "category", "region"})
+
+# Parquet metadata key holding the content fingerprint of the rollup's data.
+SOURCE_METADATA_KEY = "rollup_source"
+
+
+def rollup_path(data_path: str | Path) -> Path:
+    """Get the rollup file stored next to a data file.
+
+    Args:
+        data_path: Path to the raw Parquet file.
+
+    Returns:
+        Path of the companion rollup file.
+    """
+    data_path = Path(data_path)
+    return data_path.with_name(f"{data_path.stem}.rollup.parquet")
+
+
+def build_rollup(df: pl.DataFrame | pl.LazyFrame, value_col: str = "value") -> pl.DataFrame:
+    """Aggregate raw rows to the rollup grain.
+
+    Runs on the streaming engine, so a LazyFrame scan larger than memory can
+    be rolled up.
+
+    Args:
+        df: Raw DataFrame or LazyFrame.
+        value_col: Column to aggregate.
+
+    Returns:
+        DataFrame with one row per (date, category, region) and the columns
+        ``count``, ``{value_col}_sum``, ``{value_col}_count``,
+        ``{value_col}_min`` and ``{value_col}_max``.
+    """
+    dims = [c for c in ROLLUP_DIMENSIONS if c in get_columns(df)]
+
+    return (
+        df.lazy()
+        .group_by(dims)
+        .agg(
+            pl.len().alias("count"),
+            pl.col(value_col).sum().alias(f"{value_col}_sum"),
+            pl.col(value_col).count().alias(f"{value_col}_count"),
+            pl.col(value_col).min().alias(f"{value_col}_min"),
+            pl.col(value_col).max().alias(f"{value_col}_max"),
+        )
+        .sort(dims)
+        .collect(engine="streaming")
+    )
+
+
+def merge_rollups(base: pl.DataFrame, delta: pl.DataFrame) -> pl.DataFrame:
+    """Fold the rollup of newly appended rows into an existing rollup.
+
+    Args:
+        base: Rollup of the rows already loaded.
+        delta: Rollup of the appended rows, built with the same value column.
+
+    Returns:
+        Rollup covering both inputs.
+    """
+    dims = [c for c in ROLLUP_DIMENSIONS if c in base.columns]
+    metrics = [c for c in base.columns if c not in dims]
+
+    def combine(col: str) -> pl.Expr:
+        if col.endswith("_min"):
+            return pl.col(col).min()
+        if col.endswith("_max"):
+            return pl.col(col).max()
+        return pl.col(col).sum()
+
+    return (
+        pl.concat([base, delta.select(base.columns)])
+        .group_by(dims)
+        .agg([combine(c) for c in metrics])
+        .sort(dims)
+    )
+
+
+def write_rollup(
+    rollup: pl.DataFrame, data_path: str | Path, files: list[Path] | None = None
+) -> Path:
+    """Atomically write a rollup next to its data file.
+
+    The content fingerprint of the data is stored in the file's metadata,
+    so ``read_rollup`` can tell the rollup apart from one of another version.
+
+    Args:
+        rollup: Rollup DataFrame from ``build_rollup``.
+        data_path: Path to the raw Parquet file or dataset directory.
+        files: Data files the rollup was built from; defaults to the files
+            currently listed for ``data_path``.
+
+    Returns:
+        Path of the written rollup file.
+    """
+    path = rollup_path(data_path)
+    files = list_data_files(data_path) if files is None else files
+    staging = path.with_name(f".{path.name}.tmp")
+    rollup.write_parquet(staging, metadata={SOURCE_METADATA_KEY: content_fingerprint(files)})
+    staging.replace(path)
+    logger.info(f"Wrote rollup with {len(rollup)} cells -> {path}")
+    return path
+
+
+def read_rollup(
+    data_path: str | Path, expected_rows: int | None = None, files: list[Path] | None = None
+) -> pl.DataFrame | None:
+    """Read the rollup for a data file if it exists and is consistent.
+
+    Args:
+        data_path: Path to the raw Parquet file or dataset directory.
+        expected_rows: Row count of the raw data. A rollup covering a
+            different number of rows is stale and ignored.
+        files: Data files the rollup must have been built from; defaults to
+            the files currently listed for ``data_path``. A rollup built from
+            other contents, even with the same row count, is ignored.
+
+    Returns:
+        Rollup DataFrame, or None if missing or stale.
+    """
+    path = rollup_path(data_path)
+
+    if not path.exists():
+        return None
+
+    files = list_data_files(data_path) if files is None else files
+    source = pl.read_parquet_metadata(path).get(SOURCE_METADATA_KEY)
+
+    if source != content_fingerprint(files):
+        logger.warning(f"Ignoring rollup {path} built from another version of the data")
+        return None
+
+    rollup = pl.read_parquet(path)
+
+    if expected_rows is not None and rollup["count"].sum() != expected_rows:
+        logger.warning(f"Ignoring stale rollup {path}")
+        return None
+
+    return rollup
+
+
+def can_use_rollup(filters: dict[str, Any]) -> bool:
+    """Check whether a filter set is expressible at the rollup grain.
+
+    Args:
+        filters: Filter dict as returned by ``render_filter_sidebar``.
+
+    Returns:
+        True if every active filter targets a rollup dimension.
+    """
+    return set(filters) <= ROLLUP_FILTER_KEYS
+
+
+def summary_from_rollup(
+    cube: pl.DataFrame | pl.LazyFrame,
+    value_col: str = "value",
+) -> dict:
+    """Compute the same statistics as ``compute_summary`` from rollup cells.
+
+    Args:
+        cube: Rollup DataFrame or LazyFrame, already filtered.
+        value_col: Name of the value column the rollup was built on.
+
+    Returns:
+        Dictionary with summary statistics.
+    """
+    stats = (
+        cube.lazy()
+        .select(
+            pl.col(f"{value_col}_sum").sum().alias("total"),
+            pl.col(f"{value_col}_count").sum().alias("value_count"),
+            pl.col("count").sum().alias("count"),
+            pl.col(f"{value_col}_min").min().alias("min"),
+            pl.col(f"{value_col}_max").max().alias("max"),
+        )
+        .collect()
+        .row(0, named=True)
+    )
+
+    if not stats["count"]:
+        return {}
+
+    return {
+        "total": float(stats["total"]),
+        "mean": float(stats["total"] / stats["value_count"]),
+        "count": stats["count"],
+        "min": float(stats["min"]),
+        "max": float(stats["max"]),
+    }
+
+
+def aggregate_from_rollup(
+    cube: pl.DataFrame | pl.LazyFrame,
+    group_col: str,
+    value_col: str = "value",
+    agg: str = "sum",
+) -> pl.DataFrame:
+    """Compute the same result as ``aggregate_by_column`` from rollup cells.
+
+    Args:
+        cube: Rollup DataFrame or LazyFrame, already filtered.
+        group_col: Rollup dimension to group by.
+        value_col: Name of the value column the rollup was built on.
+        agg: Aggregation function ("sum", "mean" or "count").
+
+    Returns:
+        Aggregated DataFrame.
+    """
+    agg_funcs = {
+        "sum": pl.col(f"{value_col}_sum").sum(),
+        "mean": pl.col(f"{value_col}_sum").sum() / pl.col(f"{value_col}_count").sum(),
+        "count": pl.col("count").sum(),
+    }
+
+    agg_func = agg_funcs.get(agg, agg_funcs["sum"])
+
+    result = (
+        cube.lazy()
+        .group_by(group_col)
+        .agg(agg_func.alias(value_col))
+        .sort(value_col, descending=True)
+        .collect()
+    )
+
+    if result.is_empty():
+        return pl.DataFrame()
+
+    return result
+
+
+def group_stats_from_rollup(
+    cube: pl.DataFrame | pl.LazyFrame,
+    group_col: str,
+    value_col: str = "value",
+) -> pl.DataFrame:
+    """Compute the same result as ``compute_group_stats`` from rollup cells.
+
+    Args:
+        cube: Rollup DataFrame or LazyFrame, already filtered.
+        group_col: Rollup dimension to group by.
+        value_col: Name of the value column the rollup was built on.
+
+    Returns:
+        DataFrame with ``group_col``, ``total``, ``average`` and ``count``,
+        sorted by total descending.
+    """
+    return (
+        cube.lazy()
+        .group_by(group_col)
+        .agg(
+            pl.col(f"{value_col}_sum").sum().alias("total"),
+            (pl.col(f"{value_col}_sum").sum() / pl.col(f"{value_col}_count").sum()).alias(
+                "average"
+            ),
+            pl.col("count").sum().alias("count"),
+        )
+        .sort("total", descending=True)
+        .collect()
+    )
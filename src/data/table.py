@@ -0,0 +1,113 @@
+"""Paginated table queries: search, sort and slice one page of rows."""
+
+import re
+from collections.abc import Sequence
+
+import polars as pl
+
+from src.data.dictionary import label_sort_keys
+
+PAGE_SIZES = (25, 50, 100, 250)
+
+_STRING_TYPES = (pl.String, pl.Categorical, pl.Enum)
+
+
+def text_columns(schema: pl.Schema, columns: Sequence[str] | None = None) -> list[str]:
+    """Columns a table search looks into.
+
+    Args:
+        schema: Schema of the rows.
+        columns: Columns shown in the table; all columns by default.
+
+    Returns:
+        Text columns among ``columns``.
+    """
+    columns = schema.names() if columns is None else columns
+    return [c for c in columns if c in schema and isinstance(schema[c], _STRING_TYPES)]
+
+
+def search_rows(
+    lf: pl.LazyFrame, search: str | None, search_cols: Sequence[str] | None = None
+) -> pl.LazyFrame:
+    """Keep rows where any text column contains the search text.
+
+    Args:
+        lf: LazyFrame to search.
+        search: Case-insensitive text to look for; no filtering if empty.
+        search_cols: Columns to search; all text columns by default.
+
+    Returns:
+        Filtered LazyFrame.
+    """
+    if not search:
+        return lf
+
+    schema = lf.collect_schema()
+    if search_cols is None:
+        search_cols = text_columns(schema)
+
+    pattern = f"(?i){re.escape(search)}"
+    predicates = [
+        pl.col(c).cast(pl.String).str.contains(pattern) for c in search_cols if c in schema
+    ]
+
+    if not predicates:
+        return lf
+
+    return lf.filter(pl.any_horizontal(predicates))
+
+
+def fetch_page(
+    lf: pl.LazyFrame,
+    page: int,
+    page_size: int,
+    sort_col: str | None = None,
+    descending: bool = False,
+    search: str | None = None,
+    search_cols: Sequence[str] | None = None,
+) -> pl.DataFrame:
+    """Compute one page of rows.
+
+    Only the requested slice is collected; with a sort column the slice is
+    pushed into the sort, which then only keeps the rows up to the page end.
+
+    Args:
+        lf: LazyFrame with the rows to show.
+        page: 1-based page number.
+        page_size: Rows per page.
+        sort_col: Optional column to sort by.
+        descending: Sort in descending order.
+        search: Optional case-insensitive text search.
+        search_cols: Columns to search; all text columns by default.
+
+    Returns:
+        DataFrame with at most ``page_size`` rows.
+    """
+    lf = search_rows(lf.lazy(), search, search_cols)
+    offset = (max(page, 1) - 1) * page_size
+
+    if sort_col:
+        lf = lf.sort(
+            label_sort_keys(lf.collect_schema(), [sort_col]),
+            descending=descending,
+            nulls_last=True,
+            maintain_order=True,
+        )
+
+    return lf.slice(offset, page_size).collect()
+
+
+def count_matches(
+    lf: pl.LazyFrame, search: str | None = None, search_cols: Sequence[str] | None = None
+) -> int:
+    """Count rows matching a search.
+
+    Args:
+        lf: LazyFrame with the rows to show.
+        search: Optional case-insensitive text search.
+        search_cols: Columns to search; all text columns by default.
+
+    Returns:
+        Number of matching rows.
+    """
+    return search_rows(lf.lazy(), search, search_cols).select(pl.len()).collect().item()
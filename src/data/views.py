@@ -0,0 +1,77 @@
+"""Queries behind each page, shared by the pages and the cache warm-up.
+
+The query cache is keyed on the exact query spec, so precomputing a view
+only helps if it issues the same queries as the page; both go through the
+functions here.
+"""
+
+from typing import Any
+
+import polars as pl
+
+from src.data.aggregate import Grouping, Metric, group_stats_metrics, summary_metrics
+from src.data.dataset import Dataset
+from src.data.engine import QueryEngine
+from src.data.loader import get_columns
+
+# Everything the overview shows for a filter set, computed in one pass.
+OVERVIEW_GROUPINGS = (
+    Grouping("kpis", summary_metrics()),
+    Grouping("daily", (Metric("value", "sum", "value"),), by=("date",), sort="date"),
+    Grouping(
+        "by_category",
+        (Metric("value", "sum", "value"),),
+        by=("category",),
+        sort="value",
+        descending=True,
+    ),
+)
+
+TOP_PERFORMERS = 10
+TOP_PERFORMER_COLUMNS = ["name", "category", "region", "value"]
+
+DETAIL_COLUMNS = ["date", "name", "category", "region", "value", "quantity"]
+
+
+def overview_aggregates(
+    engine: QueryEngine, dataset: Dataset, filters: dict[str, Any]
+) -> dict[str, pl.DataFrame]:
+    """KPIs, daily trend and category split of the overview page."""
+    return engine.evaluate(dataset, filters, OVERVIEW_GROUPINGS)
+
+
+def top_performers(engine: QueryEngine, dataset: Dataset, filters: dict[str, Any]) -> pl.DataFrame:
+    """Highest-value rows of the overview page."""
+    return engine.top_k(dataset, filters, TOP_PERFORMERS, "value", columns=TOP_PERFORMER_COLUMNS)
+
+
+def detail_groupings(columns: list[str]) -> tuple[Grouping, ...]:
+    """Statistics tables of the details page for the columns of a dataset.
+
+    Args:
+        columns: Columns of the dataset.
+
+    Returns:
+        Groupings by category, and by region when the dataset has one.
+    """
+    groupings = [
+        Grouping("category", group_stats_metrics(), by=("category",), sort="total", descending=True)
+    ]
+    if "region" in columns:
+        groupings.append(
+            Grouping("region", group_stats_metrics(), by=("region",), sort="total", descending=True)
+        )
+    return tuple(groupings)
+
+
+def detail_stats(
+    engine: QueryEngine, dataset: Dataset, filters: dict[str, Any]
+) -> dict[str, pl.DataFrame]:
+    """Category and region statistics of the details page."""
+    return engine.evaluate(dataset, filters, detail_groupings(get_columns(dataset.scan())))
+
+
+def detail_columns(dataset: Dataset) -> list[str]:
+    """Columns shown in the details table."""
+    columns = get_columns(dataset.scan())
+    return [c for c in DETAIL_COLUMNS if c in columns]
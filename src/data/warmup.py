@@ -0,0 +1,381 @@
+"""Cache warm-up precomputing the most used filter combinations."""
+
+import json
+import logging
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import streamlit as st
+
+from src.config import get_settings
+from src.data.cache import get_query_cache
+from src.data.dataset import Dataset, get_dataset
+from src.data.engine import QueryEngine, get_engine
+from src.data.loader import get_column_bounds, get_columns
+from src.data.table import PAGE_SIZES
+from src.data.views import detail_columns, detail_stats, overview_aggregates, top_performers
+
+logger = logging.getLogger(__name__)
+
+# Date preset name -> number of days ending on the last date of the dataset;
+# None is the full range the sidebar starts on.
+DATE_PRESETS = {"all": None, "last_7_days": 7, "last_30_days": 30, "last_90_days": 90}
+
+# Most recent usage log lines used to rank views.
+USAGE_LOG_WINDOW = 10_000
+# The usage log rolls over to "<name>.1" past this size, which holds at least
+# USAGE_LOG_WINDOW lines, so the two files never exceed twice that on disk.
+USAGE_LOG_MAX_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class View:
+    """A sidebar filter combination, with its date range relative to the data.
+
+    Attributes:
+        category: Selected category, None for all.
+        region: Selected region, None for all.
+        preset: Name from ``DATE_PRESETS``.
+    """
+
+    category: str | None = None
+    region: str | None = None
+    preset: str = "all"
+
+    def __post_init__(self):
+        if self.preset not in DATE_PRESETS:
+            raise ValueError(
+                f"Unknown date preset: {self.preset!r} (expected one of {list(DATE_PRESETS)})"
+            )
+
+    def filters(self, bounds: tuple) -> dict[str, Any]:
+        """Filter dict the sidebar returns for this view.
+
+        Args:
+            bounds: (min, max) of the date column, (None, None) without one.
+
+        Returns:
+            Filter dict for the current version of the dataset.
+        """
+        filters = {}
+        start, end = bounds
+
+        if start and end:
+            days = DATE_PRESETS[self.preset]
+            if days is not None:
+                start = max(start, end - timedelta(days=days - 1))
+            filters["start_date"] = start
+            filters["end_date"] = end
+
+        if self.category is not None:
+            filters["category"] = self.category
+        if self.region is not None:
+            filters["region"] = self.region
+
+        return filters
+
+    @classmethod
+    def from_filters(cls, filters: dict[str, Any], bounds: tuple) -> "View | None":
+        """Match a sidebar filter dict to a view.
+
+        Args:
+            filters: Filter dict as returned by ``render_filter_sidebar``.
+            bounds: (min, max) of the date column.
+
+        Returns:
+            The view, or None if the date range is not a preset.
+        """
+        start, end = filters.get("start_date"), filters.get("end_date")
+        preset = "all"
+
+        if start is not None and end is not None and (start, end) != tuple(bounds):
+            if end != bounds[1]:
+                return None
+            days = (end - start).days + 1
+            preset = next((name for name, n in DATE_PRESETS.items() if n == days), None)
+            if preset is None:
+                return None
+
+        return cls(filters.get("category"), filters.get("region"), preset)
+
+
+class UsageLog:
+    """Append-only JSON-lines log of the views users open.
+
+    Every worker process appends to the same file; lines are short enough
+    to be written atomically. Past ``max_bytes`` the file is renamed to
+    ``<name>.1``, replacing the previous one, so the log stays bounded on
+    disk and in what ``top`` reads.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = USAGE_LOG_MAX_BYTES):
+        """Initialize the log.
+
+        Args:
+            path: Log file; created with its directory on the first record.
+            max_bytes: Size past which the file is rolled over.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def rotated_path(self) -> Path:
+        """Previous log file, holding the records before the last rollover."""
+        return self.path.with_name(f"{self.path.name}.1")
+
+    def record(self, view: View) -> None:
+        """Append a view to the log, rolling it over once it is full.
+
+        Args:
+            view: View opened by a user.
+        """
+        line = json.dumps(asdict(view)) + "\n"
+
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write(line)
+                    full = f.tell() >= self.max_bytes
+
+                # Another process may have rolled the file over in between;
+                # the rename is atomic, so the worst case is a short log.
+                if full and self.path.stat().st_size >= self.max_bytes:
+                    self.path.replace(self.rotated_path)
+            except OSError as exc:
+                logger.warning(f"Could not write usage log {self.path}: {exc}")
+
+    def top(self, n: int) -> list[View]:
+        """Most opened views among the last ``USAGE_LOG_WINDOW`` records.
+
+        Args:
+            n: Number of views to return.
+
+        Returns:
+            Views, most opened first.
+        """
+        lines = deque(maxlen=USAGE_LOG_WINDOW)
+        for path in (self.rotated_path, self.path):
+            try:
+                with path.open(encoding="utf-8") as f:
+                    lines.extend(f)
+            except FileNotFoundError:
+                continue
+
+        counts = Counter()
+        for line in lines:
+            try:
+                counts[View(**json.loads(line))] += 1
+            except (TypeError, ValueError):
+                # A torn or outdated line; skip it.
+                continue
+
+        return [view for view, _ in counts.most_common(n)]
+
+
+@st.cache_resource
+def get_usage_log() -> UsageLog | None:
+    """Get the process-wide usage log, or None if disabled in settings."""
+    path = get_settings().usage_log
+    return UsageLog(path) if path else None
+
+
+def date_bounds(dataset: Dataset) -> tuple:
+    """(min, max) of the dataset's date column, as the sidebar reads them."""
+    if dataset.index is not None and "date" in dataset.index.columns:
+        return dataset.index.bounds("date")
+
+    lf = dataset.scan()
+    if "date" in get_columns(lf):
+        return get_column_bounds(lf, "date")
+
+    return (None, None)
+
+
+def record_view(dataset: Dataset, filters: dict[str, Any]) -> None:
+    """Log the view of the current session when its filters change.
+
+    Custom date ranges are not logged, since they can't be replayed on
+    later versions of the dataset.
+
+    Args:
+        dataset: Dataset the filters apply to.
+        filters: Filter dict as returned by ``render_filter_sidebar``.
+    """
+    log = get_usage_log()
+    if log is None:
+        return
+
+    view = View.from_filters(filters, date_bounds(dataset))
+    if view is None or st.session_state.get("usage_view") == view:
+        return
+
+    st.session_state["usage_view"] = view
+    log.record(view)
+
+
+def views_to_warm(
+    n: int, configured: list[View] | None = None, log: UsageLog | None = None
+) -> list[View]:
+    """Default view followed by up to ``n`` configured or most used views.
+
+    Args:
+        n: Number of views besides the default one.
+        configured: Views listed in settings, warmed before the logged ones.
+        log: Usage log to rank views from.
+
+    Returns:
+        List of distinct views.
+    """
+    candidates = [View(), *(configured or []), *(log.top(n) if log is not None else [])]
+    return list(dict.fromkeys(candidates))[: n + 1]
+
+
+def default_views() -> list[View]:
+    """Views to warm according to settings and the usage log."""
+    settings = get_settings()
+    configured = [View(**spec) for spec in settings.warmup_filters]
+    return views_to_warm(settings.warmup_top_n, configured, get_usage_log())
+
+
+def warm_view(engine: QueryEngine, dataset: Dataset, filters: dict[str, Any]) -> None:
+    """Run the queries both pages issue for a filter set.
+
+    Args:
+        engine: Query engine.
+        dataset: Dataset to query.
+        filters: Filter dict as returned by ``render_filter_sidebar``.
+    """
+    overview_aggregates(engine, dataset, filters)
+    top_performers(engine, dataset, filters)
+    detail_stats(engine, dataset, filters)
+    engine.count(dataset, filters)
+    engine.page(dataset, filters, detail_columns(dataset), 1, PAGE_SIZES[0])
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    """Outcome of a warm-up run.
+
+    Attributes:
+        views: Number of views warmed.
+        entries: Query cache entries created.
+        disk_hits: Entries read from the disk tier instead of computed.
+        seconds: Wall-clock duration.
+    """
+
+    views: int
+    entries: int
+    disk_hits: int
+    seconds: float
+
+
+def warm_up(engine: QueryEngine, dataset: Dataset, views: list[View]) -> WarmupReport:
+    """Fill the query cache with the queries of a list of views.
+
+    Users opening a view that is still being warmed wait for the in-flight
+    query instead of running it again. A view that fails is logged and
+    skipped.
+
+    Args:
+        engine: Query engine.
+        dataset: Dataset to query.
+        views: Views to warm, most important first.
+
+    Returns:
+        Report of the run.
+    """
+    cache = get_query_cache()
+    before = cache.stats
+    started = time.perf_counter()
+    bounds = date_bounds(dataset)
+
+    # The details page checks the dataset is not empty before anything else.
+    engine.count(dataset, {})
+
+    warmed = 0
+    for view in views:
+        try:
+            warm_view(engine, dataset, view.filters(bounds))
+        except Exception:
+            logger.exception(f"Failed to warm up {view}")
+            continue
+        warmed += 1
+
+    after = cache.stats
+    report = WarmupReport(
+        views=warmed,
+        entries=after.size - before.size + after.evictions - before.evictions,
+        disk_hits=after.disk_hits - before.disk_hits,
+        seconds=time.perf_counter() - started,
+    )
+    logger.info(
+        f"Warmed up {report.views} views of {dataset.fingerprint[:12]}: {report.entries} cache"
+        f" entries ({report.disk_hits} from disk) in {report.seconds:.2f}s"
+    )
+    return report
+
+
+class WarmupWorker(threading.Thread):
+    """Background thread warming the query cache for each new dataset version."""
+
+    def __init__(self, path: str | Path, lazy: bool = False, interval: float = 0.0):
+        """Initialize the worker.
+
+        Args:
+            path: Path to the Parquet file or dataset directory.
+            lazy: Dataset mode the app runs in.
+            interval: Seconds between checks for a new version; 0 warms the
+                current version once and exits.
+        """
+        super().__init__(name=f"cache-warmup:{path}", daemon=True)
+        self.path = Path(path)
+        self.lazy = lazy
+        self.interval = interval
+        self.last_report: WarmupReport | None = None
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        fingerprint = None
+
+        while True:
+            try:
+                dataset = get_dataset(self.path, self.lazy)
+                if dataset.fingerprint != fingerprint:
+                    fingerprint = dataset.fingerprint
+                    self.last_report = warm_up(get_engine(), dataset, default_views())
+            except FileNotFoundError:
+                logger.warning(f"Dataset {self.path} is missing; nothing to warm up")
+            except Exception:
+                logger.exception(f"Failed to warm up {self.path}")
+
+            if self.interval <= 0 or self._stop_event.wait(self.interval):
+                return
+
+    def stop(self) -> None:
+        """Stop the worker; it exits after its current warm-up."""
+        self._stop_event.set()
+
+
+@st.cache_resource
+def start_warmup(path: str, lazy: bool = False, interval: float = 0.0) -> WarmupWorker:
+    """Start the process-wide warm-up worker for a dataset, once per process.
+
+    Args:
+        path: Path to the Parquet file or dataset directory.
+        lazy: Dataset mode the app runs in.
+        interval: Seconds between checks for a new version; 0 warms once.
+
+    Returns:
+        The running worker.
+    """
+    worker = WarmupWorker(path, lazy, interval)
+    worker.start()
+    logger.info(f"Warming up the query cache for {path} in the background")
+    return worker
@@ -1,51 +1,55 @@
 """Overview page - Main dashboard view."""
 
-import plotly.express as px
-import polars as pl
 import streamlit as st
 
-from src.components.filters import apply_filters, render_filter_sidebar
+from src.components.charts import (
+    line_figure,
+    pie_figure,
+    render_chart,
+    render_dataframe,
+    start_render_stats,
+)
+from src.components.filters import render_filter_sidebar
 from src.components.footer import render_footer
 from src.components.header import render_header, render_page_header
 from src.components.kpi_card import render_kpi_grid
-from src.data.loader import aggregate_by_column, compute_summary
+from src.components.sections import Section, load_sections, section_data
+from src.config import get_settings
+from src.data.aggregate import to_summary
+from src.data.engine import get_engine
+from src.data.kpi import COMPARISONS, comparison_summary, get_baseline, growth
+from src.data.views import overview_aggregates, top_performers
+from src.data.warmup import record_view
+from src.utils.downsampling import BUCKETS, bucket_series, choose_bucket, downsample
 from src.utils.formatting import format_currency, format_percentage
 
-
-def main():
-    df = st.session_state.get("df")
-
-    if df is None or df.is_empty():
-        st.warning("Aucune donnée disponible")
-        return
-
-    render_header(subtitle="Sales and Performance Overview")
-
-    filters = render_filter_sidebar(df, category_col="category", region_col="region")
-    filtered_df = apply_filters(df, filters)
-
-    if filtered_df.is_empty():
-        st.warning("Aucune donnée pour les filtres sélectionnés")
-        return
-
-    st.markdown(f"**{len(filtered_df):,}** records found")
-
-    summary = compute_summary(filtered_df)
-    summary_total = compute_summary(df)
-
-    growth = None
-    if summary_total.get("total") and summary.get("total"):
-        prev_total = summary_total["total"]
-        curr_total = summary["total"]
-        if prev_total > 0:
-            growth = (curr_total - prev_total) / prev_total
+# Data of the heavy sections, loaded in parallel on the query executor.
+SECTIONS = (
+    Section("aggregates", overview_aggregates),
+    Section("top_performers", top_performers),
+)
+
+
+@st.fragment
+def render_kpis(engine, dataset, filters, summary):
+    """KPI cards; changing the comparison only reruns this fragment."""
+    comparison = st.segmented_control(
+        "Compare with",
+        options=list(COMPARISONS),
+        format_func=COMPARISONS.get,
+        default="dataset",
+        key="kpi_comparison",
+    )
+    comparison = comparison or "dataset"
+    total_growth = growth(summary, comparison_summary(engine, dataset, filters, comparison))
 
     kpis = [
         {
             "label": "Total Sales",
             "value": format_currency(summary.get("total", 0), symbol="$"),
-            "delta": format_percentage(growth) if growth else None,
-            "delta_color": "normal" if growth and growth > 0 else "inverse",
+            "delta": format_percentage(total_growth) if total_growth else None,
+            "delta_color": "normal" if total_growth and total_growth > 0 else "inverse",
+            "help": f"Change vs. {COMPARISONS[comparison].lower()}",
         },
         {
             "label": "Average Value",
@@ -63,65 +67,103 @@ def main():
 
     render_kpi_grid(kpis, columns=4)
 
+
+@st.fragment
+def render_trend(daily, stats):
+    """Trend chart; changing the resolution only reruns this fragment."""
+    render_page_header("Time Series")
+
+    resolution = st.segmented_control(
+        "Resolution",
+        options=["auto", *BUCKETS],
+        format_func=str.capitalize,
+        default="auto",
+        key="trend_bucket",
+        label_visibility="collapsed",
+    )
+    bucket = resolution if resolution in BUCKETS else None
+    if bucket is None:
+        bucket = choose_bucket(daily["date"].min(), daily["date"].max())
+
+    trend = daily if bucket == "day" else bucket_series(daily, "date", "value", bucket)
+    trend = downsample(trend, "date", "value", get_settings().chart_max_points)
+
+    render_chart(line_figure(trend, "date", "value", stats=stats))
+
+
+def main():
+    dataset = st.session_state.get("dataset")
+    stats = start_render_stats()
+
+    if dataset is None:
+        st.warning("Aucune donnée disponible")
+        return
+
+    engine = get_engine()
+
+    if not get_baseline(engine, dataset).summary:
+        st.warning("Aucune donnée disponible")
+        return
+
+    render_header(subtitle="Sales and Performance Overview")
+
+    filters = render_filter_sidebar(
+        dataset.scan(), category_col="category", region_col="region", index=dataset.index
+    )
+    record_view(dataset, filters)
+    sections = load_sections(SECTIONS, engine, dataset, filters)
+    results = section_data(sections, "aggregates")
+    if results is None:
+        return
+
+    summary = to_summary(results["kpis"])
+
+    if not summary:
+        st.warning("Aucune donnée pour les filtres sélectionnés")
+        return
+
+    st.markdown(f"**{summary['count']:,}** records found")
+
+    render_kpis(engine, dataset, filters, summary)
+
     st.markdown("")
 
     col1, col2 = st.columns(2)
 
     with col1:
-        render_page_header("Time Series")
-
-        daily = filtered_df.group_by("date").agg(pl.col("value").sum()).sort("date")
-
-        fig_trend = px.line(
-            daily.to_pandas(),
-            x="date",
-            y="value",
-            title="",
-            markers=True,
-        )
-        fig_trend.update_layout(
-            template="plotly_white",
-            margin=dict(l=0, r=0, t=0, b=0),
-            showlegend=False,
-        )
-        fig_trend.update_traces(line_color="#2563EB", line_width=2)
-        st.plotly_chart(fig_trend, width="stretch")
+        render_trend(results["daily"], stats)
 
     with col2:
         render_page_header("Category Distribution")
 
-        by_category = aggregate_by_column(filtered_df, "category", "value", "sum")
+        by_category = results["by_category"]
 
         if not by_category.is_empty():
-            fig_pie = px.pie(
-                by_category.to_pandas(),
+            fig_pie = pie_figure(
+                by_category,
                 values="value",
                 names="category",
-                title="",
-            )
-            fig_pie.update_layout(
-                template="plotly_white",
-                margin=dict(l=0, r=0, t=0, b=0),
+                colors=["#2563EB", "#10B981", "#F59E0B", "#EF4444", "#8B5CF6", "#6366F1"],
+                stats=stats,
             )
-            fig_pie.update_traces(
-                marker_colors=["#2563EB", "#10B981", "#F59E0B", "#EF4444", "#8B5CF6", "#6366F1"]
-            )
-            st.plotly_chart(fig_pie, width="stretch")
+            render_chart(fig_pie)
 
     st.markdown("")
 
     render_page_header("Top Performers")
 
-    top_items = filtered_df.sort("value", descending=True).head(10)
+    top_items = section_data(sections, "top_performers")
 
-    col_names = {"name": "Product", "category": "Category", "value": "Value", "region": "Region"}
-    display_df = top_items.select(["name", "category", "region", "value"]).rename(col_names)
+    if top_items is not None:
+        col_names = {
+            "name": "Product",
+            "category": "Category",
+            "value": "Value",
+            "region": "Region",
+        }
+        display_df = top_items.rename(col_names)
 
-    st.dataframe(
-        display_df.to_pandas(),
-        width="stretch",
-        hide_index=True,
-    )
+        render_dataframe(display_df, stats=stats, element="top_performers")
 
     render_footer(data_source="Données démo", author="Data Analytics Team")
 
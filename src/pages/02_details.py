@@ -1,72 +1,59 @@
 """Details page - Detailed data exploration."""
 
-import polars as pl
+from functools import partial
+
 import streamlit as st
 
-from src.components.filters import apply_filters, render_filter_sidebar
+from src.components.charts import render_dataframe, start_render_stats
+from src.components.data_table import render_data_table
+from src.components.filters import render_filter_sidebar
 from src.components.footer import render_footer
 from src.components.header import render_page_header
+from src.components.sections import Section, load_sections, section_data
+from src.config import get_settings
+from src.data.engine import get_engine
+from src.data.export import EXPORT_FORMATS, read_export
+from src.data.views import detail_columns, detail_stats
+from src.data.warmup import record_view
 
 
-def main():
-    df = st.session_state.get("df")
-
-    if df is None or df.is_empty():
-        st.warning("No data available")
-        return
-
-    st.markdown("# 📋 Details")
-    st.markdown("Explore the detailed data with filters.")
-
-    filters = render_filter_sidebar(df, category_col="category", region_col="region")
-    filtered_df = apply_filters(df, filters)
+@st.fragment
+def render_export(engine, dataset, filters, n_records):
+    """Export controls; changing the format only reruns this fragment."""
+    max_rows = get_settings().export_max_rows or None
+    col1, col2 = st.columns(2)
 
-    if filtered_df.is_empty():
-        st.warning("No data for selected filters")
-        return
+    with col1:
+        fmt = st.selectbox(
+            "Format",
+            options=list(EXPORT_FORMATS),
+            format_func=lambda f: EXPORT_FORMATS[f].label,
+            key="export_format",
+            label_visibility="collapsed",
+        )
 
-    st.markdown(f"**{len(filtered_df):,}** records found")
+    with col2:
+        export_format = EXPORT_FORMATS[fmt]
+        # The export only runs when the button is clicked. The engine streams
+        # the rows to a temporary file, but Streamlit serves the download from
+        # memory, hence the row cap.
+        write = partial(engine.export, dataset, filters, fmt=fmt, limit=max_rows)
+        st.download_button(
+            label=f"📥 Download {export_format.label}",
+            data=lambda: read_export(write, fmt),
+            file_name=f"data_export{export_format.extension}",
+            mime=export_format.mime,
+        )
 
-    render_page_header("Data Table")
+    if max_rows and n_records > max_rows:
+        st.caption(f"Downloads hold the first {max_rows:,} of the {n_records:,} records.")
 
-    display_cols = ["date", "name", "category", "region", "value", "quantity"]
-    available_cols = [c for c in display_cols if c in filtered_df.columns]
-
-    display_df = filtered_df.select(available_cols)
-
-    col_names = {
-        "date": "Date",
-        "name": "Product",
-        "category": "Category",
-        "region": "Region",
-        "value": "Value",
-        "quantity": "Quantity",
-    }
-    display_df = display_df.rename({k: v for k, v in col_names.items() if k in available_cols})
-
-    st.dataframe(
-        display_df.to_pandas(),
-        width="stretch",
-        hide_index=True,
-        column_config={
-            "Value": st.column_config.NumberColumn(format="%.2f $"),
-            "Quantity": st.column_config.NumberColumn(format="%d"),
-        },
-    )
 
+def render_group_stats(results, stats):
+    """Category and region statistics tables."""
     render_page_header("Statistics by Category")
 
-    category_stats = (
-        filtered_df.group_by("category")
-        .agg(
-            [
-                pl.col("value").sum().alias("total"),
-                pl.col("value").mean().alias("average"),
-                pl.len().alias("count"),
-            ]
-        )
-        .sort("total", descending=True)
-    )
+    category_stats = results["category"]
 
     category_stats = category_stats.rename(
         {
@@ -77,10 +64,10 @@ def main():
         }
     )
 
-    st.dataframe(
-        category_stats.to_pandas(),
-        width="stretch",
-        hide_index=True,
+    render_dataframe(
+        category_stats,
+        stats=stats,
+        element="category_stats",
         column_config={
             "Total": st.column_config.NumberColumn(format="%.2f $"),
             "Average": st.column_config.NumberColumn(format="%.2f $"),
@@ -90,18 +77,8 @@ def main():
 
     render_page_header("Statistics by Region")
 
-    if "region" in filtered_df.columns:
-        region_stats = (
-            filtered_df.group_by("region")
-            .agg(
-                [
-                    pl.col("value").sum().alias("total"),
-                    pl.col("value").mean().alias("average"),
-                    pl.len().alias("count"),
-                ]
-            )
-            .sort("total", descending=True)
-        )
+    if "region" in results:
+        region_stats = results["region"]
 
         region_stats = region_stats.rename(
             {
@@ -112,10 +89,10 @@ def main():
             }
         )
 
-        st.dataframe(
-            region_stats.to_pandas(),
-            width="stretch",
-            hide_index=True,
+        render_dataframe(
+            region_stats,
+            stats=stats,
+            element="region_stats",
             column_config={
                 "Total": st.column_config.NumberColumn(format="%.2f $"),
                 "Average": st.column_config.NumberColumn(format="%.2f $"),
@@ -123,18 +100,74 @@ def main():
             },
         )
 
+
+def main():
+    dataset = st.session_state.get("dataset")
+    stats = start_render_stats()
+
+    engine = get_engine()
+
+    if dataset is None or engine.count(dataset, {}) == 0:
+        st.warning("No data available")
+        return
+
+    st.markdown("# 📋 Details")
+    st.markdown("Explore the detailed data with filters.")
+
+    filters = render_filter_sidebar(
+        dataset.scan(), category_col="category", region_col="region", index=dataset.index
+    )
+    record_view(dataset, filters)
+
+    # Group stats load on the query executor while the table renders.
+    sections = load_sections(
+        (Section("stats", detail_stats),),
+        engine,
+        dataset,
+        filters,
+    )
+    n_records = engine.count(dataset, filters)
+
+    if n_records == 0:
+        st.warning("No data for selected filters")
+        return
+
+    st.markdown(f"**{n_records:,}** records found")
+
+    render_page_header("Data Table")
+
+    st.fragment(render_data_table)(
+        engine,
+        dataset,
+        filters,
+        detail_columns(dataset),
+        total_rows=n_records,
+        column_labels={
+            "date": "Date",
+            "name": "Product",
+            "category": "Category",
+            "region": "Region",
+            "value": "Value",
+            "quantity": "Quantity",
+        },
+        column_config={
+            "Value": st.column_config.NumberColumn(format="%.2f $"),
+            "Quantity": st.column_config.NumberColumn(format="%d"),
+        },
+        stats=stats,
+    )
+
+    results = section_data(sections, "stats")
+
+    if results is not None:
+        render_group_stats(results, stats)
+
     render_page_header("Export")
 
-    col1, col2, col3 = st.columns(3)
+    col1, col2 = st.columns([2, 1])
 
     with col1:
-        csv = filtered_df.write_csv()
-        st.download_button(
-            label="📥 Download CSV",
-            data=csv,
-            file_name="data_export.csv",
-            mime="text/csv",
-        )
+        render_export(engine, dataset, filters, n_records)
 
     with col2:
         if st.button("🔄 Reinitialise filters"):
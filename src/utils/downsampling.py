@@ -0,0 +1,114 @@
+"""Utility functions for time bucketing and downsampling chart series."""
+
+from datetime import date, datetime
+
+import numpy as np
+import polars as pl
+
+# Bucket name -> Polars duration string, from finest to coarsest.
+BUCKETS = {"day": "1d", "week": "1w", "month": "1mo"}
+
+_BUCKET_DAYS = {"day": 1, "week": 7, "month": 30}
+
+
+def choose_bucket(start: date | datetime, end: date | datetime, max_buckets: int = 366) -> str:
+    """Pick the finest bucket keeping a date span within ``max_buckets`` points.
+
+    Args:
+        start: First date of the span.
+        end: Last date of the span.
+        max_buckets: Maximum number of buckets wanted.
+
+    Returns:
+        Bucket name from ``BUCKETS``.
+    """
+    span_days = (end - start).days + 1
+
+    for bucket, days in _BUCKET_DAYS.items():
+        if span_days / days <= max_buckets:
+            return bucket
+
+    return "month"
+
+
+def bucket_series(df: pl.DataFrame, x: str, y: str, bucket: str, agg: str = "sum") -> pl.DataFrame:
+    """Re-aggregate a time series into coarser buckets.
+
+    Args:
+        df: Series with one row per ``x`` value.
+        x: Date or datetime column.
+        y: Value column.
+        bucket: Bucket name from ``BUCKETS``.
+        agg: How values combine within a bucket ("sum" or "mean").
+
+    Returns:
+        DataFrame with one row per bucket start, sorted by ``x``.
+    """
+    value = pl.col(y).sum() if agg == "sum" else pl.col(y).mean()
+
+    return df.lazy().group_by(pl.col(x).dt.truncate(BUCKETS[bucket])).agg(value).sort(x).collect()
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Select points with Largest-Triangle-Three-Buckets downsampling.
+
+    LTTB keeps the first and last points and, per bucket, the point forming
+    the largest triangle with its neighbours, so peaks and troughs survive.
+
+    Args:
+        x: Sorted x values, numeric.
+        y: y values.
+        threshold: Number of points to keep.
+
+    Returns:
+        Sorted indices of the points to keep.
+    """
+    n = len(x)
+
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    previous = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[next_lo:next_hi].mean()
+        next_y = y[next_lo:next_hi].mean()
+
+        areas = np.abs(
+            (x[previous] - next_x) * (y[lo:hi] - y[previous])
+            - (x[previous] - x[lo:hi]) * (next_y - y[previous])
+        )
+        previous = lo + int(np.argmax(areas))
+        selected[i + 1] = previous
+
+    return selected
+
+
+def downsample(df: pl.DataFrame, x: str, y: str, max_points: int) -> pl.DataFrame:
+    """Cap the points of a sorted series with LTTB.
+
+    Args:
+        df: Series sorted by ``x``.
+        x: Numeric, date or datetime column.
+        y: Value column.
+        max_points: Maximum number of rows returned.
+
+    Returns:
+        The series itself if short enough, else a subset of its rows.
+    """
+    if len(df) <= max_points:
+        return df
+
+    indices = lttb_indices(
+        df.get_column(x).to_physical().to_numpy(),
+        df.get_column(y).to_numpy(),
+        max_points,
+    )
+    return df[indices]
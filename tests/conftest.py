@@ -0,0 +1,23 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def query_cache(tmp_path, monkeypatch):
+    """Give each test its own query cache, with the disk tier under ``tmp_path``.
+
+    The process-wide cache otherwise persists results in the developer's
+    ``.cache/query_results`` and ``clear()`` would wipe it.
+    """
+    from src.config import get_settings
+    from src.data.cache import get_query_cache
+
+    monkeypatch.setenv("QUERY_DISK_CACHE_DIR", str(tmp_path / "query_results"))
+    get_settings.cache_clear()
+    get_query_cache.clear()
+
+    yield get_query_cache()
+
+    get_query_cache.clear()
+    get_settings.cache_clear()
@@ -0,0 +1,101 @@
+"""Tests for the declarative aggregation module."""
+
+import re
+from datetime import date
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+
+@pytest.fixture
+def sample_df():
+    """Create a small sales-like DataFrame."""
+    return pl.DataFrame(
+        {
+            "date": [date(2025, 1, 1), date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)],
+            "category": ["A", "B", "A", "B"],
+            "region": ["North", "South", "South", "North"],
+            "value": [100.0, 200.0, 300.0, None],
+        }
+    )
+
+
+def _groupings():
+    """Build KPIs, per-category stats and a daily series."""
+    from src.data.aggregate import Grouping, Metric, group_stats_metrics, summary_metrics
+
+    return (
+        Grouping("kpis", summary_metrics()),
+        Grouping("by_category", group_stats_metrics(), by=("category",), sort="category"),
+        Grouping("daily", (Metric("value", "sum", "value"),), by=("date",), sort="date"),
+    )
+
+
+class TestMetric:
+    """Tests for Metric validation."""
+
+    def test_unknown_aggregation(self):
+        """Test an unknown aggregation is rejected."""
+        from src.data.aggregate import Metric
+
+        with pytest.raises(ValueError, match="Unknown aggregation"):
+            Metric("x", "median", "value")
+
+    def test_column_required(self):
+        """Test only len works without a column."""
+        from src.data.aggregate import Metric
+
+        with pytest.raises(ValueError, match="needs a column"):
+            Metric("x", "sum")
+
+        assert Metric("rows", "len").column is None
+
+
+class TestEvaluate:
+    """Tests for evaluate."""
+
+    def test_matches_separate_queries(self, sample_df):
+        """Test each grouping matches the existing single-purpose helpers."""
+        from src.data.aggregate import evaluate, to_summary
+        from src.data.loader import compute_group_stats, compute_summary
+
+        results = evaluate(sample_df.lazy(), _groupings())
+
+        assert to_summary(results["kpis"]) == compute_summary(sample_df)
+        assert_frame_equal(
+            results["by_category"],
+            compute_group_stats(sample_df, "category").sort("category"),
+        )
+        assert results["daily"]["value"].to_list() == [300.0, 300.0, 0.0]
+
+    def test_single_scan(self, sample_df):
+        """Test the plans share one cached input."""
+        from src.data.aggregate import Grouping, summary_metrics
+
+        lf = sample_df.lazy().filter(pl.col("value") > 0)
+        groupings = _groupings() + (Grouping("by_region", summary_metrics(), by=("region",)),)
+        plan = pl.explain_all([g.plan(lf) for g in groupings])
+
+        assert len(set(re.findall(r"CACHE\[id: ([^\]]+)\]", plan))) == 1
+
+    def test_rollup_matches_raw(self, sample_df):
+        """Test metrics computed from rollup cells equal the raw-row result."""
+        from src.data.aggregate import evaluate
+        from src.data.rollup import build_rollup
+
+        raw = evaluate(sample_df, _groupings())
+        cube = evaluate(build_rollup(sample_df), _groupings(), rollup=True)
+
+        for name, expected in raw.items():
+            assert_frame_equal(cube[name], expected)
+
+    def test_empty(self, sample_df):
+        """Test no matching rows give an empty summary."""
+        from src.data.aggregate import evaluate, to_summary
+        from src.data.rollup import build_rollup
+
+        empty = sample_df.clear()
+
+        assert to_summary(evaluate(empty, _groupings())["kpis"]) == {}
+        assert to_summary(evaluate(build_rollup(empty), _groupings(), rollup=True)["kpis"]) == {}
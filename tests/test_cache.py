@@ -0,0 +1,181 @@
+"""Tests for query result cache."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import polars as pl
+import pytest
+
+
+class TestQueryCache:
+    """Tests for QueryCache class."""
+
+    def test_hit_and_miss_counters(self):
+        """Test hits and misses are counted."""
+        from src.data.cache import QueryCache
+
+        cache = QueryCache(max_entries=4)
+
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted first."""
+        from src.data.cache import QueryCache
+
+        cache = QueryCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats.evictions == 1
+
+    def test_get_or_compute_runs_once(self):
+        """Test compute callable only runs on a miss."""
+        from src.data.cache import QueryCache
+
+        cache = QueryCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 42
+
+        assert cache.get_or_compute("k", compute) == 42
+        assert cache.get_or_compute("k", compute) == 42
+        assert len(calls) == 1
+
+    def test_concurrent_misses_are_coalesced(self):
+        """Test concurrent callers of one key share a single computation."""
+        from src.data.cache import QueryCache
+
+        cache = QueryCache()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            leader = pool.submit(cache.get_or_compute, "k", compute)
+            started.wait(5)
+            followers = [pool.submit(cache.get_or_compute, "k", compute) for _ in range(7)]
+
+            while cache.stats.coalesced < 7:
+                time.sleep(0.01)
+            release.set()
+
+            results = [leader.result(5)] + [f.result(5) for f in followers]
+
+        assert results == [42] * 8
+        assert len(calls) == 1
+        assert cache.stats.coalesced == 7
+
+    def test_coalesced_callers_share_errors(self):
+        """Test a failed computation raises in every waiting caller and is not cached."""
+        from src.data.cache import QueryCache
+
+        cache = QueryCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(cache.get_or_compute, "k", compute)
+            started.wait(5)
+            follower = pool.submit(cache.get_or_compute, "k", compute)
+
+            while cache.stats.coalesced < 1:
+                time.sleep(0.01)
+            release.set()
+
+            for future in (leader, follower):
+                with pytest.raises(RuntimeError, match="boom"):
+                    future.result(5)
+
+        assert "k" not in cache
+        assert cache.get_or_compute("k", lambda: 1) == 1
+
+    def test_invalid_size(self):
+        """Test non-positive size is rejected."""
+        from src.data.cache import QueryCache
+
+        with pytest.raises(ValueError):
+            QueryCache(max_entries=0)
+
+
+class TestMakeCacheKey:
+    """Tests for cache key helpers."""
+
+    def test_filter_order_independent(self):
+        """Test key does not depend on filter insertion order."""
+        from src.data.cache import make_cache_key
+
+        a = make_cache_key("fp", {"category": "Food", "start_date": date(2026, 1, 1)})
+        b = make_cache_key("fp", {"start_date": date(2026, 1, 1), "category": "Food"})
+
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_fingerprint_changes_key(self):
+        """Test a new dataset version yields a different key."""
+        from src.data.cache import make_cache_key
+
+        assert make_cache_key("v1", {}) != make_cache_key("v2", {})
+
+    def test_engine_serves_repeated_queries(self, tmp_path):
+        """Test an engine serves a repeated query from the cache."""
+        from src.data.cache import get_query_cache
+        from src.data.dataset import get_dataset
+        from src.data.engine import PolarsEngine
+
+        path = tmp_path / "data.parquet"
+        pl.DataFrame({"category": ["A", "B"], "value": [1.0, 2.0]}).write_parquet(path)
+        dataset = get_dataset(path)
+        engine = PolarsEngine()
+
+        first = engine.summary(dataset, {"category": "A"})
+        hits = get_query_cache().stats.hits
+        second = engine.summary(dataset, {"category": "A"})
+
+        assert first == second
+        assert get_query_cache().stats.hits == hits + 1
+
+    def test_engines_and_modes_do_not_share_entries(self, tmp_path):
+        """Test results cached in eager mode or by another engine are not served."""
+        from src.data.dataset import get_dataset
+        from src.data.dictionary import write_dictionary
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        path = tmp_path / "data.parquet"
+        pl.DataFrame({"category": ["A", "B"], "value": [1.0, 2.0]}).write_parquet(path)
+        write_dictionary({"category": ("A", "B")}, path)
+        engine = PolarsEngine()
+
+        eager = engine.top_k(get_dataset(path), {}, 1)
+        lazy = engine.top_k(get_dataset(path, lazy=True), {}, 1)
+        duckdb = DuckDBEngine().top_k(get_dataset(path, lazy=True), {}, 1)
+
+        assert eager.schema["category"] == pl.Enum(["A", "B"])
+        assert lazy.schema["category"] == pl.String
+        assert duckdb.schema["category"] == pl.String
@@ -0,0 +1,65 @@
+"""Tests for the pandas-free chart adapter."""
+
+from datetime import date
+
+import numpy as np
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def daily():
+    """Daily totals."""
+    return pl.DataFrame(
+        {
+            "date": [date(2025, 1, 1), date(2025, 1, 2)],
+            "category": ["A", "B"],
+            "value": [10.0, 20.0],
+        }
+    )
+
+
+class TestColumnArray:
+    """Tests for column_array function."""
+
+    def test_numeric_is_zero_copy(self, daily):
+        """Test a null-free float column shares the Polars buffer."""
+        from src.components.charts import RenderStats, column_array
+
+        stats = RenderStats()
+        array = column_array(daily, "value", stats)
+
+        assert array.tolist() == [10.0, 20.0]
+        assert stats.total == 0
+
+    def test_copy_is_recorded(self, daily):
+        """Test converted columns record the bytes copied."""
+        from src.components.charts import RenderStats, column_array
+
+        stats = RenderStats()
+        array = column_array(daily, "date", stats, element="line")
+
+        assert array.dtype == np.dtype("datetime64[D]")
+        assert stats.bytes_copied == {"line": array.nbytes}
+
+
+class TestFigures:
+    """Tests for figure builders."""
+
+    def test_line_figure(self, daily):
+        """Test the line trace is built from the columns."""
+        from src.components.charts import line_figure
+
+        trace = line_figure(daily, "date", "value").data[0]
+
+        assert trace.mode == "lines+markers"
+        assert list(trace.y) == [10.0, 20.0]
+
+    def test_pie_figure(self, daily):
+        """Test the pie trace uses labels and values."""
+        from src.components.charts import pie_figure
+
+        trace = pie_figure(daily, values="value", names="category").data[0]
+
+        assert list(trace.labels) == ["A", "B"]
+        assert list(trace.values) == [10.0, 20.0]
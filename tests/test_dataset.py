@@ -0,0 +1,236 @@
+"""Tests for shared dataset handles."""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def parquet_file():
+    """Write a small Parquet file and remove it afterwards."""
+    df = pl.DataFrame(
+        {
+            "date": [date(2025, 1, 1), date(2025, 1, 2)],
+            "category": ["A", "B"],
+            "value": [100.0, 200.0],
+        }
+    )
+
+    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
+        temp_path = f.name
+        df.write_parquet(temp_path)
+
+    yield temp_path
+
+    Path(temp_path).unlink(missing_ok=True)
+
+
+class TestGetDataset:
+    """Tests for get_dataset function."""
+
+    def test_same_handle_across_calls(self, parquet_file):
+        """Test repeated calls share one in-memory frame."""
+        from src.data.dataset import get_dataset
+
+        first = get_dataset(parquet_file)
+        second = get_dataset(parquet_file)
+
+        assert first is second
+        assert first.frame is second.frame
+        assert first.scan().collect()["value"].sum() == 300.0
+
+    def test_eager_handle_has_rollup_and_baseline(self, parquet_file):
+        """Test an eager load builds a missing rollup and the KPI baseline."""
+        from src.data.dataset import get_dataset
+
+        dataset = get_dataset(parquet_file)
+
+        assert dataset.rollup["count"].sum() == 2
+        assert dataset.baseline.summary["total"] == 300.0
+        assert (dataset.baseline.start, dataset.baseline.end) == (
+            date(2025, 1, 1),
+            date(2025, 1, 2),
+        )
+
+    def test_lazy_handle_holds_no_data(self, parquet_file):
+        """Test lazy mode scans the file instead of keeping a frame."""
+        from src.data.dataset import get_dataset
+
+        dataset = get_dataset(parquet_file, lazy=True)
+
+        assert dataset.is_lazy
+        assert dataset.nbytes == 0
+        assert len(dataset.scan().collect()) == 2
+
+    def test_file_not_found(self):
+        """Test loading non-existent file."""
+        from src.data.dataset import get_dataset
+
+        with pytest.raises(FileNotFoundError):
+            get_dataset("nonexistent.parquet")
+
+
+class TestResolveLazy:
+    """Tests for resolve_lazy function."""
+
+    def test_explicit_mode_wins(self, parquet_file):
+        """Test a configured mode is used whatever the data size."""
+        from src.data.dataset import resolve_lazy
+
+        assert resolve_lazy(parquet_file, True, eager_max_mb=512) is True
+        assert resolve_lazy(parquet_file, False, eager_max_mb=0) is False
+
+    def test_small_data_loads_eagerly(self, parquet_file):
+        """Test data under the size limit is held in memory by default."""
+        from src.data.dataset import resolve_lazy
+
+        assert resolve_lazy(parquet_file, None, eager_max_mb=512) is False
+
+    def test_choice_sticks_as_data_grows(self, parquet_file):
+        """Test the mode is picked once, from the size at the first call."""
+        from src.data.dataset import resolve_lazy
+
+        size_mb = Path(parquet_file).stat().st_size / 1024 / 1024
+
+        assert resolve_lazy(parquet_file, None, eager_max_mb=size_mb / 2) is True
+        assert resolve_lazy(parquet_file, None, eager_max_mb=size_mb * 2) is True
+
+
+class TestRollupVersion:
+    """Tests for matching the persisted rollup to the data version."""
+
+    def test_regenerated_data_with_same_row_count(self, tmp_path):
+        """Test the rollup of the previous data is not served after a full refresh."""
+        from src.data.dataset import get_dataset
+        from src.data.engine import PolarsEngine
+        from src.data.rollup import build_rollup, write_rollup
+
+        path = tmp_path / "sales.parquet"
+        v1 = pl.DataFrame(
+            {
+                "date": [date(2025, 1, 1), date(2025, 1, 2)],
+                "category": ["A", "B"],
+                "value": [100.0, 200.0],
+            }
+        )
+        v1.write_parquet(path)
+        write_rollup(build_rollup(v1), path)
+        assert get_dataset(path, lazy=True).rollup is not None
+
+        # The data is replaced first; the rollup is rewritten afterwards.
+        v2 = v1.with_columns(pl.col("value") * 2)
+        v2.write_parquet(path)
+        stale = get_dataset(path, lazy=True)
+
+        assert stale.rollup is None
+        assert PolarsEngine().summary(stale, {})["total"] == 600.0
+
+        write_rollup(build_rollup(v2), path)
+        fresh = get_dataset(path, lazy=True)
+
+        assert fresh is not stale
+        assert fresh.rollup["value_sum"].sum() == 600.0
+        assert PolarsEngine().summary(fresh, {})["total"] == 600.0
+
+
+class TestDatasetWatcher:
+    """Tests for background change detection."""
+
+    def test_swaps_new_version(self, tmp_path):
+        """Test the watcher swaps in a rewritten file while old handles stay valid."""
+        import time
+
+        from src.data.dataset import DatasetWatcher, get_dataset
+
+        path = tmp_path / "data.parquet"
+        pl.DataFrame({"value": [1.0]}).write_parquet(path)
+        old = get_dataset(path)
+
+        watcher = DatasetWatcher(path, interval=0.01)
+        watcher.start()
+        try:
+            pl.DataFrame({"value": [1.0, 2.0]}).write_parquet(path)
+            deadline = time.monotonic() + 5
+            while get_dataset(path) is old and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            watcher.stop()
+            watcher.join()
+
+        assert len(get_dataset(path).frame) == 2
+        assert len(old.frame) == 1
+
+
+class TestDatasetMemoryUsage:
+    """Tests for dataset_memory_usage function."""
+
+    def test_reports_resident_bytes(self, parquet_file):
+        """Test loaded datasets are reported with their size."""
+        from src.data.dataset import dataset_memory_usage, get_dataset
+
+        dataset = get_dataset(parquet_file)
+        usage = dataset_memory_usage()
+
+        assert usage[f"{parquet_file}@{dataset.fingerprint}"] == dataset.nbytes
+        assert dataset.nbytes > 0
+
+
+class TestIncrementalRefresh:
+    """Tests for folding appended files into a loaded dataset."""
+
+    @staticmethod
+    def _write_part(root, month, name, df):
+        from src.data.manifest import describe_file
+
+        directory = root / f"month={month}" / "region=North"
+        directory.mkdir(parents=True, exist_ok=True)
+        df.write_parquet(directory / name)
+        return describe_file(root, directory / name)
+
+    def test_append_folds_delta(self, tmp_path):
+        """Test a manifest append extends the frame and rollup without a reload."""
+        from src.data.dataset import get_dataset
+        from src.data.manifest import Manifest, write_manifest
+        from src.data.rollup import build_rollup, write_rollup
+
+        root = tmp_path / "sales"
+        base = pl.DataFrame({"date": [date(2025, 1, 1)], "category": ["A"], "value": [100.0]})
+        first = self._write_part(root, "2025-01", "part-00000.parquet", base)
+        write_manifest(root, Manifest(0, (first,)))
+        write_rollup(build_rollup(get_dataset(root, lazy=True).scan()), root)
+
+        before = get_dataset(root)
+        assert before.rollup is not None
+
+        delta = pl.DataFrame({"date": [date(2025, 2, 1)], "category": ["B"], "value": [50.0]})
+        second = self._write_part(root, "2025-02", "part-00001.parquet", delta)
+        write_manifest(root, Manifest(1, (first, second)))
+
+        after = get_dataset(root)
+
+        assert after is not before
+        assert after.manifest.version == 1
+        assert after.frame["value"].to_list() == [100.0, 50.0]
+        assert after.rollup["count"].sum() == 2
+        assert after.index.unique_values("category") == ["A", "B"]
+        assert after.frame.schema["category"] == pl.Enum(["A", "B"])
+        assert after.index.bounds("month") == ("2025-01", "2025-02")
+        assert before.frame["value"].to_list() == [100.0]
+        assert after.baseline.summary["total"] == 150.0
+        assert after.baseline.end == date(2025, 2, 1)
+
+    def test_unlisted_files_are_ignored(self, tmp_path):
+        """Test files not yet committed to the manifest stay invisible."""
+        from src.data.dataset import get_dataset
+        from src.data.manifest import Manifest, write_manifest
+
+        root = tmp_path / "sales"
+        df = pl.DataFrame({"date": [date(2025, 1, 1)], "value": [1.0]})
+        first = self._write_part(root, "2025-01", "part-00000.parquet", df)
+        write_manifest(root, Manifest(0, (first,)))
+        self._write_part(root, "2025-02", "part-00001.parquet", df)
+
+        assert len(get_dataset(root).frame) == 1
@@ -0,0 +1,77 @@
+"""Tests for Enum label dictionaries."""
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def sales_df():
+    """Small sales DataFrame with string dimensions."""
+    return pl.DataFrame(
+        {
+            "category": ["B", "A", "B"],
+            "region": ["North", "South", None],
+            "value": [10.0, 20.0, 30.0],
+        }
+    )
+
+
+class TestExtendDictionary:
+    """Tests for extend_dictionary function."""
+
+    def test_existing_codes_are_stable(self):
+        """Test new labels are appended after the known ones."""
+        from src.data.dictionary import extend_dictionary
+
+        dictionary = {"category": ("B", "D")}
+        extended = extend_dictionary(dictionary, {"category": ["C", "A", "B", None]})
+
+        assert extended == {"category": ("B", "D", "A", "C")}
+
+    def test_unchanged_returns_same_object(self):
+        """Test nothing new leaves the dictionary as is."""
+        from src.data.dictionary import extend_dictionary
+
+        dictionary = {"category": ("A",)}
+
+        assert extend_dictionary(dictionary, {"category": ["A"]}) is dictionary
+
+
+class TestEncodeDimensions:
+    """Tests for dictionary persistence and encoding."""
+
+    def test_round_trip(self, sales_df, tmp_path):
+        """Test a written dictionary is read back and encodes the frame."""
+        from src.data.dictionary import (
+            dimension_values,
+            encode_dimensions,
+            extend_dictionary,
+            read_dictionary,
+            write_dictionary,
+        )
+
+        path = tmp_path / "data.parquet"
+        assert read_dictionary(path) == {}
+
+        write_dictionary(extend_dictionary({}, dimension_values(sales_df)), path)
+        dictionary = read_dictionary(path)
+        encoded = encode_dimensions(sales_df, dictionary)
+
+        assert dictionary == {"category": ("A", "B"), "region": ("North", "South")}
+        assert encoded.schema["category"] == pl.Enum(["A", "B"])
+        assert encoded["region"].to_list() == ["North", "South", None]
+        assert encoded.filter(pl.col("category") == "B")["value"].sum() == 40.0
+
+    def test_read_data_encodes(self, sales_df, tmp_path):
+        """Test read_data returns Enum dimensions with persisted code order."""
+        from src.data.dictionary import write_dictionary
+        from src.data.loader import read_data
+
+        path = tmp_path / "data.parquet"
+        sales_df.write_parquet(path)
+        write_dictionary({"category": ("B",)}, path)
+
+        df = read_data(path)
+
+        assert df.schema["category"] == pl.Enum(["B", "A"])
+        assert df["category"].to_list() == ["B", "A", "B"]
@@ -0,0 +1,143 @@
+"""Tests for the on-disk query result cache."""
+
+import os
+from dataclasses import dataclass
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+
+@pytest.fixture
+def disk(tmp_path):
+    """Create a disk cache in a temporary directory."""
+    from src.data.disk_cache import DiskCache
+
+    return DiskCache(tmp_path / "cache", max_bytes=10 * 1024**2)
+
+
+@dataclass(frozen=True)
+class Spec:
+    """Frozen query spec used inside keys."""
+
+    column: str
+
+
+class TestStableKey:
+    """Tests for stable_key function."""
+
+    def test_tuples_and_dataclasses(self):
+        """Test nested tuples and frozen dataclasses render deterministically."""
+        from src.data.disk_cache import stable_key
+
+        key = ("fp", (("category", "A"),), "evaluate", (Spec("value"),))
+
+        assert stable_key(key) == stable_key(
+            ("fp", (("category", "A"),), "evaluate", (Spec("value"),))
+        )
+        assert stable_key(key) != stable_key(("fp", (), "evaluate", (Spec("value"),)))
+
+    def test_unstable_parts(self):
+        """Test keys holding objects without a stable text are rejected."""
+        from src.data.disk_cache import stable_key
+
+        assert stable_key(("fp", print)) is None
+        assert stable_key(("fp", object())) is None
+
+
+class TestDiskCache:
+    """Tests for DiskCache class."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"total": 10.0, "mean": 5.0, "count": 2, "min": 4.0, "max": 6.0},
+            {},
+            42,
+        ],
+    )
+    def test_roundtrip_values(self, disk, value):
+        """Test summaries and scalars come back unchanged."""
+        disk.put(("fp", "q"), value)
+
+        assert disk.get(("fp", "q")) == value
+
+    def test_roundtrip_frames(self, disk):
+        """Test frames and named frames keep their values and dtypes."""
+        df = pl.DataFrame({"category": ["A", "B"], "value": [1.0, 2.0]}).with_columns(
+            pl.col("category").cast(pl.Enum(["A", "B"]))
+        )
+
+        disk.put(("fp", "frame"), df)
+        disk.put(("fp", "frames"), {"by_category": df, "empty": df.clear()})
+
+        assert_frame_equal(disk.get(("fp", "frame")), df)
+        frames = disk.get(("fp", "frames"))
+        assert list(frames) == ["by_category", "empty"]
+        assert_frame_equal(frames["empty"], df.clear())
+
+    def test_miss_and_unsupported(self, disk):
+        """Test misses, unstable keys and unsupported values are not stored."""
+        assert disk.get(("fp", "missing"), "default") == "default"
+        assert not disk.put(("fp", print), 1)
+        assert not disk.put(("fp", "set"), {1, 2})
+        assert len(disk) == 0
+
+    def test_shared_between_instances(self, disk):
+        """Test another process's cache on the same directory sees the result."""
+        from src.data.disk_cache import DiskCache
+
+        disk.put(("fp", "q"), 1)
+
+        assert DiskCache(disk.directory).get(("fp", "q")) == 1
+
+    def test_lru_eviction(self, disk):
+        """Test the least recently used files go first once over the cap."""
+        df = pl.DataFrame({"value": list(range(1000))})
+        disk.put(("fp", "a"), df)
+        disk.put(("fp", "b"), df)
+
+        # Make "a" the oldest, then read it so that "b" becomes least recent.
+        os.utime(disk.path(("fp", "a")), (0, 0))
+        os.utime(disk.path(("fp", "b")), (1, 1))
+        disk.get(("fp", "a"))
+
+        disk.max_bytes = disk.nbytes + 1
+        disk.put(("fp", "c"), df)
+
+        assert disk.get(("fp", "a")) is not None
+        assert disk.get(("fp", "b")) is None
+        assert disk.get(("fp", "c")) is not None
+
+    def test_corrupt_file_is_a_miss(self, disk):
+        """Test an unreadable file is ignored."""
+        disk.path(("fp", "q")).write_bytes(b"not arrow")
+
+        assert disk.get(("fp", "q")) is None
+
+    def test_undecodable_entry_is_a_miss(self, disk):
+        """Test a readable file with an unknown envelope is ignored."""
+        pl.DataFrame({"kind": ["future"], "name": [None], "payload": [b""]}).write_ipc(
+            disk.path(("fp", "q"))
+        )
+
+        assert disk.get(("fp", "q"), "miss") == "miss"
+
+    def test_schema_version_salts_paths(self, disk, monkeypatch):
+        """Test files written under another cache schema version are not served."""
+        from src.data import disk_cache
+
+        disk.put(("fp", "q"), 7)
+        monkeypatch.setattr(disk_cache, "CACHE_SCHEMA_VERSION", disk_cache.CACHE_SCHEMA_VERSION + 1)
+
+        assert disk.get(("fp", "q")) is None
+
+    def test_query_cache_reads_disk_tier(self, disk):
+        """Test a fresh process's query cache serves results from disk."""
+        from src.data.cache import QueryCache
+
+        QueryCache(disk=disk).get_or_compute(("fp", "q"), lambda: 7)
+        restarted = QueryCache(disk=disk)
+
+        assert restarted.get_or_compute(("fp", "q"), lambda: pytest.fail("recomputed")) == 7
+        assert restarted.stats.disk_hits == 1
@@ -0,0 +1,77 @@
+"""Tests for downsampling utilities."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+
+from src.utils.downsampling import bucket_series, choose_bucket, downsample, lttb_indices
+
+
+class TestChooseBucket:
+    """Tests for choose_bucket function."""
+
+    def test_short_span_is_daily(self):
+        """Test a quarter is plotted per day."""
+        assert choose_bucket(date(2025, 1, 1), date(2025, 3, 31)) == "day"
+
+    def test_long_spans_are_coarser(self):
+        """Test multi-year spans move to weeks then months."""
+        assert choose_bucket(date(2023, 1, 1), date(2025, 12, 31)) == "week"
+        assert choose_bucket(date(2000, 1, 1), date(2025, 12, 31)) == "month"
+
+
+class TestBucketSeries:
+    """Tests for bucket_series function."""
+
+    def test_monthly_sums(self):
+        """Test daily values are summed per month."""
+        df = pl.DataFrame(
+            {
+                "date": [date(2025, 1, 1), date(2025, 1, 31), date(2025, 2, 1)],
+                "value": [1.0, 2.0, 4.0],
+            }
+        )
+
+        result = bucket_series(df, "date", "value", "month")
+
+        assert result["date"].to_list() == [date(2025, 1, 1), date(2025, 2, 1)]
+        assert result["value"].to_list() == [3.0, 4.0]
+
+
+class TestLttb:
+    """Tests for LTTB downsampling."""
+
+    def test_keeps_ends_and_peak(self):
+        """Test the first, last and extreme points survive."""
+        y = np.zeros(1000)
+        y[437] = 100.0
+        y[812] = -50.0
+
+        indices = lttb_indices(np.arange(1000), y, 20)
+
+        assert len(indices) == 20
+        assert indices[0] == 0 and indices[-1] == 999
+        assert {437, 812} <= set(indices.tolist())
+        assert np.all(np.diff(indices) > 0)
+
+    def test_short_series_unchanged(self):
+        """Test series within the cap are returned as is."""
+        df = pl.DataFrame({"date": [date(2025, 1, 1)], "value": [1.0]})
+
+        assert downsample(df, "date", "value", 10) is df
+
+    def test_downsample_dates(self):
+        """Test a date series is capped at max_points rows."""
+        start = date(2020, 1, 1)
+        df = pl.DataFrame(
+            {
+                "date": [start + timedelta(days=i) for i in range(2000)],
+                "value": np.sin(np.arange(2000) / 50.0),
+            }
+        )
+
+        result = downsample(df, "date", "value", 100)
+
+        assert len(result) == 100
+        assert result["date"].is_sorted()
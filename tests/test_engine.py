@@ -0,0 +1,353 @@
+"""Tests for the pluggable query engines."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+FILTER_CASES = [
+    {},
+    {"category": "A"},
+    {"region": "South"},
+    {"start_date": date(2025, 1, 6), "end_date": date(2025, 2, 28)},
+    {"start_date": date(2025, 1, 6), "end_date": date(2025, 2, 28), "category": "B"},
+    {"category": "missing"},
+]
+
+
+@pytest.fixture
+def sample_df():
+    """Create a small sales-like DataFrame."""
+    return pl.DataFrame(
+        {
+            "date": [date(2025, 1, 5), date(2025, 1, 6), date(2025, 2, 3), date(2025, 2, 4)],
+            "category": ["A", "B", "A", "B"],
+            "month": ["2025-01", "2025-01", "2025-02", "2025-02"],
+            "region": ["North", "South", "North", "South"],
+            "value": [100.0, 200.0, 300.0, 50.0],
+        }
+    )
+
+
+@pytest.fixture(params=["file", "partitioned"])
+def dataset(request, sample_df, tmp_path):
+    """Load the sample rows as a single file and as a hive-partitioned directory."""
+    from src.data.dataset import get_dataset
+
+    if request.param == "file":
+        path = tmp_path / "data.parquet"
+        sample_df.drop("month").write_parquet(path)
+    else:
+        path = tmp_path / "sales"
+        for (month, region), part in sample_df.partition_by(
+            ["month", "region"], as_dict=True
+        ).items():
+            directory = path / f"month={month}" / f"region={region}"
+            directory.mkdir(parents=True)
+            part.drop("month", "region").write_parquet(directory / "part-0.parquet")
+
+    return get_dataset(path, lazy=True)
+
+
+@pytest.fixture
+def appended_dataset(sample_df, tmp_path):
+    """Load a partitioned dataset whose second version appended files to existing partitions."""
+    from src.data.dataset import get_dataset
+    from src.data.manifest import Manifest, describe_file, write_manifest
+
+    delta = pl.DataFrame(
+        {
+            "date": [date(2025, 1, 7), date(2025, 2, 5)],
+            "category": ["A", "B"],
+            "month": ["2025-01", "2025-02"],
+            "region": ["North", "South"],
+            "value": [75.0, 60.0],
+        }
+    )
+    root = tmp_path / "sales"
+    entries = []
+
+    for name, rows in (("part-00000.parquet", sample_df), ("part-00001.parquet", delta)):
+        for (month, region), part in rows.partition_by(["month", "region"], as_dict=True).items():
+            directory = root / f"month={month}" / f"region={region}"
+            directory.mkdir(parents=True, exist_ok=True)
+            part.drop("month", "region").write_parquet(directory / name)
+            entries.append(describe_file(root, directory / name))
+
+    write_manifest(root, Manifest(1, tuple(entries)))
+    return get_dataset(root, lazy=True)
+
+
+def _run(engine, method, *args):
+    """Call an engine method with a cold query cache."""
+    from src.data.cache import get_query_cache
+
+    get_query_cache().clear()
+    return getattr(engine, method)(*args)
+
+
+class TestEngines:
+    """Tests both engines return identical results."""
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    def test_summary_and_count_match(self, dataset, filters):
+        """Test summary and count agree between engines."""
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        polars_engine, duckdb_engine = PolarsEngine(), DuckDBEngine()
+
+        expected = _run(polars_engine, "summary", dataset, filters)
+        actual = _run(duckdb_engine, "summary", dataset, filters)
+
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            assert actual[key] == pytest.approx(expected[key])
+
+        assert _run(duckdb_engine, "count", dataset, filters) == _run(
+            polars_engine, "count", dataset, filters
+        )
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    @pytest.mark.parametrize("agg", ["sum", "mean", "count"])
+    def test_aggregate_matches(self, dataset, filters, agg):
+        """Test grouped aggregates agree between engines."""
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        args = (dataset, filters, "category", "value", agg)
+        expected = _run(PolarsEngine(), "aggregate", *args)
+        actual = _run(DuckDBEngine(), "aggregate", *args)
+
+        assert_frame_equal(actual, expected, check_row_order=False)
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    def test_group_stats_match(self, dataset, filters):
+        """Test grouped total/average/count agree between engines."""
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        args = (dataset, filters, "region")
+        expected = _run(PolarsEngine(), "group_stats", *args)
+        actual = _run(DuckDBEngine(), "group_stats", *args)
+
+        assert_frame_equal(actual, expected, check_row_order=False)
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    def test_filter_matches(self, dataset, filters):
+        """Test filtered rows agree between engines."""
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        columns = ["date", "category", "value"]
+        expected = PolarsEngine().filter(dataset, filters, columns).collect()
+        actual = DuckDBEngine().filter(dataset, filters, columns).collect()
+
+        assert_frame_equal(actual.sort("date"), expected.sort("date"))
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    def test_evaluate_matches(self, dataset, filters):
+        """Test one-pass groupings agree between engines and the single queries."""
+        from src.data.aggregate import (
+            Grouping,
+            Metric,
+            group_stats_metrics,
+            summary_metrics,
+            to_summary,
+        )
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        groupings = (
+            Grouping("kpis", summary_metrics()),
+            Grouping("by_region", group_stats_metrics(), by=("region",), sort="region"),
+            Grouping("daily", (Metric("value", "sum", "value"),), by=("date",), sort="date"),
+        )
+        expected = _run(PolarsEngine(), "evaluate", dataset, filters, groupings)
+        actual = _run(DuckDBEngine(), "evaluate", dataset, filters, groupings)
+
+        for name in expected:
+            assert_frame_equal(actual[name], expected[name], check_dtypes=False)
+
+        assert to_summary(expected["kpis"]) == _run(PolarsEngine(), "summary", dataset, filters)
+        assert_frame_equal(
+            expected["by_region"],
+            _run(PolarsEngine(), "group_stats", dataset, filters, "region").sort("region"),
+            check_dtypes=False,
+        )
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    @pytest.mark.parametrize("group_col", [None, "region"])
+    def test_top_k_matches(self, dataset, filters, group_col):
+        """Test top rows agree between engines, the top-k index and a full sort."""
+        from dataclasses import replace
+
+        from src.data.engine import DuckDBEngine, PolarsEngine
+        from src.data.loader import build_top_k_index
+        from src.data.rollup import ROLLUP_DIMENSIONS
+
+        columns = ["region", "category", "value"]
+        args = (filters, 1, "value", group_col, columns)
+        expected = _run(PolarsEngine(), "top_k", dataset, *args)
+        actual = _run(DuckDBEngine(), "top_k", dataset, *args)
+        top_index = build_top_k_index(dataset.scan(), ROLLUP_DIMENSIONS, k=1)
+        indexed = _run(PolarsEngine(), "top_k", replace(dataset, top_index=top_index), *args)
+
+        assert_frame_equal(actual, expected, check_dtypes=False)
+        assert_frame_equal(indexed, expected, check_dtypes=False)
+
+        if group_col is None:
+            rows = PolarsEngine().filter(dataset, filters, columns).collect()
+            assert expected.equals(rows.sort("value", descending=True).head(1))
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    @pytest.mark.parametrize(
+        "sort_col, descending, search",
+        [
+            (None, False, None),
+            ("value", True, None),
+            ("category", False, None),
+            ("date", True, "NOR"),
+        ],
+    )
+    def test_pages_match(self, dataset, filters, sort_col, descending, search):
+        """Test table pages and search counts agree between engines."""
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        columns = ["date", "category", "region", "value"]
+
+        for page in (1, 2, 3):
+            args = (dataset, filters, columns, page, 2, sort_col, descending, search)
+            expected = _run(PolarsEngine(), "page", *args)
+            actual = _run(DuckDBEngine(), "page", *args)
+
+            assert_frame_equal(actual, expected, check_dtypes=False)
+
+        args = (dataset, filters, columns, search)
+        assert _run(DuckDBEngine(), "count_rows", *args) == _run(
+            PolarsEngine(), "count_rows", *args
+        )
+
+    @pytest.mark.parametrize("sort_col", ["category", "region", "month"])
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_pages_match_after_append(self, appended_dataset, sort_col, descending):
+        """Test ties keep the manifest order in both engines once files are appended."""
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        columns = ["date", "category", "month", "region", "value"]
+        args = (appended_dataset, {}, columns, 1, 10, sort_col, descending, None)
+
+        assert_frame_equal(
+            _run(DuckDBEngine(), "page", *args),
+            _run(PolarsEngine(), "page", *args),
+            check_dtypes=False,
+        )
+
+    def test_duckdb_page_reads_only_the_page(self, dataset, monkeypatch):
+        """Test DuckDB pages are sliced in SQL, never through the full filtered rows."""
+        from src.data.engine import DuckDBEngine
+
+        def fail(*args, **kwargs):
+            pytest.fail("materialized the filtered rows")
+
+        monkeypatch.setattr(DuckDBEngine, "filter", fail)
+        columns = ["category", "value"]
+        page = _run(DuckDBEngine(), "page", dataset, {}, columns, 2, 3, "value", False, None)
+
+        assert page["value"].to_list() == [300.0]
+
+    @pytest.mark.parametrize("fmt", ["csv", "parquet", "arrow"])
+    @pytest.mark.parametrize("filters", FILTER_CASES[:3])
+    def test_exports_match(self, dataset, filters, fmt, tmp_path):
+        """Test both engines export the same rows in every format."""
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        reader = {"csv": pl.read_csv, "parquet": pl.read_parquet, "arrow": pl.read_ipc}[fmt]
+        expected = reader(PolarsEngine().export(dataset, filters, tmp_path / "polars", fmt))
+        actual = reader(DuckDBEngine().export(dataset, filters, tmp_path / "duckdb", fmt))
+
+        assert_frame_equal(
+            actual.select(expected.columns).sort("date"),
+            expected.sort("date"),
+            check_dtypes=False,
+        )
+
+    @pytest.mark.parametrize("fmt", ["csv", "parquet", "arrow"])
+    def test_exports_respect_limit(self, dataset, fmt, tmp_path):
+        """Test both engines stop exporting at the row limit."""
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        reader = {"csv": pl.read_csv, "parquet": pl.read_parquet, "arrow": pl.read_ipc}[fmt]
+        for engine in (PolarsEngine(), DuckDBEngine()):
+            path = engine.export(dataset, {}, tmp_path / engine.name, fmt, limit=2)
+
+            assert reader(path).height == 2
+
+    def test_duckdb_export_streams(self, dataset, monkeypatch, tmp_path):
+        """Test DuckDB exports run in the database, never through the filtered rows."""
+        from src.data.engine import DuckDBEngine
+
+        def fail(*args, **kwargs):
+            pytest.fail("materialized the filtered rows")
+
+        monkeypatch.setattr(DuckDBEngine, "filter", fail)
+        path = DuckDBEngine().export(dataset, {"category": "A"}, tmp_path / "out.csv")
+
+        assert pl.read_csv(path)["value"].sort().to_list() == [100.0, 300.0]
+        with pytest.raises(ValueError, match="Unknown export format"):
+            DuckDBEngine().export(dataset, {}, tmp_path / "out.xlsx", "xlsx")
+
+    @pytest.mark.parametrize("group_col", [None, "category"])
+    def test_top_k_skips_nulls(self, sample_df, tmp_path, group_col):
+        """Test rows without a value are never selected, grouped or not."""
+        from src.data.dataset import get_dataset
+        from src.data.engine import DuckDBEngine, PolarsEngine
+
+        path = tmp_path / "nulls.parquet"
+        sample_df.drop("month").with_columns(
+            pl.when(pl.col("category") == "B").then(None).otherwise(pl.col("value")).alias("value")
+        ).write_parquet(path)
+        dataset = get_dataset(path, lazy=True)
+
+        args = (dataset, {}, 5, "value", group_col)
+        expected = _run(PolarsEngine(), "top_k", *args)
+        actual = _run(DuckDBEngine(), "top_k", *args)
+
+        assert expected["value"].to_list() == [300.0, 100.0]
+        assert_frame_equal(actual, expected, check_dtypes=False)
+
+
+class TestPolarsEngine:
+    """Tests for PolarsEngine class."""
+
+    def test_eager_date_range_is_sliced(self, sample_df, tmp_path):
+        """Test an eager dataset resolves date ranges without a filter over all rows."""
+        from src.data.dataset import get_dataset
+        from src.data.engine import PolarsEngine
+
+        path = tmp_path / "data.parquet"
+        sample_df.drop("month").write_parquet(path)
+        dataset = get_dataset(path, lazy=False)
+        filters = {"start_date": date(2025, 1, 6), "end_date": date(2025, 2, 3)}
+
+        lf = PolarsEngine().filter(dataset, filters)
+        lazy_plan = PolarsEngine().filter(get_dataset(path, lazy=True), filters).explain()
+
+        assert dataset.frame["date"].flags["SORTED_ASC"]
+        assert 'col("date")' in lazy_plan
+        assert 'col("date")' not in lf.explain()
+        assert lf.collect()["date"].to_list() == [date(2025, 1, 6), date(2025, 2, 3)]
+
+
+class TestGetEngine:
+    """Tests for get_engine function."""
+
+    def test_unknown_engine(self):
+        """Test an unknown engine name is rejected."""
+        from src.data.engine import get_engine
+
+        with pytest.raises(ValueError):
+            get_engine("spark")
+
+    def test_shared_instance(self):
+        """Test the engine is created once per process."""
+        from src.data.engine import PolarsEngine, get_engine
+
+        assert isinstance(get_engine("polars"), PolarsEngine)
+        assert get_engine("polars") is get_engine("polars")
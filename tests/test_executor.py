@@ -0,0 +1,83 @@
+"""Tests for the bounded query executor."""
+
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+
+@pytest.fixture
+def executor():
+    """Create an executor and stop it afterwards."""
+    from src.data.executor import QueryExecutor
+
+    executor = QueryExecutor(max_workers=2, timeout=5)
+    yield executor
+    executor.shutdown()
+
+
+class TestQueryExecutor:
+    """Tests for QueryExecutor class."""
+
+    def test_invalid_workers(self):
+        """Test at least one worker is required."""
+        from src.data.executor import QueryExecutor
+
+        with pytest.raises(ValueError):
+            QueryExecutor(max_workers=0)
+
+    def test_queries_overlap(self, executor):
+        """Test independent queries run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def query(value):
+            barrier.wait()
+            return value
+
+        first = executor.submit("s1", query, 1)
+        second = executor.submit("s1", query, 2)
+
+        assert executor.result(first) + executor.result(second) == 3
+
+    def test_timeout(self, executor):
+        """Test waiting longer than the timeout raises."""
+        from src.data.executor import QueryTimeoutError
+
+        release = threading.Event()
+        future = executor.submit("s1", release.wait, 5)
+
+        with pytest.raises(QueryTimeoutError):
+            executor.result(future, timeout=0.05)
+
+        release.set()
+
+    def test_supersede_cancels_queued_queries(self):
+        """Test a new run cancels the queries its previous run still had queued."""
+        from src.data.executor import QueryExecutor
+
+        executor = QueryExecutor(max_workers=1)
+        release = threading.Event()
+
+        running = executor.submit("s1", release.wait, 5)
+        queued = executor.submit("s1", time.sleep, 0)
+        other = executor.submit("s2", time.sleep, 0)
+
+        assert executor.pending == 3
+        assert executor.supersede("s1") == 1
+
+        release.set()
+
+        assert executor.result(running) is True
+        assert executor.result(other) is None
+        with pytest.raises(CancelledError):
+            executor.result(queued)
+
+        executor.shutdown()
+
+    def test_finished_queries_are_forgotten(self, executor):
+        """Test completed queries are no longer tracked."""
+        future = executor.submit("s1", sum, [1, 2])
+
+        assert executor.result(future) == 3
+        assert executor.pending == 0
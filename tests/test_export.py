@@ -0,0 +1,51 @@
+"""Tests for streaming exports."""
+
+import io
+from datetime import date
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+
+@pytest.fixture
+def rows():
+    """LazyFrame with an Enum dimension."""
+    return pl.LazyFrame(
+        {
+            "date": [date(2025, 1, 1), date(2025, 1, 2)],
+            "category": pl.Series(["A", "B"], dtype=pl.Enum(["A", "B"])),
+            "value": [1.5, 2.5],
+        }
+    )
+
+
+class TestExport:
+    """Tests for export_to_file and export_bytes functions."""
+
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+    def test_binary_round_trip(self, rows, fmt, tmp_path):
+        """Test Parquet and Arrow exports read back unchanged."""
+        from src.data.export import export_to_file
+
+        path = export_to_file(rows.filter(pl.col("value") > 2), tmp_path / f"out.{fmt}", fmt)
+        reader = pl.read_parquet if fmt == "parquet" else pl.read_ipc
+
+        assert_frame_equal(reader(path), rows.filter(pl.col("value") > 2).collect())
+
+    def test_csv_bytes(self, rows):
+        """Test CSV export writes labels, not codes."""
+        from src.data.export import export_bytes
+
+        data = export_bytes(rows, "csv")
+        df = pl.read_csv(io.BytesIO(data))
+
+        assert df.columns == ["date", "category", "value"]
+        assert df["category"].to_list() == ["A", "B"]
+
+    def test_unknown_format(self, rows, tmp_path):
+        """Test an unknown format is rejected."""
+        from src.data.export import export_to_file
+
+        with pytest.raises(ValueError):
+            export_to_file(rows, tmp_path / "out.xlsx", "xlsx")
@@ -0,0 +1,86 @@
+"""Tests for filter components."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def sales_df():
+    """Small sales DataFrame."""
+    return pl.DataFrame(
+        {
+            "date": [date(2025, 1, 1), date(2025, 1, 15), date(2025, 2, 1), date(2025, 3, 1)],
+            "category": ["A", "B", "A", "A"],
+            "region": ["North", "North", "South", "North"],
+            "value": [10.0, 20.0, 30.0, 40.0],
+        }
+    )
+
+
+class TestApplyFilters:
+    """Tests for apply_filters function."""
+
+    def test_no_filters(self, sales_df):
+        """Test empty filter dict returns all rows."""
+        from src.components.filters import apply_filters
+
+        assert len(apply_filters(sales_df, {})) == 4
+
+    def test_all_filters(self, sales_df):
+        """Test date range, category and region together."""
+        from src.components.filters import apply_filters
+
+        filters = {
+            "start_date": date(2025, 1, 10),
+            "end_date": date(2025, 3, 1),
+            "category": "A",
+            "region": "North",
+        }
+        result = apply_filters(sales_df, filters)
+
+        assert result["value"].to_list() == [40.0]
+
+    def test_lazy_input_stays_lazy(self, sales_df):
+        """Test a LazyFrame input returns an uncollected plan."""
+        from src.components.filters import apply_filters
+
+        result = apply_filters(sales_df.lazy(), {"category": "B"})
+
+        assert isinstance(result, pl.LazyFrame)
+        assert result.collect()["value"].to_list() == [20.0]
+
+    def test_month_partition_predicate(self, sales_df):
+        """Test date bounds are also applied to a month partition column."""
+        from src.components.filters import apply_filters
+
+        lf = sales_df.lazy().with_columns(pl.col("date").dt.strftime("%Y-%m").alias("month"))
+        result = apply_filters(lf, {"start_date": date(2025, 2, 1)})
+
+        assert 'col("month")' in result.explain()
+        assert result.collect()["value"].to_list() == [30.0, 40.0]
+
+    def test_sorted_date_slice(self, sales_df):
+        """Test a sorted date column is range-filtered by slicing."""
+        from src.components.filters import apply_filters
+        from src.data.loader import mark_sorted
+
+        df = mark_sorted(sales_df)
+        filters = {"start_date": date(2025, 1, 10), "end_date": date(2025, 2, 15)}
+
+        assert df["date"].flags["SORTED_ASC"]
+        assert apply_filters(df, filters)["value"].to_list() == [20.0, 30.0]
+        assert apply_filters(df, {**filters, "region": "North"})["value"].to_list() == [20.0]
+        assert apply_filters(df, {"start_date": date(2025, 4, 1)}).is_empty()
+
+    def test_unsorted_dates_not_flagged(self, sales_df):
+        """Test unsorted dates fall back to a predicate with the same result."""
+        from src.components.filters import apply_filters
+        from src.data.loader import mark_sorted
+
+        df = mark_sorted(sales_df.reverse())
+        result = apply_filters(df, {"start_date": date(2025, 1, 10), "end_date": date(2025, 2, 15)})
+
+        assert not df["date"].flags["SORTED_ASC"]
+        assert result["value"].to_list() == [30.0, 20.0]
@@ -0,0 +1,65 @@
+"""Tests for the column statistics index."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def sales_df():
+    """Small sales DataFrame."""
+    return pl.DataFrame(
+        {
+            "date": [date(2025, 1, 1), date(2025, 1, 15), date(2025, 2, 1), date(2025, 3, 1)],
+            "category": ["B", "A", "A", None],
+            "value": [10.0, 20.0, 30.0, 40.0],
+        }
+    )
+
+
+class TestBuildIndex:
+    """Tests for build_index function."""
+
+    def test_values_counts_and_bounds(self, sales_df):
+        """Test distinct values, counts and bounds of each column."""
+        from src.data.index import build_index
+
+        index = build_index(sales_df.lazy())
+
+        assert index.n_rows == 4
+        assert index.unique_values("category") == ["A", "B"]
+        assert index.value_counts("category") == {"A": 2, "B": 1}
+        assert index.columns["category"].null_count == 1
+        assert index.bounds("date") == (date(2025, 1, 1), date(2025, 3, 1))
+        assert index.bounds("value") == (10.0, 40.0)
+        assert index.unique_values("value") == []
+
+    def test_bounds_from_parquet_statistics(self, sales_df, tmp_path):
+        """Test measure bounds are read from the file footer."""
+        from src.data.index import _parquet_bounds, build_index
+
+        path = tmp_path / "data.parquet"
+        sales_df.write_parquet(path, statistics=True)
+
+        assert _parquet_bounds([path])["value"] == (10.0, 40.0)
+        index = build_index(pl.scan_parquet(path), [path])
+        assert index.bounds("date") == (date(2025, 1, 1), date(2025, 3, 1))
+        assert index.unique_values("category") == ["A", "B"]
+
+    def test_high_cardinality_keeps_no_values(self, sales_df):
+        """Test columns above max_values keep bounds only."""
+        from src.data.index import build_index
+
+        index = build_index(sales_df, max_values=1)
+
+        assert index.unique_values("category") == []
+        assert index.bounds("category") == ("A", "B")
+
+    def test_merge_indexes(self, sales_df):
+        """Test merging matches indexing all rows at once."""
+        from src.data.index import build_index, merge_indexes
+
+        merged = merge_indexes(build_index(sales_df.head(2)), build_index(sales_df.tail(2)))
+
+        assert merged == build_index(sales_df)
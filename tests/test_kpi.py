@@ -0,0 +1,106 @@
+"""Tests for the baseline and comparison-period KPIs."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def sample_df():
+    """Create daily rows over two years."""
+    return pl.DataFrame(
+        {
+            "date": [date(2024, 3, 1), date(2025, 2, 1), date(2025, 2, 28), date(2025, 3, 1)],
+            "category": ["A", "A", "B", "A"],
+            "value": [10.0, 20.0, 30.0, 40.0],
+        }
+    )
+
+
+class TestBuildBaseline:
+    """Tests for build_baseline function."""
+
+    def test_rows_and_rollup_agree(self, sample_df):
+        """Test the baseline is the same from rows and rollup cells."""
+        from src.data.kpi import build_baseline
+        from src.data.loader import compute_summary
+        from src.data.rollup import build_rollup
+
+        bounds = (date(2024, 3, 1), date(2025, 3, 1))
+        from_rows = build_baseline(sample_df, bounds)
+        from_rollup = build_baseline(build_rollup(sample_df), bounds, rollup=True)
+
+        assert from_rows == from_rollup
+        assert from_rows.summary == compute_summary(sample_df)
+        assert from_rows.start == date(2024, 3, 1)
+
+
+class TestComparisonFilters:
+    """Tests for comparison_filters function."""
+
+    def test_previous_period(self):
+        """Test the window moves back by its own length."""
+        from src.data.kpi import Baseline, comparison_filters
+
+        filters = {"start_date": date(2025, 3, 1), "end_date": date(2025, 3, 10), "region": "N"}
+        shifted = comparison_filters(filters, "previous_period", Baseline({}))
+
+        assert shifted == {
+            "start_date": date(2025, 2, 19),
+            "end_date": date(2025, 2, 28),
+            "region": "N",
+        }
+
+    def test_last_year_defaults_to_dataset_range(self):
+        """Test an open window uses the dataset bounds and Feb 29 maps to Feb 28."""
+        from src.data.kpi import Baseline, comparison_filters
+
+        baseline = Baseline({}, start=date(2024, 2, 29), end=date(2024, 12, 31))
+        shifted = comparison_filters({}, "last_year", baseline)
+
+        assert shifted == {"start_date": date(2023, 2, 28), "end_date": date(2023, 12, 31)}
+
+    def test_no_window(self):
+        """Test there is nothing to shift without dates."""
+        from src.data.kpi import Baseline, comparison_filters
+
+        assert comparison_filters({}, "previous_period", Baseline({})) is None
+
+    def test_unknown_comparison(self):
+        """Test an unknown comparison is rejected."""
+        from src.data.kpi import Baseline, comparison_filters
+
+        with pytest.raises(ValueError, match="Unknown comparison"):
+            comparison_filters({}, "next_year", Baseline({}))
+
+
+class TestComparisonSummary:
+    """Tests for comparison_summary and growth functions."""
+
+    def test_comparisons(self, sample_df, tmp_path):
+        """Test each comparison summarizes the expected rows."""
+        from src.data.dataset import get_dataset
+        from src.data.engine import PolarsEngine
+        from src.data.kpi import comparison_summary, growth
+
+        path = tmp_path / "data.parquet"
+        sample_df.write_parquet(path)
+        dataset = get_dataset(path)
+        engine = PolarsEngine()
+        filters = {"start_date": date(2025, 3, 1), "end_date": date(2025, 3, 1), "category": "A"}
+
+        assert comparison_summary(engine, dataset, filters, "dataset")["total"] == 100.0
+        assert comparison_summary(engine, dataset, filters, "previous_period") == {}
+        last_year = comparison_summary(engine, dataset, filters, "last_year")
+        assert last_year["total"] == 10.0
+
+        assert growth(engine.summary(dataset, filters), last_year) == pytest.approx(3.0)
+
+    def test_growth_without_reference(self):
+        """Test growth is undefined against an empty or zero reference."""
+        from src.data.kpi import growth
+
+        assert growth({"total": 10.0}, {}) is None
+        assert growth({"total": 10.0}, {"total": 0.0}) is None
+        assert growth({"total": 15.0}, {"total": 10.0}) == pytest.approx(0.5)
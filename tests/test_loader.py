@@ -6,6 +6,7 @@ from pathlib import Path
 
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 
 class TestLoadData:
@@ -42,6 +43,81 @@ class TestLoadData:
             load_data.clear()
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_load_data_picks_up_rewrite(self, tmp_path):
+        """Test a rewritten file is reloaded on the next call."""
+        from src.data.loader import load_data
+
+        path = tmp_path / "data.parquet"
+        pl.DataFrame({"value": [1.0]}).write_parquet(path)
+
+        try:
+            assert len(load_data(path)) == 1
+            pl.DataFrame({"value": [1.0, 2.0]}).write_parquet(path)
+            assert len(load_data(path)) == 2
+        finally:
+            load_data.clear()
+
+    def test_load_data_lazy(self):
+        """Test lazy loading returns an uncollected scan."""
+        from src.data.loader import load_data
+
+        df = pl.DataFrame(
+            {
+                "date": [date(2025, 1, 1), date(2025, 1, 2)],
+                "value": [100.0, 200.0],
+            }
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
+            temp_path = f.name
+            df.write_parquet(temp_path)
+
+        try:
+            loaded = load_data(temp_path, lazy=True)
+            assert isinstance(loaded, pl.LazyFrame)
+            result = loaded.filter(pl.col("value") > 150).collect()
+            assert result["value"].to_list() == [200.0]
+        finally:
+            load_data.clear()
+            Path(temp_path).unlink(missing_ok=True)
+
+    def test_load_data_lazy_file_not_found(self):
+        """Test lazy loading of non-existent file."""
+        from src.data.loader import load_data
+
+        with pytest.raises(FileNotFoundError):
+            load_data("nonexistent.parquet", lazy=True)
+
+
+class TestDatasetFingerprint:
+    """Tests for dataset_fingerprint function."""
+
+    def test_stable_without_changes(self, tmp_path):
+        """Test fingerprint is stable while the file is unchanged."""
+        from src.data.loader import dataset_fingerprint
+
+        path = tmp_path / "data.parquet"
+        pl.DataFrame({"value": [1.0]}).write_parquet(path)
+
+        assert dataset_fingerprint(path) == dataset_fingerprint(path)
+
+    def test_footer_change_detected(self, tmp_path):
+        """Test a rewrite with identical size and mtime is still detected."""
+        import os
+
+        from src.data.loader import dataset_fingerprint
+
+        path = tmp_path / "data.parquet"
+        pl.DataFrame({"value": [1.0]}).write_parquet(path)
+        stat = path.stat()
+        before = dataset_fingerprint(path)
+
+        pl.DataFrame({"value": [2.0]}).write_parquet(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert path.stat().st_size == stat.st_size
+
+        assert dataset_fingerprint(path) != before
+
 
 class TestComputeSummary:
     """Tests for compute_summary function."""
@@ -71,6 +147,18 @@ class TestComputeSummary:
 
         assert summary == {}
 
+    def test_compute_summary_lazy(self):
+        """Test summary computation on a LazyFrame."""
+        from src.data.loader import compute_summary
+
+        lf = pl.LazyFrame({"value": [100.0, 200.0, 300.0]}).filter(pl.col("value") > 100)
+
+        summary = compute_summary(lf)
+
+        assert summary["total"] == 500.0
+        assert summary["count"] == 2
+        assert summary["min"] == 200.0
+
 
 class TestAggregateByColumn:
     """Tests for aggregate_by_column function."""
@@ -100,3 +188,151 @@ class TestAggregateByColumn:
         result = aggregate_by_column(df, "category")
 
         assert result.is_empty()
+
+    def test_aggregate_lazy(self):
+        """Test aggregation of a LazyFrame returns a collected DataFrame."""
+        from src.data.loader import aggregate_by_column
+
+        lf = pl.LazyFrame(
+            {
+                "category": ["A", "B", "A"],
+                "value": [100.0, 200.0, 150.0],
+            }
+        )
+
+        result = aggregate_by_column(lf, "category", "value", "count")
+
+        assert isinstance(result, pl.DataFrame)
+        assert result.filter(pl.col("category") == "A")["value"].item() == 2
+
+
+class TestTopK:
+    """Tests for top_k and build_top_k_index functions."""
+
+    @pytest.fixture
+    def df(self):
+        """Create rows with two products per category."""
+        return pl.DataFrame(
+            {
+                "name": ["a", "b", "c", "d", "e"],
+                "category": ["A", "A", "B", "B", "A"],
+                "value": [10.0, 50.0, 30.0, None, 20.0],
+            }
+        )
+
+    def test_top_k(self, df):
+        """Test the largest values come first and nulls are skipped."""
+        from src.data.loader import top_k
+
+        result = top_k(df, 2)
+
+        assert result["name"].to_list() == ["b", "c"]
+        assert result.columns == df.columns
+
+    def test_nulls_never_selected(self, df):
+        """Test both paths return fewer rows rather than rows without a value."""
+        from src.data.loader import top_k
+
+        assert top_k(df, 10)["name"].to_list() == ["b", "c", "e", "a"]
+        assert top_k(df, 10, group_col="category")["name"].to_list() == ["b", "e", "a", "c"]
+
+    def test_top_k_per_group(self, df):
+        """Test top rows are selected within each group."""
+        from src.data.loader import top_k
+
+        result = top_k(df.lazy(), 2, group_col="category")
+
+        assert result["category"].to_list() == ["A", "A", "B"]
+        assert result["name"].to_list() == ["b", "e", "c"]
+        assert result.columns == df.columns
+
+    def test_index_answers_like_table(self, df):
+        """Test top rows from the per-cell index match the full table."""
+        from src.data.loader import build_top_k_index, top_k
+
+        index = build_top_k_index(df, ("category",), k=2)
+
+        assert len(index) < len(df)
+        assert_frame_equal(top_k(index, 2), top_k(df, 2))
+        assert_frame_equal(
+            top_k(index, 2, group_col="category"), top_k(df, 2, group_col="category")
+        )
+
+    def test_grouped_by_label(self, df):
+        """Test groups of an extended Enum dictionary come back in label order."""
+        from src.data.loader import top_k
+
+        encoded = df.with_columns(pl.col("category").cast(pl.Enum(["B", "A"])))
+
+        assert top_k(encoded, 1, group_col="category")["category"].to_list() == ["A", "B"]
+
+
+@pytest.fixture
+def partitioned_dir(tmp_path):
+    """Write a small month/region hive-partitioned dataset."""
+    df = pl.DataFrame(
+        {
+            "date": [date(2025, 1, 5), date(2025, 1, 6), date(2025, 2, 3)],
+            "value": [100.0, 200.0, 300.0],
+            "month": ["2025-01", "2025-01", "2025-02"],
+            "region": ["North", "South", "North"],
+        }
+    )
+    root = tmp_path / "sales"
+
+    for (month, region), part in df.partition_by(["month", "region"], as_dict=True).items():
+        directory = root / f"month={month}" / f"region={region}"
+        directory.mkdir(parents=True)
+        part.drop("month", "region").write_parquet(directory / "part-0.parquet")
+
+    return root
+
+
+class TestPartitionedDataset:
+    """Tests for hive-partitioned dataset directories."""
+
+    def test_scan_adds_partition_columns(self, partitioned_dir):
+        """Test partition keys are exposed as columns."""
+        from src.data.loader import scan_data
+
+        lf = scan_data(partitioned_dir)
+        columns = lf.collect_schema().names()
+
+        assert "month" in columns
+        assert "region" in columns
+        assert lf.select(pl.col("value").sum()).collect().item() == 600.0
+
+    def test_partition_pruning(self, partitioned_dir):
+        """Test partition predicates restrict the files scanned."""
+        from src.data.loader import scan_data
+
+        plan = scan_data(partitioned_dir).filter(pl.col("region") == "South").explain()
+
+        assert "region=South" in plan
+        assert "region=North" not in plan
+
+    def test_read_data(self, partitioned_dir):
+        """Test eager read of a dataset directory."""
+        from src.data.loader import read_data
+
+        assert len(read_data(partitioned_dir)) == 3
+
+    def test_fingerprint_changes_with_new_partition(self, partitioned_dir):
+        """Test adding a file changes the dataset fingerprint."""
+        from src.data.loader import dataset_fingerprint
+
+        before = dataset_fingerprint(partitioned_dir)
+        directory = partitioned_dir / "month=2025-03" / "region=North"
+        directory.mkdir(parents=True)
+        pl.DataFrame({"date": [date(2025, 3, 1)], "value": [1.0]}).write_parquet(
+            directory / "part-0.parquet"
+        )
+
+        assert dataset_fingerprint(partitioned_dir) != before
+
+    def test_empty_directory(self, tmp_path):
+        """Test a directory without Parquet files is reported as missing."""
+        from src.data.loader import scan_data
+
+        with pytest.raises(FileNotFoundError):
+            scan_data(tmp_path)
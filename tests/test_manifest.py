@@ -0,0 +1,76 @@
+"""Tests for dataset manifest module."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """Write one partition file inside a dataset root."""
+    directory = tmp_path / "month=2025-01" / "region=North"
+    directory.mkdir(parents=True)
+    path = directory / "part-00000.parquet"
+    pl.DataFrame({"date": [date(2025, 1, 1), date(2025, 1, 9)], "value": [1.0, 2.0]}).write_parquet(
+        path
+    )
+    return path
+
+
+class TestDescribeFile:
+    """Tests for describe_file function."""
+
+    def test_entry(self, tmp_path, data_file):
+        """Test row count, max date and relative path are recorded."""
+        from src.data.manifest import describe_file
+
+        entry = describe_file(tmp_path, data_file)
+
+        assert entry.path == "month=2025-01/region=North/part-00000.parquet"
+        assert entry.rows == 2
+        assert entry.max_date == "2025-01-09"
+        assert len(entry.sha256) == 64
+
+
+class TestManifest:
+    """Tests for Manifest class."""
+
+    def test_round_trip(self, tmp_path, data_file):
+        """Test manifest is written and read back unchanged."""
+        from src.data.manifest import Manifest, describe_file, read_manifest, write_manifest
+
+        manifest = Manifest(version=3, files=(describe_file(tmp_path, data_file),))
+        write_manifest(tmp_path, manifest)
+
+        loaded = read_manifest(tmp_path)
+
+        assert loaded == manifest
+        assert loaded.total_rows == 2
+        assert loaded.max_date == date(2025, 1, 9)
+
+    def test_read_missing(self, tmp_path):
+        """Test a directory without manifest."""
+        from src.data.manifest import read_manifest
+
+        assert read_manifest(tmp_path) is None
+
+    def test_appended_since(self):
+        """Test only new files are reported for an append."""
+        from src.data.manifest import Manifest, ManifestEntry
+
+        a = ManifestEntry("a.parquet", 1, "2025-01-01", "h1")
+        b = ManifestEntry("b.parquet", 1, "2025-01-02", "h2")
+
+        assert Manifest(1, (a, b)).appended_since(Manifest(0, (a,))) == [b]
+        assert Manifest(1, (a,)).appended_since(Manifest(0, (a,))) == []
+
+    def test_rewrite_is_not_append(self):
+        """Test a rewritten or removed file requires a full reload."""
+        from src.data.manifest import Manifest, ManifestEntry
+
+        a = ManifestEntry("a.parquet", 1, "2025-01-01", "h1")
+        a_rewritten = ManifestEntry("a.parquet", 2, "2025-01-01", "h9")
+
+        assert Manifest(1, (a_rewritten,)).appended_since(Manifest(0, (a,))) is None
+        assert Manifest(1, ()).appended_since(Manifest(0, (a,))) is None
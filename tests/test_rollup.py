@@ -0,0 +1,156 @@
+"""Tests for rollup cube module."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def raw_df():
+    """Small raw fact table."""
+    return pl.DataFrame(
+        {
+            "date": [date(2025, 1, 1), date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 2)],
+            "category": ["A", "A", "B", "A"],
+            "region": ["North", "North", "South", "South"],
+            "value": [100.0, 50.0, 200.0, 25.0],
+        }
+    )
+
+
+class TestBuildRollup:
+    """Tests for build_rollup function."""
+
+    def test_grain(self, raw_df):
+        """Test one row per (date, category, region) cell."""
+        from src.data.rollup import build_rollup
+
+        rollup = build_rollup(raw_df)
+
+        assert len(rollup) == 3
+        cell = rollup.filter(pl.col("category") == "A", pl.col("region") == "North")
+        assert cell["count"].item() == 2
+        assert cell["value_sum"].item() == 150.0
+        assert cell["value_min"].item() == 50.0
+        assert cell["value_max"].item() == 100.0
+
+
+class TestMergeRollups:
+    """Tests for merge_rollups function."""
+
+    def test_merge_equals_full_rollup(self, raw_df):
+        """Test folding a delta rollup matches rolling up all rows."""
+        from src.data.rollup import build_rollup, merge_rollups
+
+        base, delta = raw_df.head(3), raw_df.tail(1)
+
+        merged = merge_rollups(build_rollup(base), build_rollup(delta))
+
+        assert merged.equals(build_rollup(raw_df))
+
+
+class TestRollupQueries:
+    """Tests that rollup answers match raw-row answers."""
+
+    def test_summary_matches_raw(self, raw_df):
+        """Test summary from rollup equals compute_summary on raw rows."""
+        from src.data.loader import compute_summary
+        from src.data.rollup import build_rollup, summary_from_rollup
+
+        rollup = build_rollup(raw_df)
+
+        assert summary_from_rollup(rollup) == compute_summary(raw_df)
+
+    @pytest.mark.parametrize("agg", ["sum", "mean", "count"])
+    def test_aggregate_matches_raw(self, raw_df, agg):
+        """Test grouped aggregates from rollup equal aggregate_by_column."""
+        from src.data.loader import aggregate_by_column
+        from src.data.rollup import aggregate_from_rollup, build_rollup
+
+        rollup = build_rollup(raw_df)
+
+        expected = aggregate_by_column(raw_df, "category", agg=agg).sort("category")
+        result = aggregate_from_rollup(rollup, "category", agg=agg).sort("category")
+
+        assert result["category"].to_list() == expected["category"].to_list()
+        assert result["value"].to_list() == expected["value"].to_list()
+
+    def test_summary_empty(self, raw_df):
+        """Test empty rollup selection."""
+        from src.data.rollup import build_rollup, summary_from_rollup
+
+        rollup = build_rollup(raw_df).filter(pl.col("category") == "Z")
+
+        assert summary_from_rollup(rollup) == {}
+
+
+class TestCanUseRollup:
+    """Tests for can_use_rollup function."""
+
+    def test_dimension_filters(self):
+        """Test date, category and region filters are supported."""
+        from src.data.rollup import can_use_rollup
+
+        assert can_use_rollup({})
+        assert can_use_rollup({"start_date": date(2025, 1, 1), "region": "North"})
+
+    def test_other_filters(self):
+        """Test filters on non-rollup columns fall back to raw rows."""
+        from src.data.rollup import can_use_rollup
+
+        assert not can_use_rollup({"category": "A", "name": "Product 1"})
+
+
+class TestReadRollup:
+    """Tests for read_rollup function."""
+
+    def test_round_trip(self, raw_df, tmp_path):
+        """Test rollup is written next to the data file and read back."""
+        from src.data.rollup import build_rollup, read_rollup, rollup_path, write_rollup
+
+        data_path = tmp_path / "sales.parquet"
+        raw_df.write_parquet(data_path)
+        write_rollup(build_rollup(raw_df), data_path)
+
+        assert rollup_path(data_path) == tmp_path / "sales.rollup.parquet"
+        assert len(read_rollup(data_path, expected_rows=4)) == 3
+
+    def test_stale_rollup_ignored(self, raw_df, tmp_path):
+        """Test rollup covering a different row count is ignored."""
+        from src.data.rollup import build_rollup, read_rollup, write_rollup
+
+        data_path = tmp_path / "sales.parquet"
+        raw_df.write_parquet(data_path)
+        write_rollup(build_rollup(raw_df), data_path)
+
+        assert read_rollup(data_path, expected_rows=5) is None
+        assert read_rollup(tmp_path / "missing.parquet") is None
+
+    def test_rollup_of_other_data_ignored(self, raw_df, tmp_path):
+        """Test a rollup built from other contents with the same row count is ignored."""
+        from src.data.rollup import build_rollup, read_rollup, write_rollup
+
+        data_path = tmp_path / "sales.parquet"
+        raw_df.write_parquet(data_path)
+        write_rollup(build_rollup(raw_df), data_path)
+        raw_df.with_columns(pl.col("value") * 2).write_parquet(data_path)
+
+        assert read_rollup(data_path, expected_rows=4) is None
+
+    def test_source_survives_copies(self, raw_df, tmp_path):
+        """Test the rollup still matches its data after both are copied elsewhere."""
+        import shutil
+
+        from src.data.rollup import build_rollup, read_rollup, rollup_path, write_rollup
+
+        data_path = tmp_path / "sales.parquet"
+        raw_df.write_parquet(data_path)
+        write_rollup(build_rollup(raw_df), data_path)
+
+        copy = tmp_path / "copy" / "sales.parquet"
+        copy.parent.mkdir()
+        shutil.copy(data_path, copy)
+        shutil.copy(rollup_path(data_path), rollup_path(copy))
+
+        assert read_rollup(copy, expected_rows=4) is not None
@@ -0,0 +1,37 @@
+"""Tests for parallel page section loading."""
+
+import threading
+
+import pytest
+
+
+class TestLoadSections:
+    """Tests for load_sections function."""
+
+    def test_sections_load_in_parallel(self):
+        """Test sections run concurrently on the pool."""
+        from src.components.sections import Section, load_sections
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def load(engine, dataset, filters):
+            barrier.wait()
+            return filters
+
+        sections = (Section("first", load), Section("second", load))
+        futures = load_sections(sections, None, None, {"category": "A", "region": "North"})
+
+        assert futures["first"].result(timeout=5) == {"category": "A", "region": "North"}
+        assert futures["second"].result(timeout=5) == {"category": "A", "region": "North"}
+
+    def test_errors_surface_on_result(self):
+        """Test a failing section raises where its result is used."""
+        from src.components.sections import Section, load_sections
+
+        def load(engine, dataset, filters):
+            raise RuntimeError("boom")
+
+        futures = load_sections((Section("broken", load),), None, None, {})
+
+        with pytest.raises(RuntimeError, match="boom"):
+            futures["broken"].result(timeout=5)
@@ -0,0 +1,67 @@
+"""Tests for paginated table queries."""
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def rows():
+    """LazyFrame with 10 rows."""
+    return pl.LazyFrame(
+        {
+            "name": [f"Product {i}" for i in range(10)],
+            "category": ["Food", "Sport"] * 5,
+            "value": [float(v) for v in (5, 3, 9, 1, 7, 0, 8, 2, 6, 4)],
+        }
+    )
+
+
+class TestFetchPage:
+    """Tests for fetch_page function."""
+
+    def test_pages_slice_rows(self, rows):
+        """Test pages return consecutive slices and a short last page."""
+        from src.data.table import fetch_page
+
+        assert fetch_page(rows, 1, 4)["name"].to_list() == [f"Product {i}" for i in range(4)]
+        assert fetch_page(rows, 3, 4)["name"].to_list() == ["Product 8", "Product 9"]
+        assert fetch_page(rows, 4, 4).is_empty()
+
+    def test_sorted_page(self, rows):
+        """Test sorting applies before paging."""
+        from src.data.table import fetch_page
+
+        page = fetch_page(rows, 2, 3, sort_col="value", descending=True)
+
+        assert page["value"].to_list() == [6.0, 5.0, 4.0]
+
+    def test_extended_enum_sorts_by_label(self, rows):
+        """Test labels appended to the dictionary sort by label, not code."""
+        from src.data.dictionary import encode_dimensions, extend_dictionary
+        from src.data.table import fetch_page
+
+        dictionary = extend_dictionary({"category": ("Food", "Sport")}, {"category": ["Books"]})
+        encoded = encode_dimensions(
+            rows.collect().with_columns(pl.col("category").replace({"Food": "Books"})), dictionary
+        )
+
+        assert encoded.schema["category"] == pl.Enum(["Food", "Sport", "Books"])
+        assert fetch_page(encoded.lazy(), 1, 1, "category", True)["category"].item() == "Sport"
+        assert fetch_page(encoded.lazy(), 1, 1, "category")["category"].item() == "Books"
+
+    def test_search(self, rows):
+        """Test search is case-insensitive, literal and counted."""
+        from src.data.table import count_matches, fetch_page
+
+        assert count_matches(rows, "SPORT") == 5
+        assert count_matches(rows, "product 1") == 1
+        assert count_matches(rows, ".*") == 0
+        assert fetch_page(rows, 1, 10, search="sport", search_cols=["name"]).is_empty()
+
+    def test_search_enum_column(self, rows):
+        """Test Enum columns are searched by label."""
+        from src.data.table import count_matches
+
+        encoded = rows.with_columns(pl.col("category").cast(pl.Enum(["Food", "Sport"])))
+
+        assert count_matches(encoded, "foo") == 5
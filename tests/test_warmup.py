@@ -0,0 +1,161 @@
+"""Tests for the cache warm-up."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def sample_df():
+    """Create rows over 60 days."""
+    return pl.DataFrame(
+        {
+            "date": pl.date_range(date(2025, 1, 1), date(2025, 3, 1), eager=True),
+            "category": ["A", "B"] * 30,
+            "region": ["N", "S", "E"] * 20,
+            "name": [f"P{i}" for i in range(60)],
+            "value": [float(i) for i in range(60)],
+            "quantity": list(range(60)),
+        }
+    )
+
+
+class TestView:
+    """Tests for View class."""
+
+    def test_filters(self):
+        """Test presets end on the last date and are clipped to the data."""
+        from src.data.warmup import View
+
+        bounds = (date(2025, 1, 1), date(2025, 3, 1))
+
+        assert View().filters(bounds) == {"start_date": bounds[0], "end_date": bounds[1]}
+        assert View("A", "N", "last_7_days").filters(bounds) == {
+            "start_date": date(2025, 2, 23),
+            "end_date": date(2025, 3, 1),
+            "category": "A",
+            "region": "N",
+        }
+        assert View(preset="last_90_days").filters(bounds)["start_date"] == bounds[0]
+        assert View("A").filters((None, None)) == {"category": "A"}
+
+    def test_from_filters(self):
+        """Test sidebar filters map back to their view, custom ranges to None."""
+        from src.data.warmup import View
+
+        bounds = (date(2025, 1, 1), date(2025, 3, 1))
+
+        for view in (View(), View("A"), View(region="S", preset="last_30_days")):
+            assert View.from_filters(view.filters(bounds), bounds) == view
+
+        custom = {"start_date": date(2025, 1, 1), "end_date": date(2025, 1, 31)}
+        assert View.from_filters(custom, bounds) is None
+        custom = {"start_date": date(2025, 2, 20), "end_date": date(2025, 3, 1)}
+        assert View.from_filters(custom, bounds) is None
+
+    def test_unknown_preset(self):
+        """Test an unknown preset is rejected."""
+        from src.data.warmup import View
+
+        with pytest.raises(ValueError, match="Unknown date preset"):
+            View(preset="yesterday")
+
+
+class TestUsageLog:
+    """Tests for UsageLog class."""
+
+    def test_top(self, tmp_path):
+        """Test views are ranked by how often they were opened."""
+        from src.data.warmup import UsageLog, View
+
+        log = UsageLog(tmp_path / "logs" / "usage.jsonl")
+        for view in [View("A"), View("B"), View("B"), View(), View("B"), View("A")]:
+            log.record(view)
+
+        assert log.top(2) == [View("B"), View("A")]
+
+    def test_skips_bad_lines(self, tmp_path):
+        """Test torn or outdated lines are ignored."""
+        from src.data.warmup import UsageLog, View
+
+        path = tmp_path / "usage.jsonl"
+        path.write_text('{"category": "A"}\n{"categ\n{"preset": "last_year"}\n')
+
+        assert UsageLog(path).top(5) == [View("A")]
+        assert UsageLog(tmp_path / "missing.jsonl").top(5) == []
+
+    def test_rolls_over_when_full(self, tmp_path):
+        """Test the log is rotated past its size limit and read across both files."""
+        from src.data.warmup import UsageLog, View
+
+        path = tmp_path / "usage.jsonl"
+        log = UsageLog(path, max_bytes=200)
+        for view in [View("A")] * 3 + [View("B")] * 4:
+            log.record(view)
+
+        assert path.read_text().count("\n") == 3
+        assert log.rotated_path.read_text().count("\n") == 4
+        assert not (tmp_path / "usage.jsonl.1.1").exists()
+        assert log.top(1) == [View("B")]
+
+
+class TestViewsToWarm:
+    """Tests for views_to_warm function."""
+
+    def test_order(self, tmp_path):
+        """Test the default view comes first, then configured and logged views."""
+        from src.data.warmup import UsageLog, View, views_to_warm
+
+        log = UsageLog(tmp_path / "usage.jsonl")
+        for view in [View("B"), View("B"), View(), View("C")]:
+            log.record(view)
+
+        views = views_to_warm(3, [View("A"), View("B")], log)
+
+        assert views == [View(), View("A"), View("B"), View("C")]
+        assert views_to_warm(1, [View("A")], log) == [View(), View("A")]
+        assert views_to_warm(0) == [View()]
+
+
+class TestWarmUp:
+    """Tests for warm_up function."""
+
+    def test_pages_hit_cache(self, sample_df, tmp_path):
+        """Test the page queries of warmed views are served from the cache."""
+        from src.data.cache import get_query_cache
+        from src.data.dataset import get_dataset
+        from src.data.engine import PolarsEngine
+        from src.data.table import PAGE_SIZES
+        from src.data.views import (
+            detail_columns,
+            detail_stats,
+            overview_aggregates,
+            top_performers,
+        )
+        from src.data.warmup import View, date_bounds, warm_up
+
+        path = tmp_path / "data.parquet"
+        sample_df.write_parquet(path)
+        dataset = get_dataset(path)
+        engine = PolarsEngine()
+        cache = get_query_cache()
+        cache.clear()
+
+        views = [View(), View("A", preset="last_30_days")]
+        report = warm_up(engine, dataset, views)
+
+        assert report.views == 2
+        assert report.entries == len(cache) > 0
+        assert report.seconds >= 0
+
+        misses = cache.stats.misses
+        filters = views[1].filters(date_bounds(dataset))
+        aggregates = overview_aggregates(engine, dataset, filters)
+        top_performers(engine, dataset, filters)
+        detail_stats(engine, dataset, filters)
+        engine.count(dataset, filters)
+        engine.page(dataset, filters, detail_columns(dataset), 1, PAGE_SIZES[0])
+
+        assert cache.stats.misses == misses
+        assert aggregates["kpis"]["count"].item() == 15